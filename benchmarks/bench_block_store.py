@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+블록 저장소 벤치마크
+
+BlockchainStorage(SQLite)와 BlockFileStore(세그먼트 파일 + mmap)에
+긴 체인을 가져오고 조회할 때의 시간을 비교합니다.
+
+실행:
+    python benchmarks/bench_block_store.py [블록 수] [블록당 트랜잭션 수]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_codec import _chain
+from src.block_store import BlockFileStore
+from src.storage import BlockchainStorage
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    txs_per_block = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    random.seed(0)
+    chain = _chain(blocks, txs_per_block)
+    heights = [random.randrange(blocks) for _ in range(1000)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        sqlite = BlockchainStorage(os.path.join(directory, 'chain.db'))
+        file_store = BlockFileStore(os.path.join(directory, 'blocks'))
+
+        rows = [
+            ("SQLite save_block 반복",
+             _timed(lambda: [sqlite.save_block(block) for block in chain]),
+             _timed(lambda: [sqlite.get_block(h) for h in heights]),
+             _timed(sqlite.get_all_blocks)),
+            ("BlockFileStore save_blocks",
+             _timed(lambda: file_store.save_blocks(chain)),
+             _timed(lambda: [file_store.get_block(h) for h in heights]),
+             _timed(file_store.get_all_blocks)),
+        ]
+        file_store.close()
+        sqlite.close()
+
+    print(f"블록 {blocks}개 x 트랜잭션 {txs_per_block}개, 임의 조회 {len(heights)}회")
+    print(f"{'저장소':<28} {'가져오기 (s)':>12} {'임의 조회 (s)':>14} {'전체 조회 (s)':>14}")
+    print("-" * 72)
+    for name, import_time, lookup_time, scan_time in rows:
+        print(f"{name:<28} {import_time:>12.2f} {lookup_time:>14.3f} {scan_time:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+블록 템플릿 벤치마크
+
+펜딩 트랜잭션이 한꺼번에 몰렸을 때, 모든 트랜잭션을 블록 하나에 넣는
+방식(제한 없음)과 max_block_bytes/max_block_transactions 제한으로
+블록 템플릿을 만드는 방식의 블록당 채굴 시간과 블록 크기를 비교합니다.
+
+실행:
+    python benchmarks/bench_block_template.py [펜딩 수] [난이도] [채굴할 블록 수]
+"""
+
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.blockchain import DEFAULT_MAX_BLOCK_BYTES, DEFAULT_MAX_BLOCK_TRANSACTIONS, Blockchain
+from src.transaction import Transaction
+
+
+def _burst(blockchain: Blockchain, count: int) -> None:
+    random.seed(0)
+    for _ in range(count):
+        blockchain.add_transaction(
+            Transaction(f"user{random.randrange(1000)}", f"user{random.randrange(1000)}",
+                        round(random.uniform(1, 100), 2), round(random.uniform(0, 1), 4))
+        )
+
+
+def _mine_blocks(blockchain: Blockchain, blocks: int):
+    """블록당 (채굴 시간, 트랜잭션 수, JSON 크기) 리스트"""
+    rows = []
+    for _ in range(blocks):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            block = blockchain.mine_pending_transactions("Miner")
+        elapsed = time.perf_counter() - start
+        size = len(json.dumps(block.to_dict(), ensure_ascii=False).encode('utf-8'))
+        rows.append((elapsed, len(block.data), size))
+    return rows
+
+
+def main() -> None:
+    pending = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    difficulty = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    blocks = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    print(f"펜딩 {pending}개, 난이도 {difficulty}")
+    print(f"{'제한':<28} {'블록':>4} {'시간 (s)':>10} {'트랜잭션':>8} {'크기 (KB)':>10}")
+    print("-" * 64)
+    for name, max_bytes, max_txs in (
+        ("제한 없음", None, None),
+        (f"{DEFAULT_MAX_BLOCK_BYTES // 1000}KB / {DEFAULT_MAX_BLOCK_TRANSACTIONS}개",
+         DEFAULT_MAX_BLOCK_BYTES, DEFAULT_MAX_BLOCK_TRANSACTIONS),
+    ):
+        with contextlib.redirect_stdout(io.StringIO()):
+            blockchain = Blockchain(difficulty=difficulty, max_block_bytes=max_bytes,
+                                    max_block_transactions=max_txs)
+        blockchain.pending_transactions.max_size = pending + blocks
+        _burst(blockchain, pending)
+
+        # 제한이 없으면 첫 블록이 모든 트랜잭션을 가져감
+        count = 1 if max_txs is None else blocks
+        for number, (elapsed, txs, size) in enumerate(_mine_blocks(blockchain, count), 1):
+            print(f"{name:<28} {number:>4} {elapsed:>10.3f} {txs:>8} {size / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
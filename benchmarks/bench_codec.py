@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+직렬화 벤치마크
+
+체인을 JSON(16진수 문자열)과 codec 바이너리 형식으로 인코딩/디코딩할 때의
+크기와 시간을 비교합니다.
+
+실행:
+    python benchmarks/bench_codec.py [블록 수] [블록당 트랜잭션 수]
+"""
+
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.codec import decode_chain, encode_chain
+
+
+def _random_hex(size: int) -> str:
+    return os.urandom(size).hex()
+
+
+def _chain(blocks: int, txs_per_block: int):
+    """서명 필드가 채워진 트랜잭션 블록 체인 (서명 값은 임의 바이트)"""
+    start = datetime(2025, 1, 1)
+    addresses = [_random_hex(20) for _ in range(100)]
+    previous_hash = '0'
+    chain = []
+    for index in range(blocks):
+        block_hash = '0000' + _random_hex(30)
+        chain.append({
+            'index': index,
+            'timestamp': (start + timedelta(minutes=index)).isoformat(),
+            'data': [
+                {
+                    'sender': random.choice(addresses),
+                    'recipient': random.choice(addresses),
+                    'amount': round(random.uniform(0.01, 1000), 2),
+                    'timestamp': (start + timedelta(seconds=index * 60 + i)).isoformat(),
+                    'signature': _random_hex(64),
+                    'sender_public_key': _random_hex(64)
+                }
+                for i in range(txs_per_block)
+            ],
+            'previous_hash': previous_hash,
+            'nonce': random.randrange(10 ** 6),
+            'hash': block_hash
+        })
+        previous_hash = block_hash
+    return chain
+
+
+def _best_of(func, repeat: int = 3) -> float:
+    """가장 빠른 실행 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    txs_per_block = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    random.seed(0)
+    chain = _chain(blocks, txs_per_block)
+
+    json_bytes = json.dumps(chain, ensure_ascii=False).encode('utf-8')
+    binary_bytes = encode_chain(chain)
+    assert decode_chain(binary_bytes) == chain
+
+    rows = [
+        ("JSON", len(json_bytes),
+         _best_of(lambda: json.dumps(chain, ensure_ascii=False).encode('utf-8')),
+         _best_of(lambda: json.loads(json_bytes))),
+        ("바이너리", len(binary_bytes),
+         _best_of(lambda: encode_chain(chain)),
+         _best_of(lambda: decode_chain(memoryview(binary_bytes)))),
+    ]
+
+    print(f"블록 {blocks}개 x 트랜잭션 {txs_per_block}개")
+    print(f"{'형식':<10} {'크기 (바이트)':>14} {'인코딩 (ms)':>12} {'디코딩 (ms)':>12}")
+    print("-" * 52)
+    for name, size, encode_time, decode_time in rows:
+        print(f"{name:<10} {size:>14,} {encode_time * 1000:>12.1f} {decode_time * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+메모리 사용량 벤치마크
+
+블록/트랜잭션/타원 곡선 점을 기존 표현(__dict__, 16진수 문자열, ISO 시간
+문자열)과 압축 표현(__slots__, bytes, 정수)으로 만들었을 때의
+객체당 메모리를 tracemalloc으로 비교합니다.
+
+실행:
+    python benchmarks/bench_memory.py [블록 수] [블록당 트랜잭션 수]
+"""
+
+import os
+import random
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.block import Block
+from src.compact import CompactBlock, CompactTransaction
+from src.crypto_utils import ECPoint, SECP256K1_P
+from src.transaction import Transaction
+
+
+class _DictPoint:
+    """__slots__ 도입 전 ECPoint와 같은 레이아웃"""
+
+    def __init__(self, x, y, p):
+        self.x = x
+        self.y = y
+        self.p = p
+
+
+class _DictTransaction:
+    """__slots__ 도입 전 Transaction과 같은 레이아웃"""
+
+    def __init__(self, tx_data):
+        self.sender = tx_data['sender']
+        self.recipient = tx_data['recipient']
+        self.amount = tx_data['amount']
+        self.timestamp = tx_data['timestamp']
+        self.signature = tx_data.get('signature')
+        self.sender_public_key = tx_data.get('sender_public_key')
+        self._canonical = None
+        self._hash = None
+
+
+def _random_hex(size: int) -> str:
+    return os.urandom(size).hex()
+
+
+def _transaction_dicts(count: int, start: datetime):
+    """서명 필드가 채워진 트랜잭션 딕셔너리 (서명 값은 임의 바이트)"""
+    addresses = [_random_hex(20) for _ in range(100)]
+    return [
+        {
+            'sender': random.choice(addresses),
+            'recipient': random.choice(addresses),
+            'amount': round(random.uniform(0.01, 1000), 2),
+            'timestamp': (start + timedelta(microseconds=i * 137)).isoformat(),
+            'signature': _random_hex(64),
+            'sender_public_key': _random_hex(64)
+        }
+        for i in range(count)
+    ]
+
+
+def _block_dicts(blocks: int, txs_per_block: int):
+    """체인 형태의 블록 딕셔너리 리스트"""
+    start = datetime(2025, 1, 1)
+    previous_hash = '0' * 64
+    result = []
+    for index in range(blocks):
+        block_hash = '0000' + _random_hex(30)
+        result.append({
+            'index': index,
+            'timestamp': (start + timedelta(minutes=index)).isoformat(),
+            'data': _transaction_dicts(txs_per_block, start),
+            'previous_hash': previous_hash,
+            'nonce': random.randrange(10 ** 6),
+            'hash': block_hash
+        })
+        previous_hash = block_hash
+    return result
+
+
+def measure(build) -> int:
+    """build()가 만든 객체들이 차지하는 메모리 (바이트)"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del objects
+    return size
+
+
+def main() -> None:
+    blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    txs_per_block = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    total_txs = blocks * txs_per_block
+
+    random.seed(0)
+    block_data = _block_dicts(blocks, txs_per_block)
+    tx_data = [tx for block in block_data for tx in block['data']]
+    coords = [(random.randrange(SECP256K1_P), random.randrange(SECP256K1_P))
+              for _ in range(total_txs)]
+
+    # 원본 문자열은 공유되지 않도록 복사본에서 객체를 만든다
+    def copy_tx(tx):
+        return {key: (value + ' ')[:-1] if isinstance(value, str) else value
+                for key, value in tx.items()}
+
+    rows = [
+        ("트랜잭션 (dict, 체인 내부 표현)",
+         measure(lambda: [copy_tx(tx) for tx in tx_data]), total_txs),
+        ("트랜잭션 (__dict__ 객체)",
+         measure(lambda: [_DictTransaction(copy_tx(tx)) for tx in tx_data]), total_txs),
+        ("트랜잭션 (Transaction, __slots__)",
+         measure(lambda: [Transaction.from_dict(copy_tx(tx)) for tx in tx_data]), total_txs),
+        ("트랜잭션 (CompactTransaction)",
+         measure(lambda: [CompactTransaction.from_dict(tx) for tx in tx_data]), total_txs),
+        ("블록 (Block + dict 트랜잭션)",
+         measure(lambda: [Block.from_dict({**b, 'data': [copy_tx(tx) for tx in b['data']]})
+                          for b in block_data]), blocks),
+        ("블록 (CompactBlock)",
+         measure(lambda: [CompactBlock.from_dict(b) for b in block_data]), blocks),
+        ("타원 곡선 점 (__dict__)",
+         measure(lambda: [_DictPoint(x, y, SECP256K1_P) for x, y in coords]), total_txs),
+        ("타원 곡선 점 (ECPoint, __slots__)",
+         measure(lambda: [ECPoint(x, y) for x, y in coords]), total_txs),
+    ]
+
+    print(f"블록 {blocks}개 x 트랜잭션 {txs_per_block}개")
+    print("-" * 60)
+    for name, size, count in rows:
+        print(f"{name:<36} {size / count:>10,.0f} 바이트/개")
+
+
+if __name__ == "__main__":
+    main()
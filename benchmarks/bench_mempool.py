@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+멤풀 벤치마크
+
+펜딩 트랜잭션 n개 중 수수료율이 높은 k개를 고를 때, 리스트 전체를
+정렬하는 방식과 Mempool.select의 힙 선택(O(k log n)) 시간을 비교합니다.
+Mempool.add의 초당 추가 수도 측정합니다.
+
+실행:
+    python benchmarks/bench_mempool.py [펜딩 수] [선택 수]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.mempool import Mempool, transaction_size
+from src.transaction import Transaction
+
+
+def _transactions(count: int):
+    return [
+        Transaction(f"user{random.randrange(1000)}", f"user{random.randrange(1000)}",
+                    round(random.uniform(1, 100), 2), round(random.uniform(0, 1), 4))
+        for _ in range(count)
+    ]
+
+
+def _best_of(func, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    pending = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    selected = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    random.seed(0)
+    txs = _transactions(pending)
+
+    start = time.perf_counter()
+    mempool = Mempool(max_size=pending)
+    for tx in txs:
+        mempool.add(tx)
+    add_rate = pending / (time.perf_counter() - start)
+
+    sizes = {tx.txid: transaction_size(tx) for tx in txs}
+    sort_time = _best_of(
+        lambda: sorted(txs, key=lambda tx: -tx.fee / sizes[tx.txid])[:selected]
+    )
+    select_time = _best_of(lambda: mempool.select(selected))
+
+    print(f"펜딩 {pending}개 중 {selected}개 선택 (Mempool.add {add_rate:,.0f}개/초)")
+    print(f"{'방식':<28} {'시간 (ms)':>10}")
+    print("-" * 40)
+    print(f"{'리스트 전체 정렬':<28} {sort_time * 1000:>10.2f}")
+    print(f"{'Mempool.select (힙)':<28} {select_time * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+노드 시작 벤치마크
+
+제네시스 블록을 매번 채굴하던 기존 방식과 미리 계산한 nonce를 쓰는
+Blockchain() 생성 시간, 그리고 저장소에서 Blockchain.from_storage로
+체인을 복원하는 시간(검증 방식별)을 비교합니다. 전체 체인을 리스트로 두는
+경우와 최근 블록만 두는 StoredChain(window)의 복원 후 메모리도 비교합니다.
+
+실행:
+    python benchmarks/bench_startup.py [블록 수] [블록당 트랜잭션 수] [난이도]
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_codec import _chain
+from src.block import Block
+from src.blockchain import GENESIS_DATA, Blockchain
+from src.storage import BlockchainStorage
+
+
+def _linked_chain(blocks: int, txs_per_block: int):
+    """해시와 previous_hash가 실제로 연결된 체인 (난이도 0)"""
+    chain = _chain(blocks, txs_per_block)
+    previous_hash = '0'
+    for block_data in chain:
+        block_data['previous_hash'] = previous_hash
+        block_data['hash'] = Block.from_dict(block_data).calculate_hash()
+        previous_hash = block_data['hash']
+    return chain
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func()
+    return time.perf_counter() - start
+
+
+def _retained_memory(load) -> int:
+    """load()가 반환한 객체가 붙잡고 있는 메모리 (바이트)"""
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = load()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return retained
+
+
+def main() -> None:
+    blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    txs_per_block = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    difficulty = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+    print(f"난이도 {difficulty} 제네시스 블록 생성")
+    print(f"{'방식':<28} {'시간 (s)':>10}")
+    print("-" * 40)
+    print(f"{'채굴 (기존)':<28} "
+          f"{_timed(lambda: Block(0, GENESIS_DATA, '0').mine_block(difficulty)):>10.3f}")
+    print(f"{'미리 계산한 nonce':<28} "
+          f"{_timed(lambda: Blockchain(difficulty=difficulty)):>10.3f}")
+
+    random.seed(0)
+    chain = _linked_chain(blocks, txs_per_block)
+
+    with tempfile.TemporaryDirectory() as directory:
+        with BlockchainStorage(os.path.join(directory, 'chain.db')) as storage:
+            storage.save_blocks(chain)
+            rows = [
+                (verify, _timed(lambda: Blockchain.from_storage(storage, difficulty=0,
+                                                                verify=verify)))
+                for verify in ('none', 'tip', 'full')
+            ]
+            memory_rows = [
+                (f"window={window}", _retained_memory(
+                    lambda: Blockchain.from_storage(storage, difficulty=0, window=window)))
+                for window in (None, 1024)
+            ]
+
+    print()
+    print(f"블록 {blocks}개 x 트랜잭션 {txs_per_block}개 복원 (from_storage)")
+    print(f"{'verify':<28} {'시간 (s)':>10}")
+    print("-" * 40)
+    for verify, elapsed in rows:
+        print(f"{verify:<28} {elapsed:>10.3f}")
+
+    print()
+    print(f"{'체인 표현':<28} {'메모리 (MB)':>10}")
+    print("-" * 40)
+    for name, retained in memory_rows:
+        print(f"{name:<28} {retained / 1024 / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
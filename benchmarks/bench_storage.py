@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 저장소 연결 벤치마크
+
+조회마다 연결을 열고 닫던 기존 방식과 BlockchainStorage의 스레드별 연결
+재사용(WAL, PRAGMA 설정 포함)의 초당 조회 수를 비교합니다.
+블록 저장은 save_block + 트랜잭션별 save_transaction 호출과
+save_block_with_transactions의 초당 저장 트랜잭션 수를 비교합니다.
+잔액 조회는 transactions 집계(scan_balance)와 balances 테이블 조회
+(get_balance, get_balances)의 초당 조회 수를 비교합니다.
+전체 블록 순회는 fetchall로 한 번에 읽는 방식과 iter_blocks의 최대 메모리를
+비교합니다.
+
+실행:
+    python benchmarks/bench_storage.py [조회 수] [스레드 수]
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_codec import _chain
+from src.storage import BlockchainStorage
+
+
+class _PerCallStorage(BlockchainStorage):
+    """호출마다 새 연결을 여는 기존 동작 (비교용)"""
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+
+def _queries_per_second(storage: BlockchainStorage, heights, threads: int) -> float:
+    start = time.perf_counter()
+    if threads == 1:
+        for height in heights:
+            storage.get_block(height)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(storage.get_block, heights))
+    return len(heights) / (time.perf_counter() - start)
+
+
+def _per_call_save(storage: BlockchainStorage, block) -> None:
+    """블록 하나와 트랜잭션마다 개별 커밋 (기존 방식)"""
+    storage.save_block(block)
+    for tx in block['data']:
+        storage.save_transaction(tx, block_index=block['index'])
+
+
+def _writes_per_second(save, chain) -> float:
+    start = time.perf_counter()
+    for block in chain:
+        save(block)
+    return sum(len(block['data']) for block in chain) / (time.perf_counter() - start)
+
+
+def _lookups_per_second(lookup, addresses) -> float:
+    start = time.perf_counter()
+    lookup(addresses)
+    return len(addresses) / (time.perf_counter() - start)
+
+
+def _fetchall_blocks(storage: BlockchainStorage):
+    """모든 행을 fetchall로 읽어 리스트로 만드는 기존 방식"""
+    cursor = storage._get_connection().cursor()
+    cursor.execute('SELECT * FROM blocks ORDER BY block_index ASC')
+    return [storage._row_to_block_dict(row) for row in cursor.fetchall()]
+
+
+def _peak_memory(scan) -> int:
+    tracemalloc.start()
+    for _ in scan():
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    queries = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    random.seed(0)
+    chain = _chain(500, 5)
+    heights = [random.randrange(len(chain)) for _ in range(queries)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'chain.db')
+        with BlockchainStorage(path) as storage:
+            for block in chain:
+                storage.save_block(block)
+
+        rows = []
+        for name, storage in [
+            ("호출마다 연결 (기존)", _PerCallStorage(path, journal_mode='DELETE')),
+            ("스레드별 연결 + WAL", BlockchainStorage(path)),
+        ]:
+            with storage:
+                rows.append((
+                    name,
+                    _queries_per_second(storage, heights, 1),
+                    _queries_per_second(storage, heights, threads),
+                ))
+
+        write_chain = _chain(10, 500)
+        write_rows = []
+        for name, storage, save in [
+            ("개별 커밋 (기존)", _PerCallStorage(os.path.join(directory, 'a.db'),
+                                           journal_mode='DELETE', synchronous='FULL'),
+             _per_call_save),
+            ("save_block_with_transactions", BlockchainStorage(os.path.join(directory, 'b.db')),
+             BlockchainStorage.save_block_with_transactions),
+        ]:
+            with storage:
+                write_rows.append((name, _writes_per_second(lambda b: save(storage, b), write_chain)))
+
+        with BlockchainStorage(os.path.join(directory, 'b.db')) as storage:
+            addresses = [tx['recipient'] for tx in write_chain[0]['data']][:200]
+            balance_rows = [
+                ("scan_balance (SUM 집계)",
+                 _lookups_per_second(lambda a: [storage.scan_balance(x) for x in a], addresses)),
+                ("get_balance (balances 테이블)",
+                 _lookups_per_second(lambda a: [storage.get_balance(x) for x in a], addresses)),
+                ("get_balances (일괄 조회)",
+                 _lookups_per_second(storage.get_balances, addresses)),
+            ]
+
+        with BlockchainStorage(path) as storage:
+            scan_rows = [
+                ("fetchall (기존 get_all_blocks)", _peak_memory(lambda: _fetchall_blocks(storage))),
+                ("iter_blocks", _peak_memory(storage.iter_blocks)),
+            ]
+
+    print(f"블록 {len(chain)}개, get_block {queries}회")
+    print(f"{'방식':<24} {'1 스레드 (qps)':>16} {f'{threads} 스레드 (qps)':>16}")
+    print("-" * 60)
+    for name, single, multi in rows:
+        print(f"{name:<24} {single:>16,.0f} {multi:>16,.0f}")
+
+    print()
+    print(f"블록 {len(write_chain)}개 x 트랜잭션 {len(write_chain[0]['data'])}개 저장")
+    print(f"{'방식':<32} {'트랜잭션/초':>14}")
+    print("-" * 48)
+    for name, rate in write_rows:
+        print(f"{name:<32} {rate:>14,.0f}")
+
+    print()
+    print(f"트랜잭션 {sum(len(b['data']) for b in write_chain)}개 기록에서 잔액 조회 {len(addresses)}회")
+    print(f"{'방식':<32} {'조회/초':>14}")
+    print("-" * 48)
+    for name, rate in balance_rows:
+        print(f"{name:<32} {rate:>14,.0f}")
+
+    print()
+    print(f"블록 {len(chain)}개 전체 순회")
+    print(f"{'방식':<32} {'최대 메모리 (KB)':>14}")
+    print("-" * 48)
+    for name, peak in scan_rows:
+        print(f"{name:<32} {peak / 1024:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
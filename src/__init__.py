@@ -5,20 +5,34 @@
 블록체인의 핵심 컴포넌트를 제공합니다.
 """
 
-from .block import Block
+from .block import Block, MerkleBlock
 from .blockchain import Blockchain
+from .miner import ParallelMiner
+from .validator import ParallelChainValidator
 from .transaction import Transaction
+from .mempool import Mempool
+from .compact import CompactBlock, CompactTransaction
 from .wallet import Wallet
 from .storage import BlockchainStorage
+from .block_store import BlockFileStore
+from .chain_view import StoredChain
 from .node import Node
 from .visualizer import BlockchainVisualizer
 
 __all__ = [
     'Block',
+    'MerkleBlock',
     'Blockchain',
+    'ParallelMiner',
+    'ParallelChainValidator',
     'Transaction',
+    'Mempool',
+    'CompactBlock',
+    'CompactTransaction',
     'Wallet',
     'BlockchainStorage',
+    'BlockFileStore',
+    'StoredChain',
     'Node',
     'BlockchainVisualizer'
 ]
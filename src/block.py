@@ -9,7 +9,42 @@
 import hashlib
 import json
 from datetime import datetime
-from typing import Any, Dict
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple
+
+from .merkle import hash_leaf, merkle_proof, merkle_root
+
+
+def find_nonce(prefix: bytes, suffix: bytes, difficulty: int,
+               start: int, stop: Optional[int] = None) -> Optional[int]:
+    """
+    접두부/접미부 사이에 nonce를 넣어 난이도를 만족하는 nonce를 찾습니다.
+
+    접두부를 한 번만 해시 객체에 넣어두고, nonce마다 그 상태를 copy()하여
+    nonce와 접미부만 추가로 해시합니다. 블록 데이터가 커도 nonce당 비용은
+    거의 일정합니다.
+
+    Args:
+        prefix: nonce 앞부분의 직렬화 바이트
+        suffix: nonce 뒷부분의 직렬화 바이트
+        difficulty: 해시가 시작해야 하는 0의 개수
+        start: 탐색 시작 nonce (포함)
+        stop: 탐색 종료 nonce (미포함, None이면 찾을 때까지)
+
+    Returns:
+        찾은 nonce 또는 None (구간 안에 없을 때)
+    """
+    base = hashlib.sha256(prefix)
+    # 16진수 해시가 0 difficulty개로 시작 <=> 해시 값 < 16^(64 - difficulty)
+    target = 1 << (4 * (64 - difficulty))
+    nonces = count(start) if stop is None else range(start, stop)
+
+    for nonce in nonces:
+        h = base.copy()
+        h.update(b'%d' % nonce + suffix)
+        if int.from_bytes(h.digest(), 'big') < target:
+            return nonce
+    return None
 
 
 class Block:
@@ -25,6 +60,12 @@ class Block:
         hash: 현재 블록의 해시값
     """
 
+    # 인스턴스마다 __dict__를 두지 않도록 속성을 고정
+    __slots__ = ('index', 'timestamp', 'data', 'previous_hash', 'nonce', 'hash')
+
+    # 블록 형식 버전 (1: 전체 데이터를 해시)
+    version = 1
+
     def __init__(self, index: int, data: Any, previous_hash: str):
         """
         새 블록을 초기화합니다.
@@ -69,16 +110,55 @@ class Block:
 
         난이도(difficulty)만큼의 0으로 시작하는 해시를 찾을 때까지
         nonce를 증가시키며 해시를 재계산합니다.
+        nonce 외의 필드는 pow_template()으로 한 번만 직렬화합니다.
 
         Args:
             difficulty: 해시가 시작해야 하는 0의 개수
         """
         target = '0' * difficulty
-        while self.hash[:difficulty] != target:
-            self.nonce += 1
+        if self.hash[:difficulty] != target:
+            prefix, suffix = self.pow_template()
+            self.nonce = find_nonce(prefix, suffix, difficulty, self.nonce + 1)
             self.hash = self.calculate_hash()
+        self.announce_mined()
+
+    def pow_template(self) -> Tuple[bytes, bytes]:
+        """
+        calculate_hash의 직렬화 결과를 nonce 앞뒤로 나누어 반환합니다.
+
+        prefix + str(nonce) + suffix는 calculate_hash가 해시하는
+        바이트열과 정확히 같습니다.
+
+        Returns:
+            (접두부, 접미부) 바이트 튜플
+        """
+        head = json.dumps(
+            {'data': self.data, 'index': self.index},
+            sort_keys=True, ensure_ascii=False
+        )
+        tail = json.dumps(
+            {'previous_hash': self.previous_hash, 'timestamp': self.timestamp},
+            sort_keys=True, ensure_ascii=False
+        )
+        prefix = head[:-1] + ', "nonce": '
+        suffix = ', ' + tail[1:]
+        return prefix.encode('utf-8'), suffix.encode('utf-8')
+
+    def announce_mined(self) -> None:
+        """채굴 완료 메시지를 출력합니다."""
         print(f"블록 #{self.index} 채굴 완료! Nonce: {self.nonce}, Hash: {self.hash}")
 
+    def verify_body(self) -> bool:
+        """
+        블록 본문이 해시와 일치하는지 확인합니다.
+
+        버전 1 블록은 calculate_hash가 본문 전체를 포함하므로 항상 True입니다.
+
+        Returns:
+            본문이 유효하면 True
+        """
+        return True
+
     def to_dict(self) -> Dict[str, Any]:
         """
         블록을 딕셔너리로 변환합니다.
@@ -95,6 +175,35 @@ class Block:
             'hash': self.hash
         }
 
+    @classmethod
+    def from_dict(cls, block_data: Dict[str, Any]) -> 'Block':
+        """
+        딕셔너리로부터 블록을 복원합니다.
+
+        해시를 다시 계산하지 않고 저장된 값을 그대로 사용하므로,
+        복원된 블록의 무결성은 별도로 검증해야 합니다.
+        version 키에 따라 알맞은 블록 클래스(Block/MerkleBlock)를 사용합니다.
+
+        Args:
+            block_data: to_dict() 형식의 딕셔너리
+
+        Returns:
+            복원된 블록
+        """
+        version = block_data.get('version', Block.version)
+        block_class = MerkleBlock if version == MerkleBlock.version else Block
+
+        block = block_class.__new__(block_class)
+        block.index = block_data['index']
+        block.timestamp = block_data['timestamp']
+        block.data = block_data['data']
+        block.previous_hash = block_data['previous_hash']
+        block.nonce = block_data['nonce']
+        block.hash = block_data['hash']
+        if block_class is MerkleBlock:
+            block.merkle_root = block_data['merkle_root']
+        return block
+
     def __str__(self) -> str:
         """블록의 문자열 표현을 반환합니다."""
         return (
@@ -108,3 +217,136 @@ class Block:
 
     def __repr__(self) -> str:
         return f"Block(index={self.index}, hash={self.hash[:8]}...)"
+
+
+class MerkleBlock(Block):
+    """
+    헤더/본문이 분리된 버전 2 블록
+
+    헤더에는 트랜잭션 리스트의 머클 루트만 담기며, 작업 증명은 고정 크기의
+    헤더만 해시합니다. 개별 트랜잭션은 get_merkle_proof()의 포함 증명과
+    헤더의 merkle_root로 블록 전체 없이 검증할 수 있습니다.
+
+    Attributes:
+        merkle_root: data(트랜잭션 리스트)의 머클 루트
+    """
+
+    __slots__ = ('merkle_root',)
+
+    version = 2
+
+    def __init__(self, index: int, data: Any, previous_hash: str):
+        """
+        새 블록을 초기화합니다.
+
+        Args:
+            index: 블록 번호
+            data: 저장할 데이터 (리스트면 각 원소가 머클 트리의 리프)
+            previous_hash: 이전 블록의 해시
+        """
+        self.merkle_root = self.compute_merkle_root(data)
+        super().__init__(index, data, previous_hash)
+
+    @staticmethod
+    def leaf_hashes(data: Any) -> List[str]:
+        """
+        데이터의 머클 리프 해시 목록을 반환합니다.
+
+        Args:
+            data: 블록 데이터 (리스트가 아니면 단일 리프)
+
+        Returns:
+            리프 해시 리스트
+        """
+        items = data if isinstance(data, list) else [data]
+        return [hash_leaf(item) for item in items]
+
+    @classmethod
+    def compute_merkle_root(cls, data: Any) -> str:
+        """데이터의 머클 루트를 계산합니다."""
+        return merkle_root(cls.leaf_hashes(data))
+
+    def header(self) -> Dict[str, Any]:
+        """
+        작업 증명 대상인 블록 헤더를 반환합니다.
+
+        Returns:
+            헤더 딕셔너리
+        """
+        return {
+            'version': self.version,
+            'index': self.index,
+            'timestamp': self.timestamp,
+            'previous_hash': self.previous_hash,
+            'merkle_root': self.merkle_root,
+            'nonce': self.nonce
+        }
+
+    def calculate_hash(self) -> str:
+        """
+        블록 헤더의 SHA-256 해시를 계산합니다.
+
+        본문(data)은 merkle_root를 통해서만 해시에 반영되므로
+        트랜잭션 수와 무관하게 비용이 일정합니다.
+
+        Returns:
+            블록의 SHA-256 해시값 (16진수 문자열)
+        """
+        header_string = json.dumps(self.header(), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(header_string.encode('utf-8')).hexdigest()
+
+    def pow_template(self) -> Tuple[bytes, bytes]:
+        """
+        헤더 직렬화 결과를 nonce 앞뒤로 나누어 반환합니다.
+
+        Returns:
+            (접두부, 접미부) 바이트 튜플
+        """
+        head = json.dumps(
+            {'index': self.index, 'merkle_root': self.merkle_root},
+            sort_keys=True, ensure_ascii=False
+        )
+        tail = json.dumps(
+            {'previous_hash': self.previous_hash, 'timestamp': self.timestamp,
+             'version': self.version},
+            sort_keys=True, ensure_ascii=False
+        )
+        prefix = head[:-1] + ', "nonce": '
+        suffix = ', ' + tail[1:]
+        return prefix.encode('utf-8'), suffix.encode('utf-8')
+
+    def verify_body(self) -> bool:
+        """
+        본문(data)이 헤더의 merkle_root와 일치하는지 확인합니다.
+
+        Returns:
+            본문이 유효하면 True
+        """
+        return self.compute_merkle_root(self.data) == self.merkle_root
+
+    def get_merkle_proof(self, tx_index: int) -> List[Tuple[str, str]]:
+        """
+        tx_index 번째 트랜잭션의 포함 증명을 반환합니다.
+
+        Args:
+            tx_index: 트랜잭션 위치
+
+        Returns:
+            (방향, 형제 해시) 리스트 (merkle.verify_merkle_proof로 검증)
+        """
+        return merkle_proof(self.leaf_hashes(self.data), tx_index)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        블록을 딕셔너리로 변환합니다.
+
+        Returns:
+            버전 1 필드에 version, merkle_root를 더한 딕셔너리
+        """
+        result = super().to_dict()
+        result['version'] = self.version
+        result['merkle_root'] = self.merkle_root
+        return result
+
+    def __repr__(self) -> str:
+        return f"MerkleBlock(index={self.index}, hash={self.hash[:8]}...)"
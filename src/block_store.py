@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+"""
+블록 파일 저장소 모듈
+
+블록을 codec 바이너리 형식으로 세그먼트 파일 끝에 덧붙여 저장하고,
+높이/해시별 오프셋 인덱스로 조회합니다. 읽기는 mmap 위의 memoryview에서
+바로 디코딩하므로 파일 내용을 복사하지 않습니다.
+
+BlockchainStorage와 같은 블록 조회 메서드(get_block, get_block_by_hash,
+get_latest_block, get_all_blocks, iter_blocks, get_block_count)를 제공하므로 대량
+가져오기 등에서 저장소를 바꿔 사용할 수 있습니다.
+
+디렉터리 구성:
+    blk00000.dat ...  세그먼트 파일: ([레코드 길이 u32][encode_block 결과]) 반복
+    index.dat         인덱스 로그: [높이 u64][세그먼트 u32][오프셋 u64][길이 u32]
+                      [해시 종류 u8][해시 길이 u8][해시] 반복
+"""
+
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .codec import decode_block, encode_block
+from .compact import pack_hex
+
+
+# 세그먼트 파일 하나의 기본 최대 크기 (바이트)
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+_SEGMENT_NAME = 'blk{:05d}.dat'
+_INDEX_NAME = 'index.dat'
+
+_RECORD_HEADER = struct.Struct('>I')
+_INDEX_ENTRY = struct.Struct('>QIQIBB')
+
+# 인덱스의 해시 종류 (원시 바이트 / UTF-8 문자열)
+_KEY_RAW = 0
+_KEY_TEXT = 1
+
+# (세그먼트 번호, 레코드 본문 오프셋, 본문 길이)
+_Location = Tuple[int, int, int]
+_HashKey = Union[bytes, str]
+
+
+class BlockFileStore:
+    """
+    추가 전용 세그먼트 파일 기반 블록 저장소
+
+    같은 높이의 블록을 다시 저장하면 새 레코드를 덧붙이고 인덱스만
+    새 위치를 가리키도록 갱신합니다 (BlockchainStorage의 INSERT OR REPLACE와
+    같은 동작). 인덱스는 열 때 index.dat를 읽어 메모리에 올리며,
+    인덱스에 기록되지 못한 마지막 세그먼트의 레코드는 다시 스캔하여 복구합니다.
+
+    Attributes:
+        directory: 세그먼트/인덱스 파일 디렉터리
+        segment_size: 세그먼트 파일 최대 크기
+        fsync: 쓰기마다 os.fsync 호출 여부
+    """
+
+    def __init__(self, directory: str, segment_size: int = DEFAULT_SEGMENT_SIZE,
+                 fsync: bool = False):
+        """
+        저장소 초기화
+
+        Args:
+            directory: 파일을 저장할 디렉터리 (없으면 생성)
+            segment_size: 세그먼트 파일 최대 크기 (바이트)
+            fsync: True면 쓰기마다 디스크에 동기화
+
+        Raises:
+            ValueError: segment_size가 0 이하일 때
+        """
+        if segment_size <= 0:
+            raise ValueError("segment_size는 0보다 커야 합니다.")
+
+        self.directory = directory
+        self.segment_size = segment_size
+        self.fsync = fsync
+
+        self._by_height: Dict[int, _Location] = {}
+        self._height_key: Dict[int, _HashKey] = {}
+        self._by_hash: Dict[_HashKey, int] = {}
+        self._maps: Dict[int, mmap.mmap] = {}
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+        self._segment = max(self._segment_numbers(), default=0)
+        self._segment_file = open(self._segment_path(self._segment), 'ab')
+        self._index_file = open(os.path.join(directory, _INDEX_NAME), 'ab')
+        self._recover_tail()
+
+    # ------------------------------------------------------------------
+    # 파일/인덱스 관리
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, _SEGMENT_NAME.format(segment))
+
+    def _segment_numbers(self) -> List[int]:
+        """디렉터리에 있는 세그먼트 번호 목록"""
+        numbers = []
+        for name in os.listdir(self.directory):
+            if name.startswith('blk') and name.endswith('.dat'):
+                try:
+                    numbers.append(int(name[3:-4]))
+                except ValueError:
+                    continue
+        return sorted(numbers)
+
+    def _index(self, height: int, location: _Location, key: _HashKey) -> None:
+        """메모리 인덱스 갱신 (같은 높이의 이전 해시는 제거)"""
+        old_key = self._height_key.get(height)
+        if old_key is not None and self._by_hash.get(old_key) == height:
+            del self._by_hash[old_key]
+        self._by_height[height] = location
+        self._height_key[height] = key
+        self._by_hash[key] = height
+
+    @staticmethod
+    def _encode_index_entry(height: int, location: _Location, key: _HashKey) -> bytes:
+        if isinstance(key, bytes):
+            kind, raw = _KEY_RAW, key
+        else:
+            kind, raw = _KEY_TEXT, key.encode('utf-8')
+        if len(raw) > 0xFF:
+            raise ValueError("블록 해시가 너무 깁니다.")
+        segment, offset, length = location
+        return _INDEX_ENTRY.pack(height, segment, offset, length, kind, len(raw)) + raw
+
+    def _load_index(self) -> None:
+        """index.dat를 읽어 메모리 인덱스 구성 (잘린 마지막 항목은 무시)"""
+        path = os.path.join(self.directory, _INDEX_NAME)
+        if not os.path.exists(path):
+            return
+
+        with open(path, 'rb') as f:
+            content = f.read()
+
+        offset = 0
+        valid_end = 0
+        while offset + _INDEX_ENTRY.size <= len(content):
+            height, segment, record_offset, length, kind, key_size = \
+                _INDEX_ENTRY.unpack_from(content, offset)
+            key_start = offset + _INDEX_ENTRY.size
+            key_end = key_start + key_size
+            if key_end > len(content):
+                break
+            raw = content[key_start:key_end]
+            key = raw if kind == _KEY_RAW else raw.decode('utf-8')
+            self._index(height, (segment, record_offset, length), key)
+            offset = valid_end = key_end
+
+        if valid_end != len(content):
+            with open(path, 'r+b') as f:
+                f.truncate(valid_end)
+
+    def _recover_tail(self) -> None:
+        """인덱스에 없는 마지막 세그먼트의 레코드를 스캔하여 인덱스에 추가"""
+        indexed_end = max(
+            (offset + length for segment, offset, length in self._by_height.values()
+             if segment == self._segment),
+            default=0
+        )
+        path = self._segment_path(self._segment)
+        size = os.path.getsize(path)
+        if indexed_end >= size:
+            return
+
+        with open(path, 'rb') as f:
+            f.seek(indexed_end)
+            tail = f.read()
+
+        position = 0
+        recovered = []
+        while position + _RECORD_HEADER.size <= len(tail):
+            length, = _RECORD_HEADER.unpack_from(tail, position)
+            start = position + _RECORD_HEADER.size
+            if start + length > len(tail):
+                break
+            try:
+                block_data = decode_block(memoryview(tail)[start:start + length])
+            except ValueError:
+                break
+            recovered.append((block_data, (self._segment, indexed_end + start, length)))
+            position = start + length
+
+        # 완전하지 않은 마지막 레코드는 잘라냄
+        if indexed_end + position != size:
+            self._segment_file.close()
+            with open(path, 'r+b') as f:
+                f.truncate(indexed_end + position)
+            self._segment_file = open(path, 'ab')
+
+        entries = bytearray()
+        for block_data, location in recovered:
+            key = pack_hex(block_data['hash'])
+            self._index(block_data['index'], location, key)
+            entries += self._encode_index_entry(block_data['index'], location, key)
+        self._index_file.write(entries)
+        self._index_file.flush()
+
+    def _map(self, segment: int, end: int) -> mmap.mmap:
+        """세그먼트의 mmap 반환 (end까지 포함하지 않으면 다시 매핑)"""
+        mapped = self._maps.get(segment)
+        if mapped is None or len(mapped) < end:
+            if mapped is not None:
+                mapped.close()
+            if segment == self._segment:
+                self._segment_file.flush()
+            with open(self._segment_path(segment), 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapped
+        return mapped
+
+    def _read(self, location: _Location) -> Dict[str, Any]:
+        """위치의 블록을 mmap에서 복사 없이 디코딩"""
+        segment, offset, length = location
+        mapped = self._map(segment, offset + length)
+        with memoryview(mapped) as view:
+            with view[offset:offset + length] as record:
+                return decode_block(record)
+
+    def _sync(self) -> None:
+        self._segment_file.flush()
+        self._index_file.flush()
+        if self.fsync:
+            os.fsync(self._segment_file.fileno())
+            os.fsync(self._index_file.fileno())
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+
+    def _append(self, block_data: Dict[str, Any], index_entries: bytearray) -> int:
+        """블록 레코드를 세그먼트에 덧붙이고 인덱스 항목을 모음"""
+        body = encode_block(block_data)
+        record_size = _RECORD_HEADER.size + len(body)
+
+        position = self._segment_file.tell()
+        if position > 0 and position + record_size > self.segment_size:
+            self._segment_file.close()
+            self._segment += 1
+            self._segment_file = open(self._segment_path(self._segment), 'ab')
+            position = 0
+
+        self._segment_file.write(_RECORD_HEADER.pack(len(body)))
+        self._segment_file.write(body)
+
+        height = block_data['index']
+        location = (self._segment, position + _RECORD_HEADER.size, len(body))
+        key = pack_hex(block_data['hash'])
+        self._index(height, location, key)
+        index_entries += self._encode_index_entry(height, location, key)
+        return height
+
+    def save_block(self, block_data: Dict[str, Any]) -> int:
+        """
+        블록 저장
+
+        Args:
+            block_data: 블록 딕셔너리 (Block.to_dict() 형식)
+
+        Returns:
+            저장된 블록의 높이
+        """
+        entries = bytearray()
+        height = self._append(block_data, entries)
+        self._index_file.write(entries)
+        self._sync()
+        return height
+
+    def save_blocks(self, blocks: Iterable[Dict[str, Any]]) -> int:
+        """
+        여러 블록을 한 번에 저장 (대량 가져오기용)
+
+        파일 플러시와 인덱스 기록을 마지막에 한 번만 수행합니다.
+
+        Args:
+            blocks: 블록 딕셔너리들
+
+        Returns:
+            저장된 블록 수
+        """
+        entries = bytearray()
+        count = 0
+        for block_data in blocks:
+            self._append(block_data, entries)
+            count += 1
+        self._index_file.write(entries)
+        self._sync()
+        return count
+
+    # ------------------------------------------------------------------
+    # 조회 (BlockchainStorage와 같은 인터페이스)
+    # ------------------------------------------------------------------
+
+    def get_block(self, block_index: int) -> Optional[Dict[str, Any]]:
+        """
+        인덱스로 블록 조회
+
+        Args:
+            block_index: 블록 인덱스
+
+        Returns:
+            블록 딕셔너리 또는 None
+        """
+        location = self._by_height.get(block_index)
+        if location is None:
+            return None
+        return self._read(location)
+
+    def get_block_by_hash(self, block_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        해시로 블록 조회
+
+        Args:
+            block_hash: 블록 해시
+
+        Returns:
+            블록 딕셔너리 또는 None
+        """
+        height = self._by_hash.get(pack_hex(block_hash))
+        if height is None:
+            return None
+        return self.get_block(height)
+
+    def get_all_blocks(self) -> List[Dict[str, Any]]:
+        """
+        모든 블록 조회 (인덱스 순)
+
+        Returns:
+            블록 딕셔너리 리스트
+        """
+        return list(self.iter_blocks())
+
+    def iter_blocks(self, start: int = 0, end: Optional[int] = None,
+                    batch_size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        블록을 인덱스 순으로 하나씩 반환하는 제너레이터
+
+        Args:
+            start: 시작 블록 인덱스 (포함)
+            end: 끝 블록 인덱스 (제외, None이면 마지막 블록까지)
+            batch_size: BlockchainStorage와의 호환용 (mmap에서 바로 읽으므로 사용하지 않음)
+
+        Yields:
+            블록 딕셔너리
+        """
+        for height in sorted(self._by_height):
+            if end is not None and height >= end:
+                return
+            location = self._by_height.get(height)
+            if height >= start and location is not None:
+                yield self._read(location)
+
+    def get_latest_block(self) -> Optional[Dict[str, Any]]:
+        """
+        최신 블록 조회
+
+        Returns:
+            최신 블록 딕셔너리 또는 None
+        """
+        if not self._by_height:
+            return None
+        return self.get_block(max(self._by_height))
+
+    def get_block_count(self) -> int:
+        """
+        저장된 블록 수 조회
+
+        Returns:
+            블록 수
+        """
+        return len(self._by_height)
+
+    def clear_all(self) -> None:
+        """모든 블록 삭제 (주의!)"""
+        self._close_files()
+        for segment in self._segment_numbers():
+            os.remove(self._segment_path(segment))
+        os.remove(os.path.join(self.directory, _INDEX_NAME))
+
+        self._by_height.clear()
+        self._height_key.clear()
+        self._by_hash.clear()
+        self._segment = 0
+        self._segment_file = open(self._segment_path(0), 'ab')
+        self._index_file = open(os.path.join(self.directory, _INDEX_NAME), 'ab')
+
+    def _close_files(self) -> None:
+        for mapped in self._maps.values():
+            mapped.close()
+        self._maps.clear()
+        self._segment_file.close()
+        self._index_file.close()
+
+    def close(self) -> None:
+        """파일과 mmap 닫기"""
+        if self._segment_file.closed:
+            return
+        self._sync()
+        self._close_files()
+
+    def __enter__(self) -> 'BlockFileStore':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._by_height)
+
+    def __repr__(self) -> str:
+        return f"BlockFileStore(directory={self.directory!r}, blocks={len(self)})"
@@ -6,52 +6,328 @@
 제네시스 블록 생성, 블록 추가, 작업 증명, 체인 검증 기능을 제공합니다.
 """
 
-from typing import Any, List, Optional
-from .block import Block
+import json
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from .block import Block, MerkleBlock, find_nonce
+from .chain_view import StoredChain
+from .mempool import Mempool, transaction_size
 from .transaction import Transaction
 
+if TYPE_CHECKING:
+    from .miner import ParallelMiner
+    from .storage import BlockchainStorage
+    from .validator import ParallelChainValidator, ValidationResult
+
+
+# 블록 형식 버전별 블록 클래스
+BLOCK_CLASSES = {
+    Block.version: Block,
+    MerkleBlock.version: MerkleBlock,
+}
+
+# 제네시스 블록 내용 (모든 노드에서 같은 블록이 되도록 고정)
+GENESIS_DATA = "Genesis Block - 블록체인의 시작"
+GENESIS_TIMESTAMP = "2025-01-01T00:00:00"
+
+# (블록 버전, 난이도)별로 미리 찾아 둔 제네시스 블록 nonce
+GENESIS_NONCES = {
+    (1, 0): 0, (1, 1): 35, (1, 2): 470, (1, 3): 1330,
+    (1, 4): 100672, (1, 5): 2682785, (1, 6): 6557806,
+    (2, 0): 0, (2, 1): 11, (2, 2): 11, (2, 3): 11,
+    (2, 4): 18324, (2, 5): 1106602, (2, 6): 19348614,
+}
+
+# from_storage의 검증 방식
+VERIFY_MODES = ('tip', 'full', 'none')
+
+# 블록 하나의 기본 최대 크기 (to_dict()의 JSON 바이트 수)와 최대 트랜잭션 수
+DEFAULT_MAX_BLOCK_BYTES = 1_000_000
+DEFAULT_MAX_BLOCK_TRANSACTIONS = 5000
+
+# 블록 크기를 추정할 때 쓰는 가장 긴 timestamp와 nonce
+_SIZE_PROBE_TIMESTAMP = "0000-00-00T00:00:00.000000"
+_SIZE_PROBE_NONCE = 10 ** 19
+
+
+class BlockTemplate:
+    """
+    채굴할 블록의 내용 (Blockchain.build_block_template이 생성)
+
+    Attributes:
+        transactions: 블록에 넣을 트랜잭션 (수수료율 높은 순)
+        data: 블록 data로 쓸 트랜잭션 딕셔너리 리스트
+        size: 채굴 후 블록 to_dict()의 최대 JSON 바이트 수
+        fees: 포함된 트랜잭션의 수수료 합계
+    """
+
+    __slots__ = ('transactions', 'data', 'size', 'fees')
+
+    def __init__(self, transactions: List[Transaction], size: int):
+        self.transactions = transactions
+        self.data = [tx.to_dict() for tx in transactions]
+        self.size = size
+        self.fees = sum(tx.fee for tx in transactions)
+
+    def __len__(self) -> int:
+        return len(self.transactions)
+
+    def __repr__(self) -> str:
+        return f"BlockTemplate(transactions={len(self.transactions)}, size={self.size})"
+
 
 class Blockchain:
     """
     블록체인을 관리하는 클래스
 
     Attributes:
-        chain: 블록들의 리스트 (블록체인)
+        chain: 블록들의 리스트 (블록체인). from_storage에 window를 주면 최근 블록만
+            메모리에 두는 StoredChain
         difficulty: 채굴 난이도 (해시 앞에 붙어야 하는 0의 개수)
-        pending_transactions: 아직 블록에 포함되지 않은 대기 중인 트랜잭션들
+        pending_transactions: 아직 블록에 포함되지 않은 대기 중인 트랜잭션들 (Mempool)
         mining_reward: 채굴 보상
+        miner: 블록 채굴에 사용할 채굴기 (None이면 Block.mine_block 사용)
+        block_version: 생성할 블록 형식 (1: Block, 2: MerkleBlock)
+        balances: 주소별 잔액 인덱스 (블록이 추가될 때마다 갱신)
+        max_block_bytes: 블록 하나의 최대 크기 (to_dict()의 JSON 바이트 수, None이면 제한 없음)
+        max_block_transactions: 블록 하나의 최대 트랜잭션 수 (None이면 제한 없음)
     """
 
-    def __init__(self, difficulty: int = 4):
+    def __init__(self, difficulty: int = 4, miner: Optional['ParallelMiner'] = None,
+                 block_version: int = Block.version,
+                 max_block_bytes: Optional[int] = DEFAULT_MAX_BLOCK_BYTES,
+                 max_block_transactions: Optional[int] = DEFAULT_MAX_BLOCK_TRANSACTIONS):
         """
         블록체인을 초기화하고 제네시스 블록을 생성합니다.
 
         Args:
             difficulty: 채굴 난이도 (기본값: 4)
+            miner: 채굴기 (예: ParallelMiner). None이면 직렬 채굴
+            block_version: 블록 형식 버전 (기본값: 1)
+            max_block_bytes: 블록 하나의 최대 JSON 바이트 수 (None이면 제한 없음)
+            max_block_transactions: 블록 하나의 최대 트랜잭션 수 (None이면 제한 없음)
+
+        Raises:
+            ValueError: 지원하지 않는 블록 버전이거나 블록 제한이 0 이하일 때
         """
+        self._init_state(difficulty, miner, block_version)
+        self.set_block_limits(max_block_bytes, max_block_transactions)
+
+        # 제네시스 블록 생성
+        self._create_genesis_block()
+
+    def _init_state(self, difficulty: int, miner: Optional['ParallelMiner'],
+                    block_version: int) -> None:
+        """제네시스 블록 없이 빈 체인 상태를 초기화합니다."""
+        if block_version not in BLOCK_CLASSES:
+            raise ValueError(f"지원하지 않는 블록 버전입니다: {block_version}")
+
         self.chain: List[Block] = []
         self.difficulty = difficulty
-        self.pending_transactions: List[Transaction] = []
+        self.miner = miner
+        self.block_version = block_version
+        self.pending_transactions = Mempool()
         self.mining_reward = 100  # 채굴 보상
+        self.balances: Dict[str, float] = {}
+        self.max_block_bytes: Optional[int] = DEFAULT_MAX_BLOCK_BYTES
+        self.max_block_transactions: Optional[int] = DEFAULT_MAX_BLOCK_TRANSACTIONS
 
-        # 제네시스 블록 생성
-        self._create_genesis_block()
+        # 검증 완료 지점 (이 인덱스까지는 이미 검증됨)
+        self._verified_index: Optional[int] = None
+        self._verified_hash: Optional[str] = None
+
+    def set_block_limits(self, max_block_bytes: Optional[int] = DEFAULT_MAX_BLOCK_BYTES,
+                         max_block_transactions: Optional[int] = DEFAULT_MAX_BLOCK_TRANSACTIONS
+                         ) -> None:
+        """
+        블록 하나에 담을 수 있는 크기와 트랜잭션 수를 설정합니다.
+
+        Args:
+            max_block_bytes: 블록 to_dict()의 최대 JSON 바이트 수 (None이면 제한 없음)
+            max_block_transactions: 최대 트랜잭션 수 (None이면 제한 없음)
+
+        Raises:
+            ValueError: 제한이 0 이하일 때
+        """
+        if max_block_bytes is not None and max_block_bytes <= 0:
+            raise ValueError("max_block_bytes는 0보다 커야 합니다.")
+        if max_block_transactions is not None and max_block_transactions <= 0:
+            raise ValueError("max_block_transactions는 0보다 커야 합니다.")
+
+        self.max_block_bytes = max_block_bytes
+        self.max_block_transactions = max_block_transactions
 
     def _create_genesis_block(self) -> None:
         """
         제네시스 블록(첫 번째 블록)을 생성합니다.
 
         제네시스 블록은 이전 블록이 없으므로 previous_hash가 "0"입니다.
+        내용과 timestamp가 고정되어 있어 블록 버전과 난이도가 같으면 항상 같은
+        블록이 되며, GENESIS_NONCES에 있는 조합은 채굴 없이 바로 만듭니다.
         """
-        genesis_block = Block(
+        genesis_block = self._new_block(
             index=0,
-            data="Genesis Block - 블록체인의 시작",
+            data=GENESIS_DATA,
             previous_hash="0"
         )
-        genesis_block.mine_block(self.difficulty)
-        self.chain.append(genesis_block)
+        genesis_block.timestamp = GENESIS_TIMESTAMP
+
+        key = (self.block_version, self.difficulty)
+        nonce = GENESIS_NONCES.get(key)
+        if nonce is None:
+            prefix, suffix = genesis_block.pow_template()
+            nonce = find_nonce(prefix, suffix, self.difficulty, 0)
+            # 같은 프로세스에서 다시 만들 때는 채굴하지 않도록 기록
+            GENESIS_NONCES[key] = nonce
+        genesis_block.nonce = nonce
+        genesis_block.hash = genesis_block.calculate_hash()
+
+        self._append_block(genesis_block)
         print("제네시스 블록이 생성되었습니다!\n")
 
+    @classmethod
+    def from_storage(cls, storage: 'BlockchainStorage', difficulty: int = 4,
+                     verify: str = 'tip', miner: Optional['ParallelMiner'] = None,
+                     block_version: Optional[int] = None, window: Optional[int] = None,
+                     cache_size: int = 1024) -> 'Blockchain':
+        """
+        저장소에 저장된 체인으로 블록체인을 복원합니다.
+
+        블록은 storage.iter_blocks()로 한 페이지씩 읽으면서 Block으로 바꾸고
+        잔액 인덱스도 함께 갱신하므로, 블록 딕셔너리 전체를 한 번에 메모리에
+        올리지 않습니다. 펜딩 트랜잭션도 함께 복원합니다.
+        저장된 블록이 없으면 제네시스 블록만 있는 새 체인을 반환합니다.
+
+        window를 주면 chain은 최근 블록 window개만 메모리에 두는 StoredChain이
+        되며, 이후 추가되는 블록은 바로 저장소에 기록됩니다.
+
+        검증 방식:
+            'tip': 모든 블록의 previous_hash 연결과, 마지막 블록의 해시/본문/
+                   작업 증명만 확인합니다. 저장소를 신뢰하는 빠른 재시작용입니다.
+            'full': is_chain_valid(full=True)로 모든 블록을 다시 검증합니다.
+            'none': 검증하지 않습니다.
+
+        'tip', 'full' 검증을 통과하면 마지막 블록이 검증 지점이 되어 이후
+        is_chain_valid()는 새로 추가된 블록만 검증합니다.
+
+        Args:
+            storage: 블록을 읽을 저장소 (BlockchainStorage 또는 BlockFileStore)
+            difficulty: 채굴 난이도 (기본값: 4)
+            verify: 검증 방식 ('tip', 'full', 'none')
+            miner: 채굴기
+            block_version: 새로 만들 블록 형식 (None이면 마지막 블록의 형식)
+            window: 메모리에 유지할 최근 블록 수 (None이면 전체를 리스트로 유지)
+            cache_size: window 밖 블록의 LRU 캐시 크기
+
+        Returns:
+            복원된 블록체인
+
+        Raises:
+            ValueError: 지원하지 않는 검증 방식이거나 저장된 체인이 유효하지 않을 때
+        """
+        if verify not in VERIFY_MODES:
+            raise ValueError(f"지원하지 않는 검증 방식입니다: {verify}")
+
+        if block_version is None:
+            latest = storage.get_latest_block()
+            block_version = latest.get('version', Block.version) if latest else Block.version
+
+        blockchain = cls.__new__(cls)
+        blockchain._init_state(difficulty, miner, block_version)
+        if window is not None:
+            blockchain.chain = StoredChain(storage, window=window, cache_size=cache_size)
+
+        previous_hash = None
+        for block_data in storage.iter_blocks():
+            block = Block.from_dict(block_data)
+            if (verify == 'tip' and previous_hash is not None
+                    and block.previous_hash != previous_hash):
+                raise ValueError(
+                    f"블록 #{block.index}의 previous_hash가 이전 블록의 해시와 일치하지 않습니다."
+                )
+            previous_hash = block.hash
+            if window is not None:
+                # 이미 저장된 블록이므로 다시 기록하지 않음
+                blockchain.chain.load(block)
+                blockchain._apply_block_to_balances(block, blockchain.balances)
+            else:
+                blockchain._append_block(block)
+
+        if not blockchain.chain:
+            blockchain._create_genesis_block()
+            return blockchain
+
+        if verify == 'tip':
+            tip = blockchain.chain[-1]
+            if (tip.hash != tip.calculate_hash() or not tip.verify_body()
+                    or (tip.index > 0 and tip.hash[:difficulty] != '0' * difficulty)):
+                raise ValueError(f"마지막 블록 #{tip.index}이(가) 유효하지 않습니다.")
+            blockchain._verified_index = len(blockchain.chain) - 1
+            blockchain._verified_hash = tip.hash
+        elif verify == 'full':
+            if not blockchain.is_chain_valid(full=True):
+                raise ValueError("저장된 블록체인이 유효하지 않습니다.")
+
+        # BlockFileStore는 블록만 저장하므로 펜딩 트랜잭션이 없음
+        if hasattr(storage, 'get_pending_transactions'):
+            for tx_data in storage.get_pending_transactions():
+                tx = Transaction.from_dict(tx_data)
+                # 채굴 보상은 멤풀이 가득 차도 제거되지 않도록 고정
+                blockchain.pending_transactions.add(tx, pinned=tx.sender == "SYSTEM")
+
+        return blockchain
+
+    def _new_block(self, index: int, data: Any, previous_hash: str) -> Block:
+        """체인의 블록 형식에 맞는 블록을 생성합니다."""
+        return BLOCK_CLASSES[self.block_version](index, data, previous_hash)
+
+    def _mine(self, block: Block) -> None:
+        """
+        설정된 채굴기로 블록을 채굴합니다.
+
+        Args:
+            block: 채굴할 블록
+        """
+        if self.miner is None:
+            block.mine_block(self.difficulty)
+        else:
+            self.miner.mine(block, self.difficulty)
+
+    def _append_block(self, block: Block) -> None:
+        """
+        블록을 체인에 추가하고 잔액 인덱스를 갱신합니다.
+
+        Args:
+            block: 추가할 블록 (채굴 완료된 상태)
+        """
+        self.chain.append(block)
+        self._apply_block_to_balances(block, self.balances)
+
+    @staticmethod
+    def _apply_block_to_balances(block: Block, balances: Dict[str, float]) -> None:
+        """
+        블록의 트랜잭션을 잔액 인덱스에 반영합니다.
+
+        발신자는 금액과 수수료를 함께 부담합니다. 수수료는 채굴 보상
+        트랜잭션을 통해 채굴자에게 지급됩니다.
+
+        Args:
+            block: 반영할 블록
+            balances: 갱신할 잔액 딕셔너리
+        """
+        # 제네시스 블록이나 일반 데이터 블록은 건너뛰기
+        if not isinstance(block.data, list):
+            return
+
+        for tx_data in block.data:
+            if isinstance(tx_data, dict):
+                sender = tx_data.get('sender')
+                recipient = tx_data.get('recipient')
+                amount = tx_data.get('amount', 0)
+                if sender is not None:
+                    balances[sender] = balances.get(sender, 0.0) - amount - tx_data.get('fee', 0)
+                if recipient is not None:
+                    balances[recipient] = balances.get(recipient, 0.0) + amount
+
     def get_latest_block(self) -> Block:
         """
         체인의 마지막 블록을 반환합니다.
@@ -71,25 +347,63 @@ class Blockchain:
         Returns:
             새로 추가된 블록
         """
-        new_block = Block(
+        new_block = self._new_block(
             index=len(self.chain),
             data=data,
             previous_hash=self.get_latest_block().hash
         )
-        new_block.mine_block(self.difficulty)
-        self.chain.append(new_block)
+        self._mine(new_block)
+        self._append_block(new_block)
         print(f"블록 #{new_block.index}이(가) 체인에 추가되었습니다!\n")
         return new_block
 
+    def _block_overhead(self) -> int:
+        """
+        트랜잭션 data를 뺀 다음 블록의 최대 JSON 바이트 수
+
+        timestamp와 nonce는 채굴 후 가장 길어질 수 있는 값으로 계산합니다.
+        """
+        probe = self._new_block(len(self.chain), [], self.get_latest_block().hash)
+        probe.timestamp = _SIZE_PROBE_TIMESTAMP
+        probe.nonce = _SIZE_PROBE_NONCE
+        size = len(json.dumps(probe.to_dict(), ensure_ascii=False).encode('utf-8'))
+        # 빈 data "[]"는 트랜잭션 리스트 크기에 포함되므로 뺌
+        return size - 2
+
+    def build_block_template(self) -> BlockTemplate:
+        """
+        다음 블록에 넣을 트랜잭션을 고릅니다 (멤풀은 바꾸지 않음).
+
+        수수료율이 높은 순으로 max_block_transactions개까지, 블록 크기가
+        max_block_bytes를 넘지 않도록 선택합니다. 선택되지 않은 트랜잭션은
+        다음 블록을 기다립니다.
+
+        Returns:
+            선택한 트랜잭션과 예상 블록 크기를 담은 BlockTemplate
+        """
+        overhead = self._block_overhead()
+        max_bytes = None
+        if self.max_block_bytes is not None:
+            max_bytes = max(self.max_block_bytes - overhead, 0)
+
+        selected = self.pending_transactions.select(self.max_block_transactions, max_bytes)
+        # "[a, b]" 형식: 트랜잭션마다 구분자 2바이트 (빈 리스트는 "[]")
+        data_size = sum(transaction_size(tx) + 2 for tx in selected) or 2
+        return BlockTemplate(selected, overhead + data_size)
+
     def add_transaction(self, transaction: Transaction) -> int:
         """
-        새 트랜잭션을 펜딩 목록에 추가합니다.
+        새 트랜잭션을 멤풀에 추가합니다.
 
         Args:
             transaction: 추가할 트랜잭션
 
         Returns:
             트랜잭션이 포함될 블록의 인덱스
+
+        Raises:
+            ValueError: 유효하지 않거나, 블록에 들어갈 수 없을 만큼 크거나,
+                이미 펜딩 중이거나, 멤풀이 가득 차 수수료율이 부족한 트랜잭션일 때
         """
         if not transaction.sender or not transaction.recipient:
             raise ValueError("트랜잭션에는 발신자와 수신자가 필요합니다.")
@@ -97,44 +411,83 @@ class Blockchain:
         if transaction.amount <= 0:
             raise ValueError("트랜잭션 금액은 0보다 커야 합니다.")
 
-        self.pending_transactions.append(transaction)
+        if transaction.fee < 0:
+            raise ValueError("트랜잭션 수수료는 0 이상이어야 합니다.")
+
+        if (self.max_block_bytes is not None and
+                self._block_overhead() + transaction_size(transaction) > self.max_block_bytes):
+            raise ValueError("트랜잭션이 최대 블록 크기보다 큽니다.")
+
+        if transaction in self.pending_transactions:
+            raise ValueError("이미 펜딩 중인 트랜잭션입니다.")
+
+        if not self.pending_transactions.add(transaction):
+            raise ValueError("멤풀이 가득 차 수수료율이 더 높은 트랜잭션만 받을 수 있습니다.")
         return self.get_latest_block().index + 1
 
     def mine_pending_transactions(self, mining_reward_address: str) -> Optional[Block]:
         """
         펜딩 중인 트랜잭션들을 블록으로 만들어 채굴합니다.
 
+        build_block_template로 블록 크기와 트랜잭션 수 제한 안에서 수수료율이
+        높은 트랜잭션만 블록에 넣고, 나머지는 펜딩 상태로 남깁니다.
+        채굴 보상에는 포함된 트랜잭션의 수수료 합계가 더해집니다.
+
         Args:
             mining_reward_address: 채굴 보상을 받을 주소
 
         Returns:
-            채굴된 블록 (펜딩 트랜잭션이 없으면 None)
+            채굴된 블록 (펜딩 트랜잭션이 없거나 제한 안에 들어가는 트랜잭션이
+            없으면 None)
         """
         if not self.pending_transactions:
             print("채굴할 트랜잭션이 없습니다.")
             return None
 
-        # 트랜잭션 데이터를 딕셔너리 리스트로 변환
-        transactions_data = [tx.to_dict() for tx in self.pending_transactions]
+        # 제한 안에서 수수료율 순으로 선택
+        template = self.build_block_template()
+        if not template:
+            print("블록 크기 제한 안에 들어가는 트랜잭션이 없습니다.")
+            return None
 
         # 새 블록 생성 및 채굴
-        block = self.add_block(transactions_data)
+        block = self.add_block(template.data)
 
-        # 펜딩 트랜잭션 초기화 및 채굴 보상 추가
-        self.pending_transactions = [
+        # 포함된 트랜잭션 제거 및 채굴 보상(수수료 포함) 추가
+        # 보상은 수수료가 0이므로 제거되거나 계속 밀리지 않도록 고정 항목으로 둠
+        self.pending_transactions.remove_many(tx.txid for tx in template.transactions)
+        reward = self.mining_reward + template.fees
+        self.pending_transactions.add(
             Transaction(
                 sender="SYSTEM",
                 recipient=mining_reward_address,
-                amount=self.mining_reward
-            )
-        ]
+                amount=reward
+            ),
+            pinned=True
+        )
 
-        print(f"채굴 보상 {self.mining_reward}이(가) {mining_reward_address}에게 지급됩니다.\n")
+        print(f"채굴 보상 {reward}이(가) {mining_reward_address}에게 지급됩니다.\n")
         return block
 
     def get_balance(self, address: str) -> float:
         """
-        특정 주소의 잔액을 계산합니다.
+        특정 주소의 잔액을 조회합니다.
+
+        블록이 추가될 때 갱신되는 잔액 인덱스를 사용하므로 O(1)입니다.
+
+        Args:
+            address: 잔액을 확인할 주소
+
+        Returns:
+            해당 주소의 잔액
+        """
+        return self.balances.get(address, 0.0)
+
+    def scan_balance(self, address: str) -> float:
+        """
+        체인 전체를 순회하여 특정 주소의 잔액을 계산합니다.
+
+        잔액 인덱스의 검증용이며 O(체인 크기)입니다.
 
         Args:
             address: 잔액을 확인할 주소
@@ -152,25 +505,81 @@ class Blockchain:
             for tx_data in block.data:
                 if isinstance(tx_data, dict):
                     if tx_data.get('sender') == address:
-                        balance -= tx_data.get('amount', 0)
+                        balance -= tx_data.get('amount', 0) + tx_data.get('fee', 0)
                     if tx_data.get('recipient') == address:
                         balance += tx_data.get('amount', 0)
 
         return balance
 
-    def is_chain_valid(self) -> bool:
+    def rebuild_balances(self) -> None:
+        """체인 전체로부터 잔액 인덱스를 다시 만듭니다."""
+        balances: Dict[str, float] = {}
+        for block in self.chain:
+            self._apply_block_to_balances(block, balances)
+        self.balances = balances
+
+    def verify_balances(self) -> bool:
+        """
+        잔액 인덱스가 체인 순회 결과와 일치하는지 확인합니다.
+
+        Returns:
+            모든 주소의 잔액이 일치하면 True
+        """
+        addresses = set(self.balances)
+        for block in self.chain:
+            if isinstance(block.data, list):
+                for tx_data in block.data:
+                    if isinstance(tx_data, dict):
+                        addresses.add(tx_data.get('sender'))
+                        addresses.add(tx_data.get('recipient'))
+        addresses.discard(None)
+
+        return all(
+            self.get_balance(address) == self.scan_balance(address)
+            for address in addresses
+        )
+
+    def _checkpoint_intact(self) -> bool:
+        """
+        검증 완료 지점의 블록이 검증 당시 그대로인지 확인합니다.
+
+        Returns:
+            검증 지점을 재사용할 수 있으면 True
+        """
+        if self._verified_index is None or self._verified_index >= len(self.chain):
+            return False
+
+        block = self.chain[self._verified_index]
+        return (
+            block.hash == self._verified_hash
+            and block.calculate_hash() == self._verified_hash
+            and block.verify_body()
+        )
+
+    def is_chain_valid(self, full: bool = False) -> bool:
         """
-        전체 블록체인의 무결성을 검증합니다.
+        블록체인의 무결성을 검증합니다.
+
+        이전 검증에서 확인한 마지막 블록(검증 지점)이 그대로라면 그 이후에
+        추가된 블록만 검증합니다. full=True이면 처음부터 다시 검증합니다.
 
         검증 항목:
         1. 각 블록의 해시가 올바르게 계산되었는지
-        2. 각 블록의 previous_hash가 이전 블록의 해시와 일치하는지
-        3. 각 블록이 난이도 조건을 만족하는지 (해시가 0으로 시작)
+        2. 각 블록의 본문이 헤더와 일치하는지 (버전 2 블록의 머클 루트)
+        3. 각 블록의 previous_hash가 이전 블록의 해시와 일치하는지
+        4. 각 블록이 난이도 조건을 만족하는지 (해시가 0으로 시작)
+
+        Args:
+            full: True면 검증 지점을 무시하고 전체 체인을 검증
 
         Returns:
             체인이 유효하면 True, 그렇지 않으면 False
         """
-        for i in range(1, len(self.chain)):
+        start = 1
+        if not full and self._checkpoint_intact():
+            start = self._verified_index + 1
+
+        for i in range(start, len(self.chain)):
             current_block = self.chain[i]
             previous_block = self.chain[i - 1]
 
@@ -181,21 +590,54 @@ class Blockchain:
                 print(f"  계산된 해시: {current_block.calculate_hash()}")
                 return False
 
-            # 2. 이전 블록과의 연결이 올바른지 확인
+            # 2. 본문이 헤더(머클 루트)와 일치하는지 확인
+            if not current_block.verify_body():
+                print(f"블록 #{i}의 데이터가 머클 루트와 일치하지 않습니다!")
+                return False
+
+            # 3. 이전 블록과의 연결이 올바른지 확인
             if current_block.previous_hash != previous_block.hash:
                 print(f"블록 #{i}의 previous_hash가 이전 블록의 해시와 일치하지 않습니다!")
                 print(f"  previous_hash: {current_block.previous_hash}")
                 print(f"  이전 블록 해시: {previous_block.hash}")
                 return False
 
-            # 3. 작업 증명 조건을 만족하는지 확인
+            # 4. 작업 증명 조건을 만족하는지 확인
             if current_block.hash[:self.difficulty] != '0' * self.difficulty:
                 print(f"블록 #{i}이(가) 작업 증명 조건을 만족하지 않습니다!")
                 return False
 
+        self._verified_index = len(self.chain) - 1
+        self._verified_hash = self.chain[-1].hash
         print("블록체인이 유효합니다!")
         return True
 
+    def validate_parallel(self, validator: Optional['ParallelChainValidator'] = None
+                          ) -> 'ValidationResult':
+        """
+        병렬 검증기로 전체 체인(서명 포함)을 검증합니다.
+
+        성공하면 is_chain_valid의 검증 지점도 체인 끝으로 갱신합니다.
+
+        Args:
+            validator: 사용할 검증기 (None이면 임시 검증기 생성)
+
+        Returns:
+            검증 결과 (무효하면 처음으로 무효한 블록 위치와 사유 포함)
+        """
+        from .validator import ParallelChainValidator
+
+        if validator is None:
+            with ParallelChainValidator() as temporary:
+                result = temporary.validate(self.chain, self.difficulty)
+        else:
+            result = validator.validate(self.chain, self.difficulty)
+
+        if result.valid:
+            self._verified_index = len(self.chain) - 1
+            self._verified_hash = self.chain[-1].hash
+        return result
+
     def print_chain(self) -> None:
         """전체 블록체인을 출력합니다."""
         print("\n" + "=" * 60)
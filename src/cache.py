@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+캐시 모듈
+
+크기가 제한된 LRU(Least Recently Used) 캐시를 제공합니다.
+적중/실패 횟수를 기록하므로 캐시 크기를 조정하는 데 사용할 수 있습니다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    크기 제한 LRU 캐시 (스레드 안전)
+
+    가득 차면 가장 오래 사용되지 않은 항목부터 제거합니다.
+
+    Attributes:
+        maxsize: 최대 항목 수
+        hits: 적중 횟수
+        misses: 실패 횟수
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        캐시 초기화
+
+        Args:
+            maxsize: 최대 항목 수
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize는 0보다 커야 합니다.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        항목 조회 (적중 시 최근 사용으로 갱신)
+
+        Args:
+            key: 키
+            default: 항목이 없을 때 반환할 값
+
+        Returns:
+            저장된 값 또는 default
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        항목 저장 (가득 차면 가장 오래된 항목 제거)
+
+        Args:
+            key: 키
+            value: 값
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        """
+        최대 항목 수 변경 (줄이면 오래된 항목 제거)
+
+        Args:
+            maxsize: 새 최대 항목 수
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize는 0보다 커야 합니다.")
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 항목과 통계 초기화"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            hits, misses, hit_rate, size, maxsize를 담은 딕셔너리
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': len(self._data),
+                'maxsize': self.maxsize
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        """통계에 영향을 주지 않는 포함 여부 확인"""
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"LRUCache(size={len(self._data)}, maxsize={self.maxsize})"
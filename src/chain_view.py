@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+저장소 기반 체인 뷰 모듈
+
+최근 블록 N개만 메모리에 두고, 그보다 오래된 블록은 조회할 때 저장소에서
+읽어 LRU 캐시에 보관하는 체인을 제공합니다. Blockchain.chain 자리에
+리스트 대신 사용할 수 있도록 len(), 인덱싱(음수, 슬라이스 포함), 순회,
+append를 지원합니다.
+"""
+
+from collections import deque
+from collections.abc import Sequence
+from typing import Any, Iterator, List, Union
+
+from .block import Block
+from .cache import LRUCache
+
+
+class StoredChain(Sequence):
+    """
+    최근 블록만 메모리에 두는 저장소 기반 체인
+
+    블록 위치는 블록 인덱스와 같다고 가정합니다 (0부터 연속).
+    append한 블록은 바로 저장소에 기록되므로 창 밖으로 밀려나도
+    다시 읽을 수 있습니다. 창 밖 블록은 저장소에서 새로 만든 객체이므로,
+    수정해도 저장소에는 반영되지 않고 캐시에서 제거되면 사라집니다.
+
+    Attributes:
+        storage: 블록을 읽고 쓸 저장소 (BlockchainStorage 또는 BlockFileStore)
+        window: 메모리에 유지할 최근 블록 수
+        prefetch: 캐시 실패 시 함께 읽어 둘 블록 수
+        cache: 창 밖 블록의 LRU 캐시
+    """
+
+    def __init__(self, storage: Any, window: int = 1024, cache_size: int = 1024,
+                 prefetch: int = 64):
+        """
+        빈 체인 뷰 생성
+
+        Args:
+            storage: 블록 저장소
+            window: 메모리에 유지할 최근 블록 수
+            cache_size: 창 밖 블록 캐시 크기
+            prefetch: 캐시 실패 시 함께 읽어 둘 블록 수
+
+        Raises:
+            ValueError: window 또는 prefetch가 0 이하인 경우
+        """
+        if window <= 0:
+            raise ValueError("window는 0보다 커야 합니다.")
+        if prefetch <= 0:
+            raise ValueError("prefetch는 0보다 커야 합니다.")
+
+        self.storage = storage
+        self.window = window
+        self.prefetch = prefetch
+        self.cache = LRUCache(cache_size)
+        self._recent: 'deque[Block]' = deque(maxlen=window)
+        self._length = 0
+
+    @property
+    def _window_start(self) -> int:
+        """메모리 창의 첫 블록 위치"""
+        return self._length - len(self._recent)
+
+    def load(self, block: Block) -> None:
+        """
+        이미 저장소에 있는 블록을 체인 끝에 추가합니다 (저장하지 않음).
+
+        Args:
+            block: 추가할 블록
+        """
+        self._recent.append(block)
+        self._length += 1
+
+    def append(self, block: Block) -> None:
+        """
+        블록을 저장소에 기록하고 체인 끝에 추가합니다.
+
+        BlockchainStorage면 블록의 트랜잭션과 펜딩 정리도 같은
+        트랜잭션에서 처리합니다.
+
+        Args:
+            block: 추가할 블록
+        """
+        block_data = block.to_dict()
+        if hasattr(self.storage, 'save_block_with_transactions'):
+            self.storage.save_block_with_transactions(block_data)
+        else:
+            self.storage.save_block(block_data)
+        self.load(block)
+
+    def _fault_in(self, position: int) -> Block:
+        """창 밖 블록을 캐시 또는 저장소에서 가져옵니다."""
+        block = self.cache.get(position)
+        if block is not None:
+            return block
+
+        # 순차 접근에 대비해 뒤쪽 블록도 한 번에 읽어 캐시에 둠
+        end = min(position + self.prefetch, self._window_start)
+        for block_data in self.storage.iter_blocks(position, end, batch_size=self.prefetch):
+            self.cache.put(block_data['index'], Block.from_dict(block_data))
+
+        block = self.cache.get(position)
+        if block is None:
+            raise IndexError(f"저장소에 블록 #{position}이(가) 없습니다.")
+        return block
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Block, List[Block]]:
+        """
+        위치로 블록 조회 (음수 인덱스, 슬라이스 지원)
+
+        Raises:
+            IndexError: 범위를 벗어난 경우
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("체인 인덱스가 범위를 벗어났습니다.")
+
+        start = self._window_start
+        if index >= start:
+            return self._recent[index - start]
+        return self._fault_in(index)
+
+    def __iter__(self) -> Iterator[Block]:
+        """
+        처음부터 순회합니다.
+
+        창 밖 블록은 저장소에서 페이지 단위로 읽으며 캐시에 넣지 않습니다.
+        """
+        start = self._window_start
+        for block_data in self.storage.iter_blocks(0, start):
+            yield Block.from_dict(block_data)
+        yield from list(self._recent)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return (f"StoredChain(length={self._length}, window={self.window}, "
+                f"cached={len(self.cache)})")
@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+"""
+바이너리 직렬화 모듈
+
+블록과 트랜잭션을 JSON 대신 버전이 붙은 바이너리 형식으로 인코딩합니다.
+정수 필드는 고정 폭, 해시/주소/서명/공개키는 16진수 문자열 대신 원시 바이트
+(해시 32바이트, 서명 64바이트)로 저장합니다. 디코딩은 memoryview 위에서
+struct.unpack_from으로 읽어 입력 버퍼를 복사하지 않습니다.
+
+디코딩 결과는 Block.to_dict()/Transaction.to_dict()와 같은 딕셔너리이며,
+원시 바이트로 표현할 수 없는 값(제네시스 블록의 previous_hash "0",
+이름 주소 등)은 문자열로, 트랜잭션 리스트가 아닌 data는 JSON으로 저장하여
+항상 원래 값으로 복원됩니다.
+
+형식:
+    프레임: [형식 버전 u8][종류 u8][본문]
+    블록: [블록 버전 u8][index u64][nonce u64][timestamp][previous_hash][hash]
+          [merkle_root (버전 2만)][data]
+    트랜잭션: [sender][recipient][amount][timestamp][signature][sender_public_key]
+    체인: [블록 수 u32] + ([블록 길이 u32][블록 본문]) 반복
+    data: [data 필드] (BlockchainStorage의 data 컬럼용)
+    각 가변 필드는 태그 바이트(_TAG_*)로 시작합니다.
+"""
+
+import json
+import struct
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .block import Block
+from .compact import pack_hex, pack_timestamp, unpack_timestamp
+
+
+# 바이너리 형식 버전
+CODEC_VERSION = 1
+
+# HTTP로 체인을 주고받을 때의 미디어 타입
+MEDIA_TYPE = 'application/octet-stream'
+
+# 프레임 종류
+_KIND_TRANSACTION = 1
+_KIND_BLOCK = 2
+_KIND_CHAIN = 3
+_KIND_DATA = 4
+
+# 필드 태그
+_TAG_NONE = 0
+_TAG_STR = 1      # u32 길이 + UTF-8
+_TAG_RAW = 2      # u8 길이 + 원시 바이트 (16진수 문자열로 복원)
+_TAG_INT = 3      # i64 (금액) 또는 에포크 기준 마이크로초 (시간)
+_TAG_FLOAT = 4    # f64
+_TAG_JSON = 5     # u32 길이 + JSON UTF-8
+_TAG_TXS = 6      # u32 개수 + 트랜잭션 본문 반복
+
+_U8 = struct.Struct('>B')
+_U32 = struct.Struct('>I')
+_I64 = struct.Struct('>q')
+_F64 = struct.Struct('>d')
+_HEADER = struct.Struct('>BB')
+_BLOCK_FIXED = struct.Struct('>BQQ')
+
+# 길이별 [_TAG_RAW][길이] 접두부
+_RAW_PREFIXES = [bytes((_TAG_RAW, size)) for size in range(0x100)]
+
+_I64_MIN = -(1 << 63)
+_I64_MAX = (1 << 63) - 1
+
+# 트랜잭션 본문으로 인코딩할 수 있는 딕셔너리의 키
+_TX_REQUIRED_KEYS = frozenset({'sender', 'recipient', 'amount', 'timestamp'})
+_TX_OPTIONAL_KEYS = frozenset({'signature', 'sender_public_key'})
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+# ---------------------------------------------------------------------------
+# 인코딩
+# ---------------------------------------------------------------------------
+
+def _write_str(out: bytearray, value: str, tag: int = _TAG_STR) -> None:
+    encoded = value.encode('utf-8')
+    out += _U8.pack(tag)
+    out += _U32.pack(len(encoded))
+    out += encoded
+
+
+def _write_hex(out: bytearray, value: Optional[str]) -> None:
+    """16진수 필드 (해시, 주소, 서명, 공개키)"""
+    if value is None:
+        out += _U8.pack(_TAG_NONE)
+        return
+    packed = pack_hex(value)
+    if isinstance(packed, bytes) and len(packed) <= 0xFF:
+        out += _RAW_PREFIXES[len(packed)]
+        out += packed
+    else:
+        _write_str(out, value)
+
+
+def _write_timestamp(out: bytearray, value: str) -> None:
+    packed = pack_timestamp(value)
+    if isinstance(packed, int) and _I64_MIN <= packed <= _I64_MAX:
+        out += _U8.pack(_TAG_INT)
+        out += _I64.pack(packed)
+    else:
+        _write_str(out, value)
+
+
+def _write_amount(out: bytearray, value: Any) -> None:
+    if isinstance(value, float):
+        out += _U8.pack(_TAG_FLOAT)
+        out += _F64.pack(value)
+    elif isinstance(value, int) and not isinstance(value, bool) and _I64_MIN <= value <= _I64_MAX:
+        out += _U8.pack(_TAG_INT)
+        out += _I64.pack(value)
+    else:
+        _write_str(out, json.dumps(value, ensure_ascii=False), _TAG_JSON)
+
+
+def _is_transaction_dict(item: Any) -> bool:
+    """트랜잭션 본문으로 인코딩할 수 있는 딕셔너리인지 확인"""
+    if not isinstance(item, dict) or not _TX_REQUIRED_KEYS <= item.keys():
+        return False
+    optional = item.keys() - _TX_REQUIRED_KEYS
+    return (
+        optional <= _TX_OPTIONAL_KEYS
+        and all(isinstance(item[key], str) and item[key] for key in optional)
+        and isinstance(item['sender'], str)
+        and isinstance(item['recipient'], str)
+        and isinstance(item['timestamp'], str)
+    )
+
+
+def _write_transaction(out: bytearray, tx_data: Dict[str, Any]) -> None:
+    _write_hex(out, tx_data['sender'])
+    _write_hex(out, tx_data['recipient'])
+    _write_amount(out, tx_data['amount'])
+    _write_timestamp(out, tx_data['timestamp'])
+    _write_hex(out, tx_data.get('signature'))
+    _write_hex(out, tx_data.get('sender_public_key'))
+
+
+def _write_data(out: bytearray, data: Any) -> None:
+    """블록 data 필드 (트랜잭션 리스트면 바이너리, 그 외 JSON)"""
+    if isinstance(data, list) and all(_is_transaction_dict(item) for item in data):
+        out += _U8.pack(_TAG_TXS)
+        out += _U32.pack(len(data))
+        for tx_data in data:
+            _write_transaction(out, tx_data)
+    else:
+        _write_str(out, json.dumps(data, ensure_ascii=False), _TAG_JSON)
+
+
+def _write_block(out: bytearray, block_data: Dict[str, Any]) -> None:
+    version = block_data.get('version', Block.version)
+    try:
+        out += _BLOCK_FIXED.pack(version, block_data['index'], block_data['nonce'])
+    except struct.error as e:
+        raise ValueError(f"고정 폭 필드 범위를 벗어났습니다: {e}") from e
+    _write_timestamp(out, block_data['timestamp'])
+    _write_hex(out, block_data['previous_hash'])
+    _write_hex(out, block_data['hash'])
+    if version != Block.version:
+        _write_hex(out, block_data['merkle_root'])
+    _write_data(out, block_data['data'])
+
+
+def _as_dict(item: Any) -> Dict[str, Any]:
+    """객체(Block/Transaction)면 to_dict()로 변환"""
+    return item if isinstance(item, dict) else item.to_dict()
+
+
+def encode_transaction(transaction: Any) -> bytes:
+    """
+    트랜잭션을 바이너리로 인코딩합니다.
+
+    Args:
+        transaction: Transaction 객체 또는 to_dict() 형식의 딕셔너리
+
+    Returns:
+        인코딩된 바이트
+
+    Raises:
+        ValueError: 트랜잭션 형식이 아닐 때
+    """
+    tx_data = _as_dict(transaction)
+    if not _is_transaction_dict(tx_data):
+        raise ValueError("바이너리로 인코딩할 수 없는 트랜잭션 형식입니다.")
+    out = bytearray(_HEADER.pack(CODEC_VERSION, _KIND_TRANSACTION))
+    _write_transaction(out, tx_data)
+    return bytes(out)
+
+
+def encode_block(block: Any) -> bytes:
+    """
+    블록을 바이너리로 인코딩합니다.
+
+    Args:
+        block: Block 객체 또는 to_dict() 형식의 딕셔너리
+
+    Returns:
+        인코딩된 바이트
+    """
+    out = bytearray(_HEADER.pack(CODEC_VERSION, _KIND_BLOCK))
+    _write_block(out, _as_dict(block))
+    return bytes(out)
+
+
+def encode_chain(blocks: Sequence[Any]) -> bytes:
+    """
+    블록 시퀀스를 하나의 바이너리로 인코딩합니다.
+
+    블록마다 길이를 앞에 붙이므로 수신 측은 필요한 블록만 골라 읽을 수 있습니다.
+
+    Args:
+        blocks: Block 객체 또는 블록 딕셔너리 시퀀스
+
+    Returns:
+        인코딩된 바이트
+    """
+    out = bytearray(_HEADER.pack(CODEC_VERSION, _KIND_CHAIN))
+    out += _U32.pack(len(blocks))
+    body = bytearray()
+    for block in blocks:
+        body.clear()
+        _write_block(body, _as_dict(block))
+        out += _U32.pack(len(body))
+        out += body
+    return bytes(out)
+
+
+def encode_data(data: Any) -> bytes:
+    """
+    블록의 data 필드만 인코딩합니다 (BlockchainStorage의 data 컬럼용).
+
+    Args:
+        data: 블록 데이터
+
+    Returns:
+        인코딩된 바이트
+    """
+    out = bytearray(_HEADER.pack(CODEC_VERSION, _KIND_DATA))
+    _write_data(out, data)
+    return bytes(out)
+
+
+# ---------------------------------------------------------------------------
+# 디코딩
+# ---------------------------------------------------------------------------
+
+class _Reader:
+    """memoryview 위를 순서대로 읽는 디코더 (입력 버퍼를 복사하지 않음)"""
+
+    __slots__ = ('view', 'offset')
+
+    def __init__(self, buffer: Buffer, offset: int = 0):
+        view = memoryview(buffer)
+        # 인덱싱 결과가 바이트 값(int)이 되도록 부호 없는 바이트 형식으로 맞춤
+        self.view = view if view.format == 'B' else view.cast('B')
+        self.offset = offset
+
+    def unpack(self, fmt: struct.Struct) -> tuple:
+        values = fmt.unpack_from(self.view, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def take(self, size: int) -> memoryview:
+        end = self.offset + size
+        if end > len(self.view):
+            raise ValueError("바이너리 데이터가 잘렸습니다.")
+        chunk = self.view[self.offset:end]
+        self.offset = end
+        return chunk
+
+    def tag(self) -> int:
+        tag = self.view[self.offset]
+        self.offset += 1
+        return tag
+
+    def text(self) -> str:
+        size, = self.unpack(_U32)
+        return str(self.take(size), 'utf-8')
+
+    def hex_field(self) -> Optional[str]:
+        view = self.view
+        tag = view[self.offset]
+        if tag == _TAG_RAW:
+            # 가장 흔한 경우: [태그][길이 u8][원시 바이트]
+            start = self.offset + 2
+            end = start + view[self.offset + 1]
+            if end > len(view):
+                raise ValueError("바이너리 데이터가 잘렸습니다.")
+            self.offset = end
+            return view[start:end].hex()
+        self.offset += 1
+        if tag == _TAG_NONE:
+            return None
+        if tag == _TAG_STR:
+            return self.text()
+        raise ValueError(f"알 수 없는 필드 태그입니다: {tag}")
+
+    def timestamp(self) -> str:
+        tag = self.tag()
+        if tag == _TAG_INT:
+            return unpack_timestamp(self.unpack(_I64)[0])
+        if tag == _TAG_STR:
+            return self.text()
+        raise ValueError(f"알 수 없는 필드 태그입니다: {tag}")
+
+    def amount(self) -> Any:
+        tag = self.tag()
+        if tag == _TAG_INT:
+            return self.unpack(_I64)[0]
+        if tag == _TAG_FLOAT:
+            return self.unpack(_F64)[0]
+        if tag == _TAG_JSON:
+            return json.loads(self.text())
+        raise ValueError(f"알 수 없는 필드 태그입니다: {tag}")
+
+    def transaction(self) -> Dict[str, Any]:
+        result = {
+            'sender': self.hex_field(),
+            'recipient': self.hex_field(),
+            'amount': self.amount(),
+            'timestamp': self.timestamp()
+        }
+        signature = self.hex_field()
+        public_key = self.hex_field()
+        if signature is not None:
+            result['signature'] = signature
+        if public_key is not None:
+            result['sender_public_key'] = public_key
+        return result
+
+    def data(self) -> Any:
+        tag = self.tag()
+        if tag == _TAG_TXS:
+            count, = self.unpack(_U32)
+            return [self.transaction() for _ in range(count)]
+        if tag == _TAG_JSON:
+            return json.loads(self.text())
+        raise ValueError(f"알 수 없는 필드 태그입니다: {tag}")
+
+    def block(self) -> Dict[str, Any]:
+        version, index, nonce = self.unpack(_BLOCK_FIXED)
+        result = {
+            'index': index,
+            'timestamp': self.timestamp(),
+            'previous_hash': self.hex_field(),
+            'nonce': nonce,
+            'hash': self.hex_field()
+        }
+        if version != Block.version:
+            result['version'] = version
+            result['merkle_root'] = self.hex_field()
+        result['data'] = self.data()
+        return result
+
+    def header(self, kind: int) -> None:
+        version, actual_kind = self.unpack(_HEADER)
+        if version != CODEC_VERSION:
+            raise ValueError(f"지원하지 않는 바이너리 형식 버전입니다: {version}")
+        if actual_kind != kind:
+            raise ValueError("바이너리 데이터의 종류가 일치하지 않습니다.")
+
+
+def _decode(buffer: Buffer, kind: int, read) -> Any:
+    """헤더를 확인하고 read(reader)로 본문을 디코딩"""
+    reader = _Reader(buffer)
+    try:
+        reader.header(kind)
+        result = read(reader)
+    except (struct.error, IndexError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"잘못된 바이너리 데이터입니다: {e}") from e
+    if reader.offset != len(reader.view):
+        raise ValueError("바이너리 데이터 끝에 남는 바이트가 있습니다.")
+    return result
+
+
+def decode_transaction(buffer: Buffer) -> Dict[str, Any]:
+    """
+    encode_transaction()의 결과를 디코딩합니다.
+
+    Args:
+        buffer: bytes, bytearray 또는 memoryview
+
+    Returns:
+        Transaction.to_dict() 형식의 딕셔너리
+
+    Raises:
+        ValueError: 형식이 잘못되었을 때
+    """
+    return _decode(buffer, _KIND_TRANSACTION, _Reader.transaction)
+
+
+def decode_block(buffer: Buffer) -> Dict[str, Any]:
+    """
+    encode_block()의 결과를 디코딩합니다.
+
+    Args:
+        buffer: bytes, bytearray 또는 memoryview
+
+    Returns:
+        Block.to_dict() 형식의 딕셔너리
+
+    Raises:
+        ValueError: 형식이 잘못되었을 때
+    """
+    return _decode(buffer, _KIND_BLOCK, _Reader.block)
+
+
+def decode_chain(buffer: Buffer) -> List[Dict[str, Any]]:
+    """
+    encode_chain()의 결과를 디코딩합니다.
+
+    Args:
+        buffer: bytes, bytearray 또는 memoryview
+
+    Returns:
+        블록 딕셔너리 리스트
+
+    Raises:
+        ValueError: 형식이 잘못되었을 때
+    """
+    def read(reader: _Reader) -> List[Dict[str, Any]]:
+        count, = reader.unpack(_U32)
+        blocks = []
+        for _ in range(count):
+            size, = reader.unpack(_U32)
+            end = reader.offset + size
+            blocks.append(reader.block())
+            if reader.offset != end:
+                raise ValueError("블록 길이가 일치하지 않습니다.")
+        return blocks
+
+    return _decode(buffer, _KIND_CHAIN, read)
+
+
+def decode_data(buffer: Buffer) -> Any:
+    """
+    encode_data()의 결과를 디코딩합니다.
+
+    Args:
+        buffer: bytes, bytearray 또는 memoryview
+
+    Returns:
+        블록 데이터
+
+    Raises:
+        ValueError: 형식이 잘못되었을 때
+    """
+    return _decode(buffer, _KIND_DATA, _Reader.data)
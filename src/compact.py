@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+압축 표현 모듈
+
+메모리에 많은 수의 블록과 트랜잭션을 올려둘 때 사용하는 __slots__ 기반
+클래스를 제공합니다. 해시와 서명 등 16진수 문자열은 bytes로, ISO 형식
+시간은 에포크 기준 마이크로초 정수로, 금액은 고정소수점 정수로 저장합니다.
+to_dict()는 원래 Block/Transaction의 to_dict()와 같은 결과를 반환합니다.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Dict, Union
+
+from .block import Block
+
+
+# 금액 고정소수점 배율 (소수점 8자리)
+AMOUNT_SCALE = 10 ** 8
+
+# 시간 정수 변환 기준 (시간대 없는 ISO 시간만 변환)
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# 트랜잭션 딕셔너리의 필수 키와 전체 키
+_TX_REQUIRED_KEYS = frozenset({'sender', 'recipient', 'amount', 'timestamp'})
+_TX_KEYS = _TX_REQUIRED_KEYS | {'signature', 'sender_public_key'}
+
+# 압축된 16진수 값 또는 변환할 수 없어 그대로 둔 문자열
+_HexValue = Union[bytes, str]
+
+
+def pack_hex(value: str) -> _HexValue:
+    """
+    16진수 문자열을 bytes로 변환합니다.
+
+    소문자 16진수가 아니어서 그대로 되돌릴 수 없는 값(예: 제네시스 블록의
+    previous_hash "0", 주소 대신 쓰인 이름)은 intern한 문자열로 유지합니다.
+
+    Args:
+        value: 변환할 문자열
+
+    Returns:
+        bytes 또는 원래 문자열
+
+    Raises:
+        ValueError: 문자열이 아닐 때
+    """
+    if not isinstance(value, str):
+        raise ValueError("16진수 필드는 문자열이어야 합니다.")
+    try:
+        packed = bytes.fromhex(value)
+    except ValueError:
+        return sys.intern(value)
+    if packed.hex() != value:
+        return sys.intern(value)
+    return packed
+
+
+def unpack_hex(value: _HexValue) -> str:
+    """pack_hex()로 압축한 값을 16진수 문자열로 되돌립니다."""
+    return value.hex() if isinstance(value, bytes) else value
+
+
+def pack_timestamp(value: str) -> Union[int, str]:
+    """
+    ISO 형식 시간을 에포크 기준 마이크로초 정수로 변환합니다.
+
+    datetime.isoformat()으로 정확히 되돌릴 수 있는 값만 변환하고,
+    그 외(시간대 포함 등)는 문자열로 유지합니다.
+
+    Args:
+        value: ISO 형식 시간 문자열
+
+    Returns:
+        마이크로초 정수 또는 원래 문자열
+
+    Raises:
+        ValueError: 문자열이 아닐 때
+    """
+    if not isinstance(value, str):
+        raise ValueError("timestamp는 문자열이어야 합니다.")
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        return value
+    if moment.tzinfo is not None:
+        return value
+
+    micros = (moment - _EPOCH) // _MICROSECOND
+    if unpack_timestamp(micros) != value:
+        return value
+    return micros
+
+
+def unpack_timestamp(value: Union[int, str]) -> str:
+    """pack_timestamp()로 압축한 값을 ISO 형식 문자열로 되돌립니다."""
+    if isinstance(value, int):
+        return (_EPOCH + timedelta(microseconds=value)).isoformat()
+    return value
+
+
+def pack_amount(value: Union[int, float]) -> int:
+    """
+    금액을 고정소수점 정수(AMOUNT_SCALE 단위)로 변환합니다.
+
+    Args:
+        value: 금액
+
+    Returns:
+        고정소수점 정수
+
+    Raises:
+        ValueError: 숫자가 아니거나 소수점 8자리로 정확히 표현할 수 없을 때
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError("금액은 숫자여야 합니다.")
+    if isinstance(value, int):
+        return value * AMOUNT_SCALE
+
+    units = round(value * AMOUNT_SCALE)
+    if units / AMOUNT_SCALE != value:
+        raise ValueError("소수점 8자리 고정소수점으로 표현할 수 없는 금액입니다.")
+    return units
+
+
+def _is_transaction_dict(item: Any) -> bool:
+    """Transaction.to_dict() 형식의 딕셔너리인지 확인"""
+    return (
+        isinstance(item, dict)
+        and _TX_REQUIRED_KEYS <= item.keys()
+        and item.keys() <= _TX_KEYS
+    )
+
+
+class CompactTransaction:
+    """
+    메모리 절약형 트랜잭션 표현
+
+    Attributes:
+        sender: 발신자 주소 (bytes 또는 문자열)
+        recipient: 수신자 주소 (bytes 또는 문자열)
+        amount_units: 고정소수점 금액 (AMOUNT_SCALE 단위)
+        amount_is_float: 원래 금액이 float였는지 여부
+        timestamp: 에포크 기준 마이크로초 (또는 원래 문자열)
+        signature: 64바이트 서명 (없으면 None)
+        sender_public_key: 64바이트 공개키 (없으면 None)
+    """
+
+    __slots__ = ('sender', 'recipient', 'amount_units', 'amount_is_float',
+                 'timestamp', 'signature', 'sender_public_key')
+
+    @classmethod
+    def from_dict(cls, tx_data: Dict[str, Any]) -> 'CompactTransaction':
+        """
+        Transaction.to_dict() 형식의 딕셔너리를 압축합니다.
+
+        Args:
+            tx_data: 트랜잭션 딕셔너리
+
+        Returns:
+            압축된 트랜잭션
+
+        Raises:
+            ValueError: 압축할 수 없는 값이 있을 때
+        """
+        tx = cls.__new__(cls)
+        tx.sender = pack_hex(tx_data['sender'])
+        tx.recipient = pack_hex(tx_data['recipient'])
+        tx.amount_units = pack_amount(tx_data['amount'])
+        tx.amount_is_float = isinstance(tx_data['amount'], float)
+        tx.timestamp = pack_timestamp(tx_data['timestamp'])
+        signature = tx_data.get('signature')
+        public_key = tx_data.get('sender_public_key')
+        tx.signature = pack_hex(signature) if signature else None
+        tx.sender_public_key = pack_hex(public_key) if public_key else None
+        return tx
+
+    @classmethod
+    def from_transaction(cls, transaction) -> 'CompactTransaction':
+        """Transaction 객체를 압축합니다."""
+        return cls.from_dict(transaction.to_dict())
+
+    @property
+    def amount(self) -> Union[int, float]:
+        """원래 형식(int/float)의 금액"""
+        if self.amount_is_float:
+            return self.amount_units / AMOUNT_SCALE
+        return self.amount_units // AMOUNT_SCALE
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Transaction.to_dict()와 같은 형식으로 변환합니다.
+
+        Returns:
+            트랜잭션 딕셔너리
+        """
+        result = {
+            'sender': unpack_hex(self.sender),
+            'recipient': unpack_hex(self.recipient),
+            'amount': self.amount,
+            'timestamp': unpack_timestamp(self.timestamp)
+        }
+        if self.signature is not None:
+            result['signature'] = unpack_hex(self.signature)
+        if self.sender_public_key is not None:
+            result['sender_public_key'] = unpack_hex(self.sender_public_key)
+        return result
+
+    def to_transaction(self):
+        """Transaction 객체로 복원합니다."""
+        from .transaction import Transaction
+        return Transaction.from_dict(self.to_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactTransaction):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return (f"CompactTransaction({unpack_hex(self.sender)[:8]}... -> "
+                f"{unpack_hex(self.recipient)[:8]}..., {self.amount})")
+
+
+class CompactBlock:
+    """
+    메모리 절약형 블록 표현
+
+    data가 트랜잭션 딕셔너리 리스트이면 각 트랜잭션을 CompactTransaction
+    튜플로 저장하고, 그 외 데이터(문자열 등)는 그대로 보관합니다.
+
+    Attributes:
+        index: 블록 번호
+        timestamp: 에포크 기준 마이크로초 (또는 원래 문자열)
+        data: 압축된 블록 데이터
+        previous_hash: 이전 블록 해시 (bytes 또는 문자열)
+        nonce: 작업 증명 nonce
+        hash: 블록 해시 (bytes 또는 문자열)
+        version: 블록 형식 버전
+        merkle_root: 머클 루트 (버전 2 블록만, 아니면 None)
+    """
+
+    __slots__ = ('index', 'timestamp', 'data', 'previous_hash', 'nonce',
+                 'hash', 'version', 'merkle_root')
+
+    @classmethod
+    def from_dict(cls, block_data: Dict[str, Any]) -> 'CompactBlock':
+        """
+        Block.to_dict() 형식의 딕셔너리를 압축합니다.
+
+        Args:
+            block_data: 블록 딕셔너리
+
+        Returns:
+            압축된 블록
+
+        Raises:
+            ValueError: 압축할 수 없는 값이 있을 때
+        """
+        block = cls.__new__(cls)
+        block.index = block_data['index']
+        block.timestamp = pack_timestamp(block_data['timestamp'])
+        block.data = cls._pack_data(block_data['data'])
+        block.previous_hash = pack_hex(block_data['previous_hash'])
+        block.nonce = block_data['nonce']
+        block.hash = pack_hex(block_data['hash'])
+        block.version = block_data.get('version', Block.version)
+        merkle_root = block_data.get('merkle_root')
+        block.merkle_root = pack_hex(merkle_root) if merkle_root is not None else None
+        return block
+
+    @classmethod
+    def from_block(cls, block: Block) -> 'CompactBlock':
+        """Block(또는 MerkleBlock) 객체를 압축합니다."""
+        return cls.from_dict(block.to_dict())
+
+    @staticmethod
+    def _pack_data(data: Any) -> Any:
+        """트랜잭션 리스트를 CompactTransaction 튜플로 변환"""
+        if not isinstance(data, list):
+            return data
+        return tuple(
+            CompactTransaction.from_dict(item) if _is_transaction_dict(item) else item
+            for item in data
+        )
+
+    def _unpack_data(self) -> Any:
+        """압축된 데이터를 원래 형식으로 변환"""
+        if not isinstance(self.data, tuple):
+            return self.data
+        return [
+            item.to_dict() if isinstance(item, CompactTransaction) else item
+            for item in self.data
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Block.to_dict()와 같은 형식으로 변환합니다.
+
+        Returns:
+            블록 딕셔너리 (버전 2 블록은 version, merkle_root 포함)
+        """
+        result = {
+            'index': self.index,
+            'timestamp': unpack_timestamp(self.timestamp),
+            'data': self._unpack_data(),
+            'previous_hash': unpack_hex(self.previous_hash),
+            'nonce': self.nonce,
+            'hash': unpack_hex(self.hash)
+        }
+        if self.version != Block.version:
+            result['version'] = self.version
+            result['merkle_root'] = unpack_hex(self.merkle_root)
+        return result
+
+    def to_block(self) -> Block:
+        """Block(또는 MerkleBlock) 객체로 복원합니다."""
+        return Block.from_dict(self.to_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactBlock):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"CompactBlock(index={self.index}, hash={unpack_hex(self.hash)[:8]}...)"
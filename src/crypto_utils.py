@@ -7,8 +7,9 @@ ECDSA 서명 생성/검증 및 해시 관련 유틸리티를 제공합니다.
 
 import hashlib
 import hmac
+import os
 import secrets
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 
 # secp256k1 곡선 파라미터 (비트코인에서 사용하는 곡선)
@@ -21,10 +22,23 @@ SECP256K1_GX = 0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F8179
 SECP256K1_GY = 0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
 
 
+# 내장 pow(a, -1, m) 지원 여부 (Python 3.8+)
+try:
+    pow(2, -1, 3)
+    _HAS_POW_INVERSE = True
+except ValueError:
+    _HAS_POW_INVERSE = False
+
+
 def mod_inverse(a: int, m: int) -> int:
-    """모듈러 역원 계산 (확장 유클리드 알고리즘)"""
-    if a < 0:
-        a = a % m
+    """모듈러 역원 계산 (내장 pow 또는 반복형 확장 유클리드 알고리즘)"""
+    a %= m
+    if _HAS_POW_INVERSE:
+        try:
+            return pow(a, -1, m)
+        except ValueError:
+            raise ValueError("모듈러 역원이 존재하지 않습니다") from None
+
     g, x, _ = extended_gcd(a, m)
     if g != 1:
         raise ValueError("모듈러 역원이 존재하지 않습니다")
@@ -32,18 +46,56 @@ def mod_inverse(a: int, m: int) -> int:
 
 
 def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
-    """확장 유클리드 알고리즘"""
-    if a == 0:
-        return b, 0, 1
-    gcd, x1, y1 = extended_gcd(b % a, a)
-    x = y1 - (b // a) * x1
-    y = x1
-    return gcd, x, y
+    """확장 유클리드 알고리즘 (반복형): a*x + b*y = gcd 인 (gcd, x, y)"""
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
+    return old_r, old_x, old_y
+
+
+def batch_inverse(values: List[int], m: int) -> List[int]:
+    """
+    여러 값의 모듈러 역원을 역원 계산 1회로 구하기 (Montgomery 트릭)
+
+    누적곱의 역원 하나로부터 각 원소의 역원을 곱셈만으로 복원합니다.
+
+    Args:
+        values: 역원을 구할 값 리스트
+        m: 모듈러
+
+    Returns:
+        각 값의 역원 리스트 (입력 순서와 동일)
+
+    Raises:
+        ValueError: 역원이 존재하지 않는 값이 있을 때
+    """
+    if not values:
+        return []
+
+    prefix = []
+    acc = 1
+    for value in values:
+        prefix.append(acc)
+        acc = acc * value % m
+
+    inv = mod_inverse(acc, m)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        result[i] = inv * prefix[i] % m
+        inv = inv * values[i] % m
+    return result
 
 
 class ECPoint:
     """타원 곡선 위의 점"""
 
+    __slots__ = ('x', 'y', 'p')
+
     def __init__(self, x: Optional[int], y: Optional[int], curve_p: int = SECP256K1_P):
         self.x = x
         self.y = y
@@ -67,6 +119,27 @@ class ECPoint:
         return f"ECPoint({self.x}, {self.y})"
 
 
+def is_on_curve(public_key: Tuple[int, int]) -> bool:
+    """
+    공개키가 secp256k1 곡선 위의 유한한 점인지 확인
+
+    외부에서 받은 공개키는 곡선 밖의 점이거나 무한원점일 수 있으므로
+    검증 전에 확인해야 합니다.
+
+    Args:
+        public_key: 공개키 (x, y)
+
+    Returns:
+        y^2 = x^3 + 7 (mod p)를 만족하고 좌표가 [0, p) 범위이면 True
+    """
+    x, y = public_key
+    if not isinstance(x, int) or not isinstance(y, int):
+        return False
+    if not (0 <= x < SECP256K1_P and 0 <= y < SECP256K1_P):
+        return False
+    return (y * y - x * x * x - SECP256K1_B) % SECP256K1_P == 0
+
+
 def point_add(p1: ECPoint, p2: ECPoint) -> ECPoint:
     """타원 곡선 점 덧셈"""
     if p1.is_infinity():
@@ -90,8 +163,13 @@ def point_add(p1: ECPoint, p2: ECPoint) -> ECPoint:
     return ECPoint(x3, y3)
 
 
-def point_multiply(k: int, point: ECPoint) -> ECPoint:
-    """타원 곡선 스칼라 곱셈 (double-and-add)"""
+def point_multiply_affine(k: int, point: ECPoint) -> ECPoint:
+    """
+    타원 곡선 스칼라 곱셈 (아핀 좌표 double-and-add)
+
+    덧셈마다 모듈러 역원을 계산하는 기준 구현입니다.
+    point_multiply의 결과를 교차 검증할 때 사용합니다.
+    """
     if k == 0 or point.is_infinity():
         return ECPoint.infinity()
 
@@ -111,10 +189,485 @@ def point_multiply(k: int, point: ECPoint) -> ECPoint:
     return result
 
 
+# 야코비안 좌표 (X, Y, Z) -> 아핀 좌표 (X / Z^2, Y / Z^3)
+# Z == 0 이면 무한원점입니다. 덧셈/더블링에 역원이 필요 없습니다.
+JacobianPoint = Tuple[int, int, int]
+
+JACOBIAN_INFINITY: JacobianPoint = (1, 1, 0)
+
+
+def to_jacobian(point: ECPoint) -> JacobianPoint:
+    """아핀 좌표 점을 야코비안 좌표로 변환"""
+    if point.is_infinity():
+        return JACOBIAN_INFINITY
+    return (point.x, point.y, 1)
+
+
+def from_jacobian(point: JacobianPoint) -> ECPoint:
+    """야코비안 좌표 점을 아핀 좌표로 변환 (역원 1회)"""
+    x, y, z = point
+    if z == 0:
+        return ECPoint.infinity()
+    z_inv = mod_inverse(z, SECP256K1_P)
+    z_inv2 = z_inv * z_inv % SECP256K1_P
+    return ECPoint(x * z_inv2 % SECP256K1_P, y * z_inv2 * z_inv % SECP256K1_P)
+
+
+def jacobian_to_affine_batch(points: List[JacobianPoint]) -> List[ECPoint]:
+    """여러 야코비안 점을 역원 계산 1회로 아핀 좌표로 변환"""
+    finite = [point for point in points if point[2] != 0]
+    z_invs = iter(batch_inverse([point[2] for point in finite], SECP256K1_P))
+
+    result = []
+    for x, y, z in points:
+        if z == 0:
+            result.append(ECPoint.infinity())
+            continue
+        z_inv = next(z_invs)
+        z_inv2 = z_inv * z_inv % SECP256K1_P
+        result.append(ECPoint(x * z_inv2 % SECP256K1_P, y * z_inv2 * z_inv % SECP256K1_P))
+    return result
+
+
+def jacobian_double(point: JacobianPoint) -> JacobianPoint:
+    """야코비안 좌표 점 더블링 (a = 0 곡선 전용)"""
+    p = SECP256K1_P
+    x1, y1, z1 = point
+    if z1 == 0 or y1 == 0:
+        return JACOBIAN_INFINITY
+
+    a = x1 * x1 % p
+    b = y1 * y1 % p
+    c = b * b % p
+    d = 2 * ((x1 + b) * (x1 + b) - a - c) % p
+    e = 3 * a % p
+    x3 = (e * e - 2 * d) % p
+    y3 = (e * (d - x3) - 8 * c) % p
+    z3 = 2 * y1 * z1 % p
+    return (x3, y3, z3)
+
+
+def jacobian_add(p1: JacobianPoint, p2: JacobianPoint) -> JacobianPoint:
+    """야코비안 좌표 점 덧셈"""
+    p = SECP256K1_P
+    x1, y1, z1 = p1
+    x2, y2, z2 = p2
+    if z1 == 0:
+        return p2
+    if z2 == 0:
+        return p1
+
+    z1z1 = z1 * z1 % p
+    z2z2 = z2 * z2 % p
+    u1 = x1 * z2z2 % p
+    u2 = x2 * z1z1 % p
+    s1 = y1 * z2 * z2z2 % p
+    s2 = y2 * z1 * z1z1 % p
+
+    if u1 == u2:
+        if s1 != s2:
+            return JACOBIAN_INFINITY
+        return jacobian_double(p1)
+
+    h = (u2 - u1) % p
+    r = (s2 - s1) % p
+    h2 = h * h % p
+    h3 = h * h2 % p
+    u1h2 = u1 * h2 % p
+    x3 = (r * r - h3 - 2 * u1h2) % p
+    y3 = (r * (u1h2 - x3) - s1 * h3) % p
+    z3 = h * z1 * z2 % p
+    return (x3, y3, z3)
+
+
+def jacobian_add_affine(p1: JacobianPoint, x2: int, y2: int) -> JacobianPoint:
+    """야코비안 점과 아핀 점(Z = 1)의 덧셈 (mixed addition)"""
+    p = SECP256K1_P
+    x1, y1, z1 = p1
+    if z1 == 0:
+        return (x2, y2, 1)
+
+    z1z1 = z1 * z1 % p
+    u2 = x2 * z1z1 % p
+    s2 = y2 * z1 * z1z1 % p
+
+    if x1 == u2:
+        if y1 != s2:
+            return JACOBIAN_INFINITY
+        return jacobian_double(p1)
+
+    h = (u2 - x1) % p
+    r = (s2 - y1) % p
+    h2 = h * h % p
+    h3 = h * h2 % p
+    u1h2 = x1 * h2 % p
+    x3 = (r * r - h3 - 2 * u1h2) % p
+    y3 = (r * (u1h2 - x3) - y1 * h3) % p
+    z3 = h * z1 % p
+    return (x3, y3, z3)
+
+
+def point_multiply(k: int, point: ECPoint) -> ECPoint:
+    """
+    타원 곡선 스칼라 곱셈
+
+    야코비안 좌표에서 왼쪽->오른쪽 double-and-add를 수행하고
+    마지막에 한 번만 역원을 계산하여 아핀 좌표로 변환합니다.
+    point가 생성점 G이면 사전 계산 테이블을 사용해 덧셈만 수행하고,
+    그 외의 점은 USE_GLV가 True이면 point_multiply_glv를 사용합니다.
+    """
+    if k == 0 or point.is_infinity():
+        return ECPoint.infinity()
+
+    if point == G:
+        return from_jacobian(_multiply_generator(k))
+
+    if USE_GLV:
+        return point_multiply_glv(k, point)
+
+    x, y = point.x, point.y
+    if k < 0:
+        k = -k
+        y = (-y) % SECP256K1_P
+
+    result = JACOBIAN_INFINITY
+    for bit in bin(k)[2:]:
+        result = jacobian_double(result)
+        if bit == '1':
+            result = jacobian_add_affine(result, x, y)
+
+    return from_jacobian(result)
+
+
 # 생성점 G
 G = ECPoint(SECP256K1_GX, SECP256K1_GY)
 
 
+# 고정 기저(G) 스칼라 곱셈용 테이블 파라미터
+# table[i][j - 1] = j * 2^(w*i) * G  (j = 1 .. 2^w - 1)
+GENERATOR_TABLE_WINDOW = 4
+_GENERATOR_TABLE_WINDOWS = (256 + GENERATOR_TABLE_WINDOW - 1) // GENERATOR_TABLE_WINDOW
+_GENERATOR_TABLE_MAGIC = b'SECP256K1-G-TABLE-v1'
+
+_generator_table: Optional[List[List[Tuple[int, int]]]] = None
+
+
+def _build_generator_table() -> List[List[Tuple[int, int]]]:
+    """G의 고정 기저 테이블 계산 (아핀 좌표, 일괄 역원으로 정규화)"""
+    row_size = (1 << GENERATOR_TABLE_WINDOW) - 1
+    points = []
+    base = to_jacobian(G)
+    for _ in range(_GENERATOR_TABLE_WINDOWS):
+        current = base
+        for _ in range(row_size):
+            points.append(current)
+            current = jacobian_add(current, base)
+        # 다음 윈도우의 기저: 2^w * base
+        base = current
+
+    affine = [(point.x, point.y) for point in jacobian_to_affine_batch(points)]
+    return [affine[i:i + row_size] for i in range(0, len(affine), row_size)]
+
+
+def _serialize_generator_table(table: List[List[Tuple[int, int]]]) -> bytes:
+    """테이블을 바이트열로 직렬화"""
+    parts = [_GENERATOR_TABLE_MAGIC, bytes([GENERATOR_TABLE_WINDOW])]
+    for row in table:
+        for x, y in row:
+            parts.append(x.to_bytes(32, 'big') + y.to_bytes(32, 'big'))
+    return b''.join(parts)
+
+
+def _deserialize_generator_table(data: bytes) -> Optional[List[List[Tuple[int, int]]]]:
+    """바이트열에서 테이블 복원 (형식이 맞지 않으면 None)"""
+    header = len(_GENERATOR_TABLE_MAGIC) + 1
+    row_size = (1 << GENERATOR_TABLE_WINDOW) - 1
+    expected = header + _GENERATOR_TABLE_WINDOWS * row_size * 64
+
+    if (len(data) != expected
+            or not data.startswith(_GENERATOR_TABLE_MAGIC)
+            or data[header - 1] != GENERATOR_TABLE_WINDOW):
+        return None
+
+    table = []
+    offset = header
+    for _ in range(_GENERATOR_TABLE_WINDOWS):
+        row = []
+        for _ in range(row_size):
+            x = int.from_bytes(data[offset:offset + 32], 'big')
+            y = int.from_bytes(data[offset + 32:offset + 64], 'big')
+            row.append((x, y))
+            offset += 64
+        table.append(row)
+
+    # 손상된 파일 방지: 첫 항목이 G인지, 마지막 항목이 곡선 위의 점인지 확인
+    x, y = table[-1][-1]
+    if table[0][0] != (G.x, G.y) or (y * y - x * x * x - SECP256K1_B) % SECP256K1_P != 0:
+        return None
+    return table
+
+
+def load_generator_table(path: Optional[str] = None) -> None:
+    """
+    G의 고정 기저 테이블을 준비합니다.
+
+    테이블은 처음 필요할 때 자동으로 계산되지만, 시작 시점에 미리 호출하면
+    첫 서명의 지연을 없앨 수 있습니다. path를 주면 파일에서 읽고,
+    파일이 없거나 손상되었으면 계산한 뒤 그 경로에 저장합니다.
+
+    Args:
+        path: 테이블 캐시 파일 경로 (선택)
+    """
+    global _generator_table
+
+    if path is not None and os.path.exists(path):
+        with open(path, 'rb') as f:
+            table = _deserialize_generator_table(f.read())
+        if table is not None:
+            _generator_table = table
+            return
+
+    if _generator_table is None:
+        _generator_table = _build_generator_table()
+
+    if path is not None:
+        with open(path, 'wb') as f:
+            f.write(_serialize_generator_table(_generator_table))
+
+
+def _multiply_generator(k: int) -> JacobianPoint:
+    """
+    k * G 계산 (고정 기저 테이블 사용)
+
+    k를 w비트 단위로 나누어 각 윈도우의 테이블 항목을 더하므로
+    더블링 없이 최대 256/w번의 덧셈만 필요합니다.
+    """
+    if _generator_table is None:
+        load_generator_table()
+
+    k %= SECP256K1_N
+    mask = (1 << GENERATOR_TABLE_WINDOW) - 1
+    result = JACOBIAN_INFINITY
+    for row in _generator_table:
+        digit = k & mask
+        if digit:
+            x, y = row[digit - 1]
+            result = jacobian_add_affine(result, x, y)
+        k >>= GENERATOR_TABLE_WINDOW
+        if not k:
+            break
+    return result
+
+
+# 다중 스칼라 곱셈(Straus/Shamir) 윈도우 크기
+# G는 테이블을 한 번만 만들므로 더 큰 윈도우를 사용합니다.
+MSM_WINDOW = 5
+MSM_GENERATOR_WINDOW = 7
+
+_generator_odd_multiples: Optional[List[JacobianPoint]] = None
+
+
+def wnaf(k: int, window: int) -> List[int]:
+    """
+    스칼라의 wNAF(width-w non-adjacent form) 표현
+
+    0이 아닌 자릿수는 모두 홀수이고 |d| < 2^(w-1)이며,
+    연속한 w개 자릿수 중 0이 아닌 것은 최대 하나입니다.
+
+    Args:
+        k: 음이 아닌 스칼라
+        window: 윈도우 크기 w
+
+    Returns:
+        최하위 자리부터의 자릿수 리스트
+    """
+    digits = []
+    modulus = 1 << window
+    half = 1 << (window - 1)
+    while k:
+        if k & 1:
+            digit = k & (modulus - 1)
+            if digit >= half:
+                digit -= modulus
+            k -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        k >>= 1
+    return digits
+
+
+def _odd_multiples(point: JacobianPoint, window: int) -> List[JacobianPoint]:
+    """[P, 3P, 5P, ..., (2^(w-1) - 1)P] 계산"""
+    double = jacobian_double(point)
+    multiples = [point]
+    for _ in range((1 << (window - 2)) - 1):
+        multiples.append(jacobian_add(multiples[-1], double))
+    return multiples
+
+
+def _normalize_table(table: List[JacobianPoint]) -> List[JacobianPoint]:
+    """테이블을 Z = 1로 정규화 (mixed addition 사용 가능, 무한원점은 그대로 유지)"""
+    return [
+        JACOBIAN_INFINITY if point.is_infinity() else (point.x, point.y, 1)
+        for point in jacobian_to_affine_batch(table)
+    ]
+
+
+def _get_generator_odd_multiples() -> List[JacobianPoint]:
+    """G의 홀수 배 테이블 (Z = 1로 정규화하여 캐시)"""
+    global _generator_odd_multiples
+    if _generator_odd_multiples is None:
+        _generator_odd_multiples = _normalize_table(
+            _odd_multiples(to_jacobian(G), MSM_GENERATOR_WINDOW)
+        )
+    return _generator_odd_multiples
+
+
+def _straus(terms: List[Tuple[List[int], List[JacobianPoint]]]) -> JacobianPoint:
+    """
+    Straus(Shamir) 인터리빙 다중 스칼라 곱셈
+
+    모든 스칼라가 더블링을 공유하므로, 각 스칼라를 따로 곱한 뒤 더하는
+    것보다 더블링 횟수가 스칼라 개수만큼 줄어듭니다.
+
+    Args:
+        terms: (wNAF 자릿수, 홀수 배 테이블) 리스트
+
+    Returns:
+        합계 점 (야코비안 좌표)
+    """
+    p = SECP256K1_P
+    length = max((len(digits) for digits, _ in terms), default=0)
+    result = JACOBIAN_INFINITY
+
+    for i in range(length - 1, -1, -1):
+        result = jacobian_double(result)
+        for digits, table in terms:
+            if i >= len(digits) or not digits[i]:
+                continue
+            digit = digits[i]
+            x, y, z = table[abs(digit) >> 1]
+            if digit < 0:
+                y = p - y
+            if z == 1:
+                result = jacobian_add_affine(result, x, y)
+            else:
+                result = jacobian_add(result, (x, y, z))
+
+    return result
+
+
+# secp256k1 GLV 엔도모피즘: lambda * (x, y) = (beta * x, y)
+# beta^3 = 1 (mod p), lambda^3 = 1 (mod n)
+GLV_BETA = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
+GLV_LAMBDA = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
+
+# 스칼라 분해용 격자 기저 (a_i + b_i * lambda = 0 mod n)
+_GLV_A1 = 0x3086D221A7D46BCDE86C90E49284EB15
+_GLV_B1 = -0xE4437ED6010E88286F547FA90ABFE4C3
+_GLV_A2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8
+_GLV_B2 = 0x3086D221A7D46BCDE86C90E49284EB15
+
+# GLV 사용 여부 (False면 256비트 double-and-add / Straus 사용)
+USE_GLV = True
+
+_generator_endo_multiples: Optional[List[JacobianPoint]] = None
+
+
+def glv_decompose(k: int) -> Tuple[int, int]:
+    """
+    스칼라를 k = k1 + k2 * lambda (mod n)인 약 128비트 두 값으로 분해
+
+    Args:
+        k: 스칼라
+
+    Returns:
+        (k1, k2) - 음수일 수 있음
+    """
+    n = SECP256K1_N
+    k %= n
+    # c1 = round(b2 * k / n), c2 = round(-b1 * k / n)
+    c1 = (_GLV_B2 * k + n // 2) // n
+    c2 = (-_GLV_B1 * k + n // 2) // n
+    k1 = k - c1 * _GLV_A1 - c2 * _GLV_A2
+    k2 = -c1 * _GLV_B1 - c2 * _GLV_B2
+    return k1, k2
+
+
+def _endomorphism_table(table: List[JacobianPoint]) -> List[JacobianPoint]:
+    """홀수 배 테이블에 엔도모피즘 적용 (점 연산 없이 x좌표에 beta 곱)"""
+    return [(GLV_BETA * x % SECP256K1_P, y, z) for x, y, z in table]
+
+
+def _signed_wnaf(k: int, window: int) -> List[int]:
+    """음수 스칼라도 허용하는 wNAF (부호는 자릿수에 반영)"""
+    if k < 0:
+        return [-digit for digit in wnaf(-k, window)]
+    return wnaf(k, window)
+
+
+def _glv_terms(k: int, table: List[JacobianPoint], window: int,
+               endo_table: Optional[List[JacobianPoint]] = None
+               ) -> List[Tuple[List[int], List[JacobianPoint]]]:
+    """k*P를 _straus용 128비트 항 두 개로 분해"""
+    k1, k2 = glv_decompose(k)
+    if endo_table is None:
+        endo_table = _endomorphism_table(table)
+    return [(_signed_wnaf(k1, window), table), (_signed_wnaf(k2, window), endo_table)]
+
+
+def _get_generator_endo_multiples() -> List[JacobianPoint]:
+    """lambda*G의 홀수 배 테이블 (캐시)"""
+    global _generator_endo_multiples
+    if _generator_endo_multiples is None:
+        _generator_endo_multiples = _endomorphism_table(_get_generator_odd_multiples())
+    return _generator_endo_multiples
+
+
+def point_multiply_glv(k: int, point: ECPoint) -> ECPoint:
+    """
+    GLV 엔도모피즘을 이용한 스칼라 곱셈
+
+    k를 약 128비트 두 스칼라로 분해하여 k1*P + k2*(lambda*P)를 Straus로
+    계산하므로 더블링 횟수가 절반으로 줄어듭니다.
+    point_multiply_affine과 교차 검증됩니다.
+    """
+    if point.is_infinity() or k % SECP256K1_N == 0:
+        return ECPoint.infinity()
+
+    table = _normalize_table(_odd_multiples(to_jacobian(point), MSM_WINDOW))
+    return from_jacobian(_straus(_glv_terms(k, table, MSM_WINDOW)))
+
+
+def multi_scalar_multiply(scalars: List[int], points: List[ECPoint]) -> ECPoint:
+    """
+    다중 스칼라 곱셈: k1*P1 + k2*P2 + ... + kn*Pn
+
+    Args:
+        scalars: 스칼라 리스트
+        points: 점 리스트 (scalars와 같은 길이)
+
+    Returns:
+        합계 점
+    """
+    if len(scalars) != len(points):
+        raise ValueError("스칼라와 점의 개수가 일치하지 않습니다")
+
+    terms = []
+    for k, point in zip(scalars, points):
+        k %= SECP256K1_N
+        if k == 0 or point.is_infinity():
+            continue
+        if point == G:
+            terms.append((wnaf(k, MSM_GENERATOR_WINDOW), _get_generator_odd_multiples()))
+        else:
+            table = _normalize_table(_odd_multiples(to_jacobian(point), MSM_WINDOW))
+            terms.append((wnaf(k, MSM_WINDOW), table))
+
+    return from_jacobian(_straus(terms))
+
+
 def generate_private_key() -> int:
     """개인키 생성 (256비트 난수)"""
     while True:
@@ -186,6 +739,66 @@ def sign_message(private_key: int, message: str) -> Tuple[int, int]:
         return (r, s)
 
 
+def _public_key_table(public_key: Tuple[int, int]) -> List[JacobianPoint]:
+    """공개키의 홀수 배 테이블 (다중 스칼라 곱셈용, Z = 1로 정규화)"""
+    if not is_on_curve(public_key):
+        raise ValueError("공개키가 곡선 위의 점이 아닙니다.")
+    return _normalize_table(_odd_multiples((public_key[0], public_key[1], 1), MSM_WINDOW))
+
+
+def _signature_in_range(signature: Tuple[int, int]) -> bool:
+    """서명 (r, s)가 [1, n) 범위인지 확인"""
+    r, s = signature
+    return 1 <= r < SECP256K1_N and 1 <= s < SECP256K1_N
+
+
+def _verify_with_table(key_table: List[JacobianPoint], message: str,
+                       signature: Tuple[int, int], s_inv: Optional[int] = None) -> bool:
+    """
+    공개키 테이블을 사용한 ECDSA 서명 검증
+
+    P = u1*G + u2*Q를 야코비안 좌표로 계산하고, 아핀 변환 대신
+    X == r * Z^2 (mod p)를 비교하여 역원 계산을 생략합니다.
+    s_inv를 주면 (일괄 역원으로 미리 계산한 값) 역원 계산도 생략합니다.
+    """
+    r, s = signature
+
+    # 범위 검사
+    if not _signature_in_range(signature):
+        return False
+
+    z = hash_message(message) % SECP256K1_N
+
+    # s^(-1) mod n
+    if s_inv is None:
+        s_inv = mod_inverse(s, SECP256K1_N)
+
+    # u1 = z * s^(-1) mod n, u2 = r * s^(-1) mod n
+    u1 = (z * s_inv) % SECP256K1_N
+    u2 = (r * s_inv) % SECP256K1_N
+
+    # P = u1 * G + u2 * public_key (더블링을 공유하는 다중 스칼라 곱셈)
+    if USE_GLV:
+        # 128비트 항 네 개: u1 = a + b*lambda, u2 = c + d*lambda
+        terms = _glv_terms(u2, key_table, MSM_WINDOW)
+        terms += _glv_terms(u1, _get_generator_odd_multiples(), MSM_GENERATOR_WINDOW,
+                            _get_generator_endo_multiples())
+    else:
+        terms = [(wnaf(u2, MSM_WINDOW), key_table)]
+        if u1:
+            terms.append((wnaf(u1, MSM_GENERATOR_WINDOW), _get_generator_odd_multiples()))
+    x, _, z_coord = _straus(terms)
+
+    if z_coord == 0:
+        return False
+
+    # r == P.x mod n 이면 유효한 서명 (P.x는 r 또는 r + n)
+    zz = z_coord * z_coord % SECP256K1_P
+    if x == r * zz % SECP256K1_P:
+        return True
+    return r + SECP256K1_N < SECP256K1_P and x == (r + SECP256K1_N) * zz % SECP256K1_P
+
+
 def verify_signature(public_key: Tuple[int, int], message: str, signature: Tuple[int, int]) -> bool:
     """
     ECDSA 서명 검증
@@ -196,36 +809,86 @@ def verify_signature(public_key: Tuple[int, int], message: str, signature: Tuple
         signature: (r, s) 서명
 
     Returns:
-        서명이 유효하면 True
+        서명이 유효하면 True (곡선 밖의 공개키는 False)
     """
-    r, s = signature
-
-    # 범위 검사
-    if not (1 <= r < SECP256K1_N and 1 <= s < SECP256K1_N):
+    if not is_on_curve(public_key):
         return False
+    return _verify_with_table(_public_key_table(public_key), message, signature)
 
-    z = hash_message(message) % SECP256K1_N
 
-    # s^(-1) mod n
-    s_inv = mod_inverse(s, SECP256K1_N)
+def precompute_public_key(public_key: Tuple[int, int]) -> List[JacobianPoint]:
+    """
+    서명 검증용 공개키 사전 계산 테이블 생성
 
-    # u1 = z * s^(-1) mod n
-    u1 = (z * s_inv) % SECP256K1_N
+    같은 공개키로 여러 번 검증할 때 결과를 캐시해 두고
+    verify_signature_precomputed에 넘기면 테이블 계산을 생략할 수 있습니다.
 
-    # u2 = r * s^(-1) mod n
-    u2 = (r * s_inv) % SECP256K1_N
+    Args:
+        public_key: 공개키 (x, y)
 
-    # P = u1 * G + u2 * public_key
-    pub_point = ECPoint(public_key[0], public_key[1])
-    point1 = point_multiply(u1, G)
-    point2 = point_multiply(u2, pub_point)
-    P = point_add(point1, point2)
+    Returns:
+        공개키 테이블
 
-    if P.is_infinity():
-        return False
+    Raises:
+        ValueError: 공개키가 곡선 위의 점이 아닐 때
+    """
+    return _public_key_table(public_key)
+
+
+def verify_signature_precomputed(key_table: List[JacobianPoint], message: str,
+                                 signature: Tuple[int, int]) -> bool:
+    """
+    사전 계산된 공개키 테이블로 ECDSA 서명 검증
+
+    Args:
+        key_table: precompute_public_key()의 결과
+        message: 원본 메시지
+        signature: (r, s) 서명
+
+    Returns:
+        서명이 유효하면 True
+    """
+    return _verify_with_table(key_table, message, signature)
+
+
+def verify_signatures_batch(
+        items: List[Tuple[Tuple[int, int], str, Tuple[int, int]]]) -> List[bool]:
+    """
+    여러 ECDSA 서명을 한 번에 검증
+
+    같은 공개키의 서명은 공개키 테이블을 한 번만 만들어 공유하고,
+    모든 s의 역원은 batch_inverse로 한 번에 계산합니다.
 
-    # r == P.x mod n 이면 유효한 서명
-    return r == P.x % SECP256K1_N
+    Args:
+        items: (공개키, 메시지, 서명) 리스트
+
+    Returns:
+        각 항목의 검증 결과 리스트 (입력 순서와 동일)
+    """
+    in_range = [_signature_in_range(signature) for _, _, signature in items]
+    s_invs = iter(batch_inverse(
+        [signature[1] for (_, _, signature), ok in zip(items, in_range) if ok],
+        SECP256K1_N
+    ))
+
+    tables: Dict[Tuple[int, int], Optional[List[JacobianPoint]]] = {}
+    results = []
+    for (public_key, message, signature), ok in zip(items, in_range):
+        if not ok:
+            results.append(False)
+            continue
+        if public_key not in tables:
+            tables[public_key] = (
+                _public_key_table(public_key) if is_on_curve(public_key) else None
+            )
+        table = tables[public_key]
+        if table is None:
+            # s 역원은 범위 안의 서명마다 하나씩 계산되어 있으므로 건너뜀
+            next(s_invs)
+            results.append(False)
+            continue
+        results.append(_verify_with_table(table, message, signature, next(s_invs)))
+    return results
 
 
 def bytes_to_hex(data: bytes) -> str:
@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+"""
+멤풀 모듈
+
+블록에 포함되기를 기다리는 트랜잭션을 관리합니다.
+txid로 중복을 막고, 발신자별 인덱스를 유지하며, 최대 크기를 넘으면
+수수료율(수수료 / 직렬화 크기)이 가장 낮은 트랜잭션부터 제거합니다.
+블록에 넣을 트랜잭션은 수수료율 힙에서 k개를 꺼내 O(k log n)에 고릅니다.
+채굴 보상처럼 잃어버리면 안 되는 트랜잭션은 고정(pinned)하여 제거 대상에서
+빼고 가장 먼저 선택합니다.
+"""
+
+import heapq
+import json
+from itertools import count, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .transaction import Transaction
+
+
+# 멤풀에 보관하는 기본 최대 트랜잭션 수
+DEFAULT_MAX_SIZE = 10000
+
+# JSON 리스트에서 트랜잭션 하나가 더하는 구분자 크기 (", " 또는 "[]"의 몫)
+_SEPARATOR_BYTES = 2
+
+# max_bytes를 넘어 연속으로 건너뛸 수 있는 최대 트랜잭션 수
+_MAX_SKIPPED = 100
+
+# 힙 항목: (정렬 키, 순번 키, txid)
+_HeapItem = Tuple[float, int, str]
+
+
+def transaction_size(tx: Transaction) -> int:
+    """
+    트랜잭션이 블록 data에서 차지하는 크기
+
+    Args:
+        tx: 트랜잭션
+
+    Returns:
+        to_dict()의 JSON 직렬화 바이트 수
+    """
+    return len(json.dumps(tx.to_dict(), ensure_ascii=False).encode('utf-8'))
+
+
+class _Entry:
+    """멤풀 항목 (트랜잭션, 크기, 수수료율, 추가 순번, 고정 여부)"""
+
+    __slots__ = ('tx', 'size', 'fee_rate', 'seq', 'pinned')
+
+    def __init__(self, tx: Transaction, size: int, fee_rate: float, seq: int,
+                 pinned: bool = False):
+        self.tx = tx
+        self.size = size
+        self.fee_rate = fee_rate
+        self.seq = seq
+        self.pinned = pinned
+
+    @property
+    def priority(self) -> float:
+        """선택 순서 키 (고정 항목은 수수료율과 관계없이 가장 앞)"""
+        return float('inf') if self.pinned else self.fee_rate
+
+
+class Mempool:
+    """
+    수수료율 우선순위 멤풀
+
+    순회, len(), 인덱싱은 추가된 순서를 따르므로 기존 펜딩 리스트처럼
+    사용할 수 있습니다. 힙은 지연 삭제 방식이라 제거 시 O(1)이며,
+    오래된 힙 항목은 꺼낼 때나 힙이 커졌을 때 정리합니다.
+    추가한 뒤 트랜잭션의 해시 대상 필드를 바꾸면 txid가 달라지므로
+    멤풀에 있는 동안에는 수정하지 않아야 합니다.
+
+    고정 항목은 max_size에 포함되지 않고 제거되지 않으며, select()에서
+    추가된 순서로 가장 먼저 선택됩니다.
+
+    Attributes:
+        max_size: 최대 트랜잭션 수 (고정 항목 제외)
+        evicted: 공간이 부족해 제거된 트랜잭션 수
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        빈 멤풀 생성
+
+        Args:
+            max_size: 최대 트랜잭션 수
+
+        Raises:
+            ValueError: max_size가 0 이하인 경우
+        """
+        if max_size <= 0:
+            raise ValueError("max_size는 0보다 커야 합니다.")
+
+        self.max_size = max_size
+        self.evicted = 0
+        self._entries: Dict[str, _Entry] = {}
+        self._by_sender: Dict[str, Dict[str, Transaction]] = {}
+        # 수수료율 높은 순 (같으면 먼저 들어온 순)
+        self._best: List[_HeapItem] = []
+        # 수수료율 낮은 순 (같으면 나중에 들어온 순)
+        self._worst: List[_HeapItem] = []
+        self._seq = count()
+        self._pinned = 0
+
+    def _live(self, txid: str, seq: int) -> Optional[_Entry]:
+        """힙 항목이 가리키는 항목이 아직 멤풀에 있으면 반환"""
+        entry = self._entries.get(txid)
+        if entry is None or entry.seq != seq:
+            return None
+        return entry
+
+    def _peek_worst(self) -> _Entry:
+        """수수료율이 가장 낮은 항목 (오래된 힙 항목은 버림)"""
+        while True:
+            _, negative_seq, txid = self._worst[0]
+            entry = self._live(txid, -negative_seq)
+            if entry is not None:
+                return entry
+            heapq.heappop(self._worst)
+
+    def _compact(self) -> None:
+        """제거된 항목이 힙에 많이 남아 있으면 힙을 다시 만듭니다."""
+        if len(self._best) + len(self._worst) <= 4 * len(self._entries) + 64:
+            return
+        entries = self._entries.items()
+        self._best = [(-e.priority, e.seq, txid) for txid, e in entries]
+        self._worst = [(e.fee_rate, -e.seq, txid) for txid, e in entries if not e.pinned]
+        heapq.heapify(self._best)
+        heapq.heapify(self._worst)
+
+    def add(self, tx: Transaction, pinned: bool = False) -> bool:
+        """
+        트랜잭션 추가
+
+        가득 차 있으면 수수료율이 가장 낮은 트랜잭션보다 높을 때만
+        그 트랜잭션을 제거하고 추가합니다. 고정 항목은 항상 추가됩니다.
+
+        Args:
+            tx: 추가할 트랜잭션
+            pinned: True면 제거되지 않고 가장 먼저 선택되는 고정 항목
+                (채굴 보상 등)
+
+        Returns:
+            추가했으면 True, 이미 있거나 수수료율이 낮아 거부했으면 False
+        """
+        txid = tx.txid
+        if txid in self._entries:
+            return False
+
+        size = transaction_size(tx)
+        fee_rate = tx.fee / size
+        if not pinned and len(self._entries) - self._pinned >= self.max_size:
+            worst = self._peek_worst()
+            if fee_rate <= worst.fee_rate:
+                return False
+            self.remove(worst.tx.txid)
+            self.evicted += 1
+
+        entry = _Entry(tx, size, fee_rate, next(self._seq), pinned)
+        self._entries[txid] = entry
+        self._by_sender.setdefault(tx.sender, {})[txid] = tx
+        heapq.heappush(self._best, (-entry.priority, entry.seq, txid))
+        if pinned:
+            self._pinned += 1
+        else:
+            heapq.heappush(self._worst, (fee_rate, -entry.seq, txid))
+        return True
+
+    def remove(self, txid: str) -> Optional[Transaction]:
+        """
+        트랜잭션 제거
+
+        Args:
+            txid: 제거할 트랜잭션 ID
+
+        Returns:
+            제거한 트랜잭션 또는 None (없을 때)
+        """
+        entry = self._entries.pop(txid, None)
+        if entry is None:
+            return None
+        if entry.pinned:
+            self._pinned -= 1
+
+        sender_txs = self._by_sender[entry.tx.sender]
+        del sender_txs[txid]
+        if not sender_txs:
+            del self._by_sender[entry.tx.sender]
+        self._compact()
+        return entry.tx
+
+    def remove_many(self, txids: Iterable[str]) -> int:
+        """
+        여러 트랜잭션 제거 (블록에 포함된 트랜잭션 정리용)
+
+        Args:
+            txids: 제거할 트랜잭션 ID들
+
+        Returns:
+            실제로 제거한 수
+        """
+        return sum(1 for txid in txids if self.remove(txid) is not None)
+
+    def select(self, limit: Optional[int] = None,
+               max_bytes: Optional[int] = None) -> List[Transaction]:
+        """
+        수수료율이 높은 순으로 트랜잭션 선택 (멤풀에서 제거하지 않음)
+
+        고정 항목이 가장 먼저 오고, 수수료율이 같으면 먼저 들어온 트랜잭션이
+        앞섭니다. max_bytes를 넘게
+        되는 트랜잭션은 건너뛰고 다음 후보를 확인하며, 연속으로 여러 번
+        건너뛰면 블록이 거의 찼다고 보고 선택을 마칩니다.
+
+        Args:
+            limit: 최대 선택 수 (None이면 전체)
+            max_bytes: 선택한 트랜잭션 to_dict() 리스트의 최대 JSON 크기
+                (None이면 제한 없음)
+
+        Returns:
+            선택한 트랜잭션 리스트
+        """
+        picked: List[Transaction] = []
+        popped: List[_HeapItem] = []
+        used = skipped = 0
+        while self._best and (limit is None or len(picked) < limit):
+            item = heapq.heappop(self._best)
+            entry = self._live(item[2], item[1])
+            if entry is None:
+                continue
+            popped.append(item)
+
+            cost = entry.size + _SEPARATOR_BYTES
+            if max_bytes is not None and used + cost > max_bytes:
+                skipped += 1
+                if skipped >= _MAX_SKIPPED:
+                    break
+                continue
+            used += cost
+            skipped = 0
+            picked.append(entry.tx)
+
+        for item in popped:
+            heapq.heappush(self._best, item)
+        return picked
+
+    def get(self, txid: str) -> Optional[Transaction]:
+        """
+        txid로 트랜잭션 조회
+
+        Args:
+            txid: 트랜잭션 ID
+
+        Returns:
+            트랜잭션 또는 None
+        """
+        entry = self._entries.get(txid)
+        return entry.tx if entry else None
+
+    def by_sender(self, sender: str) -> List[Transaction]:
+        """
+        발신자의 펜딩 트랜잭션 조회
+
+        Args:
+            sender: 발신자 주소
+
+        Returns:
+            추가된 순서의 트랜잭션 리스트
+        """
+        return list(self._by_sender.get(sender, {}).values())
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> List[Transaction]:
+        """
+        추가된 순서로 일부 트랜잭션 조회
+
+        Args:
+            offset: 건너뛸 트랜잭션 수
+            limit: 최대 반환 수 (None이면 끝까지)
+
+        Returns:
+            트랜잭션 리스트
+        """
+        stop = None if limit is None else offset + limit
+        return [entry.tx for entry in islice(self._entries.values(), offset, stop)]
+
+    def clear(self) -> None:
+        """모든 트랜잭션 제거"""
+        self._entries.clear()
+        self._by_sender.clear()
+        self._best.clear()
+        self._worst.clear()
+        self._pinned = 0
+
+    def __contains__(self, item: Union[Transaction, str]) -> bool:
+        """트랜잭션 또는 txid 포함 여부"""
+        txid = item.txid if isinstance(item, Transaction) else item
+        return txid in self._entries
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Transaction, List[Transaction]]:
+        """추가된 순서 기준 인덱싱 (리스트 호환용, O(n))"""
+        return [entry.tx for entry in self._entries.values()][index]
+
+    def __iter__(self) -> Iterator[Transaction]:
+        return iter([entry.tx for entry in self._entries.values()])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"Mempool(size={len(self._entries)}, max_size={self.max_size})"
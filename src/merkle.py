@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+머클 트리 모듈
+
+트랜잭션 리스트의 머클 루트 계산과 포함 증명(inclusion proof) 생성/검증을
+제공합니다. 리프와 내부 노드에 서로 다른 접두 바이트를 붙여 해시하므로
+내부 노드를 리프로 위장하는 공격을 막습니다.
+"""
+
+import hashlib
+import json
+from typing import Any, List, Tuple
+
+
+# 트랜잭션이 없는 블록의 머클 루트
+EMPTY_MERKLE_ROOT = '0' * 64
+
+_LEAF_PREFIX = b'\x00'
+_NODE_PREFIX = b'\x01'
+
+
+def hash_leaf(item: Any) -> str:
+    """
+    리프(트랜잭션 등) 해시 계산
+
+    Args:
+        item: JSON 직렬화 가능한 값
+
+    Returns:
+        리프 해시 (16진수 문자열)
+    """
+    item_string = json.dumps(item, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(_LEAF_PREFIX + item_string.encode('utf-8')).hexdigest()
+
+
+def _hash_node(left: bytes, right: bytes) -> bytes:
+    """내부 노드 해시 계산"""
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+def _next_level(level: List[bytes]) -> List[bytes]:
+    """한 단계 위의 노드 목록 계산 (홀수 개면 마지막 노드를 복제)"""
+    if len(level) % 2 == 1:
+        level = level + [level[-1]]
+    return [_hash_node(level[i], level[i + 1]) for i in range(0, len(level), 2)]
+
+
+def merkle_root(leaf_hashes: List[str]) -> str:
+    """
+    리프 해시 목록의 머클 루트 계산
+
+    Args:
+        leaf_hashes: 리프 해시 리스트 (16진수 문자열)
+
+    Returns:
+        머클 루트 (16진수 문자열)
+    """
+    if not leaf_hashes:
+        return EMPTY_MERKLE_ROOT
+
+    level = [bytes.fromhex(h) for h in leaf_hashes]
+    while len(level) > 1:
+        level = _next_level(level)
+    return level[0].hex()
+
+
+def merkle_proof(leaf_hashes: List[str], index: int) -> List[Tuple[str, str]]:
+    """
+    특정 리프의 포함 증명 생성
+
+    Args:
+        leaf_hashes: 리프 해시 리스트
+        index: 증명할 리프의 위치
+
+    Returns:
+        루트까지의 (방향, 형제 해시) 리스트.
+        방향은 형제 노드가 왼쪽이면 'left', 오른쪽이면 'right'
+
+    Raises:
+        IndexError: index가 범위를 벗어날 때
+    """
+    if not 0 <= index < len(leaf_hashes):
+        raise IndexError("리프 인덱스가 범위를 벗어났습니다.")
+
+    proof: List[Tuple[str, str]] = []
+    level = [bytes.fromhex(h) for h in leaf_hashes]
+
+    while len(level) > 1:
+        if len(level) % 2 == 1:
+            level = level + [level[-1]]
+        if index % 2 == 0:
+            proof.append(('right', level[index + 1].hex()))
+        else:
+            proof.append(('left', level[index - 1].hex()))
+        level = _next_level(level)
+        index //= 2
+
+    return proof
+
+
+def verify_merkle_proof(leaf_hash: str, proof: List[Tuple[str, str]], root: str) -> bool:
+    """
+    포함 증명 검증
+
+    블록 전체 없이 리프 해시, 증명, 헤더의 머클 루트만으로 검증합니다.
+
+    Args:
+        leaf_hash: 검증할 리프 해시
+        proof: merkle_proof()가 반환한 증명
+        root: 블록 헤더의 머클 루트
+
+    Returns:
+        리프가 루트에 포함되어 있으면 True
+    """
+    try:
+        current = bytes.fromhex(leaf_hash)
+        for side, sibling_hex in proof:
+            sibling = bytes.fromhex(sibling_hex)
+            if side == 'left':
+                current = _hash_node(sibling, current)
+            elif side == 'right':
+                current = _hash_node(current, sibling)
+            else:
+                return False
+    except (TypeError, ValueError):
+        return False
+
+    return current.hex() == root
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+채굴기 모듈
+
+여러 프로세스에 nonce 공간을 나누어 작업 증명(PoW)을 병렬로 수행합니다.
+Blockchain(miner=...)으로 주입하면 add_block과 mine_pending_transactions가
+이 채굴기를 사용합니다.
+"""
+
+import multiprocessing
+import os
+from typing import List, Optional, Tuple
+
+from .block import find_nonce
+
+
+# 아직 유효한 nonce를 찾지 못했음을 나타내는 값
+_NOT_FOUND = 2 ** 62
+
+# 워커 프로세스가 공유하는 "지금까지 찾은 가장 작은 nonce"
+_best_nonce = None
+
+# 공유 값을 확인하는 주기 (반복 횟수)
+_CHECK_INTERVAL = 1024
+
+
+def _init_worker(best_nonce) -> None:
+    """워커 프로세스 초기화 (공유 값 등록)"""
+    global _best_nonce
+    _best_nonce = best_nonce
+
+
+def _search_range(args: Tuple[bytes, bytes, int, int, int]) -> Optional[int]:
+    """
+    [start, stop) 구간에서 난이도를 만족하는 가장 작은 nonce를 찾습니다.
+
+    _CHECK_INTERVAL 단위로 탐색하며, 다른 워커가 더 작은 nonce를 이미
+    찾았다면 즉시 탐색을 중단합니다.
+
+    Returns:
+        찾은 nonce 또는 None
+    """
+    prefix, suffix, difficulty, start, stop = args
+
+    for sub_start in range(start, stop, _CHECK_INTERVAL):
+        if _best_nonce.value < sub_start:
+            return None
+
+        sub_stop = min(sub_start + _CHECK_INTERVAL, stop)
+        nonce = find_nonce(prefix, suffix, difficulty, sub_start, sub_stop)
+        if nonce is not None:
+            with _best_nonce.get_lock():
+                if nonce < _best_nonce.value:
+                    _best_nonce.value = nonce
+            return nonce
+
+    return None
+
+
+class ParallelMiner:
+    """
+    프로세스 풀을 사용하는 병렬 채굴기
+
+    nonce 공간을 라운드 단위로 나누고, 각 라운드에서 워커마다
+    chunk_size 크기의 연속 구간을 할당합니다. 라운드에서 찾은 nonce 중
+    가장 작은 값을 채택하므로 직렬 채굴(Block.mine_block)과 항상 같은
+    nonce와 해시를 얻습니다. 워커에는 블록 대신 pow_template()의
+    접두부/접미부 바이트만 전달합니다.
+
+    Attributes:
+        processes: 워커 프로세스 수
+        chunk_size: 워커 하나가 한 번에 탐색하는 nonce 개수
+    """
+
+    def __init__(self, processes: Optional[int] = None, chunk_size: int = 20000):
+        """
+        병렬 채굴기 초기화
+
+        Args:
+            processes: 워커 프로세스 수 (기본값: CPU 코어 수)
+            chunk_size: 워커당 탐색 구간 크기
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size는 0보다 커야 합니다.")
+
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._context = multiprocessing.get_context()
+        self._best_nonce = self._context.Value('q', _NOT_FOUND)
+        self._pool = None
+
+    def _get_pool(self):
+        """프로세스 풀 반환 (최초 호출 시 생성)"""
+        if self._pool is None:
+            self._pool = self._context.Pool(
+                processes=self.processes,
+                initializer=_init_worker,
+                initargs=(self._best_nonce,)
+            )
+        return self._pool
+
+    def mine(self, block, difficulty: int) -> None:
+        """
+        블록을 병렬로 채굴합니다.
+
+        채굴이 끝나면 block.nonce와 block.hash가 갱신됩니다.
+
+        Args:
+            block: 채굴할 블록
+            difficulty: 해시가 시작해야 하는 0의 개수
+        """
+        target = '0' * difficulty
+        if block.hash[:difficulty] == target:
+            block.announce_mined()
+            return
+
+        pool = self._get_pool()
+        prefix, suffix = block.pow_template()
+        start = block.nonce + 1
+
+        while True:
+            tasks: List[Tuple[bytes, bytes, int, int, int]] = [
+                (prefix, suffix, difficulty,
+                 start + i * self.chunk_size,
+                 start + (i + 1) * self.chunk_size)
+                for i in range(self.processes)
+            ]
+            self._best_nonce.value = _NOT_FOUND
+            found = [n for n in pool.map(_search_range, tasks) if n is not None]
+            if found:
+                break
+            start += self.processes * self.chunk_size
+
+        block.nonce = min(found)
+        block.hash = block.calculate_hash()
+        block.announce_mined()
+
+    def close(self) -> None:
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> 'ParallelMiner':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ParallelMiner(processes={self.processes}, chunk_size={self.chunk_size})"
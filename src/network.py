@@ -7,13 +7,19 @@ Flask를 사용한 HTTP API를 제공합니다.
 
 import json
 from typing import Optional
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 
 from .blockchain import Blockchain
+from .codec import MEDIA_TYPE, encode_chain
 from .transaction import Transaction
 from .node import Node
 
 
+# /transactions/pending 페이지 크기 (기본값, 최댓값)
+PENDING_PAGE_SIZE = 100
+MAX_PENDING_PAGE_SIZE = 1000
+
+
 def create_app(blockchain: Optional[Blockchain] = None,
                node: Optional[Node] = None,
                difficulty: int = 2) -> Flask:
@@ -52,7 +58,10 @@ def create_app(blockchain: Optional[Blockchain] = None,
 
     @app.route('/chain', methods=['GET'])
     def get_chain():
-        """전체 체인 조회"""
+        """전체 체인 조회 (Accept에 바이너리 미디어 타입이 있으면 codec 형식)"""
+        if any(mimetype == MEDIA_TYPE for mimetype, _ in request.accept_mimetypes):
+            return Response(encode_chain(blockchain.chain), status=200, mimetype=MEDIA_TYPE)
+
         chain_data = [block.to_dict() for block in blockchain.chain]
         return jsonify({
             'chain': chain_data,
@@ -61,8 +70,9 @@ def create_app(blockchain: Optional[Blockchain] = None,
 
     @app.route('/chain/valid', methods=['GET'])
     def validate_chain():
-        """체인 유효성 검증"""
-        is_valid = blockchain.is_chain_valid()
+        """체인 유효성 검증 (?full=true면 전체 재검증)"""
+        full = request.args.get('full', 'false').lower() == 'true'
+        is_valid = blockchain.is_chain_valid(full=full)
         return jsonify({
             'valid': is_valid,
             'length': len(blockchain)
@@ -93,7 +103,8 @@ def create_app(blockchain: Optional[Blockchain] = None,
             tx = Transaction(
                 sender=data['sender'],
                 recipient=data['recipient'],
-                amount=float(data['amount'])
+                amount=float(data['amount']),
+                fee=float(data.get('fee', 0))
             )
 
             # 서명 정보가 있으면 추가
@@ -115,11 +126,24 @@ def create_app(blockchain: Optional[Blockchain] = None,
 
     @app.route('/transactions/pending', methods=['GET'])
     def get_pending_transactions():
-        """펜딩 트랜잭션 조회"""
-        pending = [tx.to_dict() for tx in blockchain.pending_transactions]
+        """
+        펜딩 트랜잭션 조회 (추가된 순서, ?offset=&limit=로 페이지 지정)
+
+        count는 멤풀 전체 트랜잭션 수입니다.
+        """
+        offset = request.args.get('offset', 0, type=int)
+        limit = request.args.get('limit', PENDING_PAGE_SIZE, type=int)
+        if offset < 0 or not 0 < limit <= MAX_PENDING_PAGE_SIZE:
+            return jsonify({
+                'error': f'offset은 0 이상, limit은 1~{MAX_PENDING_PAGE_SIZE}이어야 합니다'
+            }), 400
+
+        pending = [tx.to_dict() for tx in blockchain.pending_transactions.page(offset, limit)]
         return jsonify({
             'pending_transactions': pending,
-            'count': len(pending)
+            'count': len(blockchain.pending_transactions),
+            'offset': offset,
+            'limit': limit
         }), 200
 
     @app.route('/mine', methods=['POST'])
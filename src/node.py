@@ -9,6 +9,8 @@ import requests
 from typing import Set, List, Dict, Any, Optional
 from urllib.parse import urlparse
 
+from .codec import MEDIA_TYPE, decode_chain
+
 
 class Node:
     """
@@ -86,6 +88,9 @@ class Node:
         """
         특정 노드에서 체인 가져오기
 
+        바이너리 형식을 우선 요청하고, 상대 노드가 JSON으로 응답하면
+        JSON을 그대로 사용합니다.
+
         Args:
             node: 노드 주소
             timeout: 요청 타임아웃 (초)
@@ -96,11 +101,15 @@ class Node:
         try:
             response = requests.get(
                 f'http://{node}/chain',
+                headers={'Accept': f'{MEDIA_TYPE}, application/json;q=0.9'},
                 timeout=timeout
             )
             if response.status_code == 200:
+                if response.headers.get('Content-Type') == MEDIA_TYPE:
+                    chain = decode_chain(response.content)
+                    return {'chain': chain, 'length': len(chain)}
                 return response.json()
-        except requests.RequestException:
+        except (requests.RequestException, ValueError):
             pass
         return None
 
@@ -7,9 +7,55 @@ SQLite를 사용하여 블록체인 데이터를 영구 저장합니다.
 
 import sqlite3
 import json
-from typing import List, Optional, Dict, Any
+import math
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Dict, Any, Set
 from datetime import datetime
 
+from .codec import decode_data, encode_data
+
+
+# blocks.data 컬럼 인코딩 방식
+DATA_ENCODINGS = ('json', 'binary')
+
+# 허용하는 PRAGMA 값
+JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+SYNCHRONOUS_LEVELS = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+# iter_blocks, iter_transactions_by_address의 기본 페이지 크기
+DEFAULT_BATCH_SIZE = 500
+
+# 한 쿼리에 바인딩하는 변수 최대 개수 (SQLite 기본 제한 999 이하)
+_MAX_SQL_VARIABLES = 900
+
+
+class _ConnectionHolder:
+    """스레드별 연결을 담는 객체 (스레드가 끝나면 수거되어 연결을 닫음)"""
+
+    __slots__ = ('conn', '__weakref__')
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+def _release_connection(conn: sqlite3.Connection, connections: Set[sqlite3.Connection],
+                        lock: threading.RLock) -> None:
+    """끝난 스레드의 연결을 닫고 목록에서 제거"""
+    with lock:
+        connections.discard(conn)
+    conn.close()
+
+# 블록 data에서 트랜잭션으로 간주하는 딕셔너리의 필수 키
+_TX_REQUIRED_KEYS = frozenset({'sender', 'recipient', 'amount', 'timestamp'})
+
+_INSERT_BLOCK_SQL = '''
+    INSERT OR REPLACE INTO blocks
+    (block_index, timestamp, data, previous_hash, nonce, hash, version, merkle_root)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
 
 class BlockchainStorage:
     """
@@ -17,127 +63,346 @@ class BlockchainStorage:
 
     블록과 트랜잭션을 영구 저장하고 조회하는 기능을 제공합니다.
 
+    스레드마다 연결을 하나씩 만들어 재사용합니다 (Flask threaded 모드 대응).
+    close()는 모든 스레드의 연결을 닫으며, 닫은 뒤 다시 사용하면 새 연결을
+    엽니다. with 문으로 사용하면 블록을 벗어날 때 close()가 호출됩니다.
+
     Attributes:
         db_path: SQLite 데이터베이스 파일 경로
+        data_encoding: 블록 data 저장 방식 ('json' 또는 'binary')
+        journal_mode: 저널 모드 (기본값 WAL - 읽기와 쓰기가 서로 막지 않음)
+        synchronous: PRAGMA synchronous 값
+        cache_size: PRAGMA cache_size 값 (음수면 KiB 단위)
+        mmap_size: PRAGMA mmap_size 값 (바이트, 0이면 사용 안 함)
     """
 
-    def __init__(self, db_path: str = "blockchain.db"):
+    def __init__(self, db_path: str = "blockchain.db", data_encoding: str = 'json',
+                 journal_mode: str = 'WAL', synchronous: str = 'NORMAL',
+                 cache_size: int = -16000, mmap_size: int = 64 * 1024 * 1024):
         """
         저장소 초기화
 
         Args:
             db_path: 데이터베이스 파일 경로
+            data_encoding: 'json'이면 TEXT, 'binary'면 codec 형식의 BLOB으로 저장.
+                읽을 때는 행마다 형식을 판별하므로 두 방식이 섞여 있어도 됩니다.
+            journal_mode: 저널 모드 (DELETE, WAL 등)
+            synchronous: 동기화 수준 (OFF, NORMAL, FULL, EXTRA)
+            cache_size: 연결당 페이지 캐시 크기
+            mmap_size: 연결당 메모리 맵 크기
+
+        Raises:
+            ValueError: 지원하지 않는 인코딩이나 PRAGMA 값일 때
         """
+        if data_encoding not in DATA_ENCODINGS:
+            raise ValueError(f"지원하지 않는 data 인코딩입니다: {data_encoding}")
+        if journal_mode.upper() not in JOURNAL_MODES:
+            raise ValueError(f"지원하지 않는 저널 모드입니다: {journal_mode}")
+        if synchronous.upper() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"지원하지 않는 synchronous 값입니다: {synchronous}")
+
         self.db_path = db_path
+        self.data_encoding = data_encoding
+        self.journal_mode = journal_mode.upper()
+        self.synchronous = synchronous.upper()
+        self.cache_size = int(cache_size)
+        self.mmap_size = int(mmap_size)
+
+        self._local = threading.local()
+        self._connections: Set[sqlite3.Connection] = set()
+        # 연결 정리(finalizer)가 잠금을 잡은 스레드에서 실행될 수 있으므로 재진입 가능
+        self._lock = threading.RLock()
         self._init_database()
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """데이터베이스 연결 반환"""
-        conn = sqlite3.connect(self.db_path)
+    def _connect(self) -> sqlite3.Connection:
+        """새 연결을 열고 PRAGMA 설정"""
+        # close()에서 다른 스레드의 연결도 닫을 수 있도록 스레드 검사를 끔
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        conn.execute(f'PRAGMA journal_mode = {self.journal_mode}')
+        conn.execute(f'PRAGMA synchronous = {self.synchronous}')
+        conn.execute(f'PRAGMA cache_size = {self.cache_size}')
+        conn.execute(f'PRAGMA mmap_size = {self.mmap_size}')
         return conn
 
-    def _init_database(self) -> None:
-        """데이터베이스 테이블 초기화"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        현재 스레드의 데이터베이스 연결 반환 (없으면 생성)
 
-        # 블록 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS blocks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                block_index INTEGER UNIQUE NOT NULL,
-                timestamp TEXT NOT NULL,
-                data TEXT NOT NULL,
-                previous_hash TEXT NOT NULL,
-                nonce INTEGER NOT NULL,
-                hash TEXT UNIQUE NOT NULL,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        스레드가 끝나면 threading.local의 holder가 수거되면서 연결도 닫히므로
+        요청마다 스레드를 만드는 서버에서도 열린 연결이 쌓이지 않습니다.
+        """
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            conn = self._connect()
+            holder = _ConnectionHolder(conn)
+            with self._lock:
+                self._connections.add(conn)
+            # storage 자체를 참조하지 않도록 연결 목록과 잠금만 넘김
+            weakref.finalize(holder, _release_connection, conn,
+                             self._connections, self._lock)
+            self._local.holder = holder
+        return holder.conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """쓰기 트랜잭션 (성공하면 커밋, 예외가 나면 롤백)"""
+        conn = self._get_connection()
+        try:
+            yield conn.cursor()
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
 
-        # 트랜잭션 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                block_index INTEGER,
-                sender TEXT NOT NULL,
-                recipient TEXT NOT NULL,
-                amount REAL NOT NULL,
-                timestamp TEXT NOT NULL,
-                signature TEXT,
-                sender_public_key TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (block_index) REFERENCES blocks(block_index)
+    def _init_database(self) -> None:
+        """데이터베이스 테이블 초기화"""
+        with self._transaction() as cursor:
+            # 블록 테이블
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS blocks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    block_index INTEGER UNIQUE NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    previous_hash TEXT NOT NULL,
+                    nonce INTEGER NOT NULL,
+                    hash TEXT UNIQUE NOT NULL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    version INTEGER NOT NULL DEFAULT 1,
+                    merkle_root TEXT
+                )
+            ''')
+
+            # 블록 형식 버전 컬럼이 없던 기존 DB에 추가 (기존 블록은 버전 1)
+            cursor.execute('PRAGMA table_info(blocks)')
+            if 'version' not in {row[1] for row in cursor.fetchall()}:
+                cursor.execute('ALTER TABLE blocks ADD COLUMN version INTEGER NOT NULL DEFAULT 1')
+                cursor.execute('ALTER TABLE blocks ADD COLUMN merkle_root TEXT')
+
+            # 트랜잭션 테이블
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS transactions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    block_index INTEGER,
+                    sender TEXT NOT NULL,
+                    recipient TEXT NOT NULL,
+                    amount REAL NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    signature TEXT,
+                    sender_public_key TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    fee REAL NOT NULL DEFAULT 0,
+                    FOREIGN KEY (block_index) REFERENCES blocks(block_index)
+                )
+            ''')
+
+            # 펜딩 트랜잭션 테이블 (아직 블록에 포함되지 않은 트랜잭션)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS pending_transactions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    sender TEXT NOT NULL,
+                    recipient TEXT NOT NULL,
+                    amount REAL NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    signature TEXT,
+                    sender_public_key TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    fee REAL NOT NULL DEFAULT 0
+                )
+            ''')
+
+            # 수수료 컬럼이 없던 기존 DB에 추가 (기존 트랜잭션은 수수료 0)
+            for table in ('transactions', 'pending_transactions'):
+                cursor.execute(f'PRAGMA table_info({table})')
+                if 'fee' not in {row[1] for row in cursor.fetchall()}:
+                    cursor.execute(f'ALTER TABLE {table} ADD COLUMN fee REAL NOT NULL DEFAULT 0')
+
+            # 메타데이터 테이블
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS metadata (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            ''')
+
+            # 잔액 테이블 (transactions 변경 시 트리거로 같은 트랜잭션 안에서 갱신)
+            # 발신자는 금액과 수수료를 부담하며, 정의가 바뀔 수 있으므로 트리거는 다시 생성
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'balances'"
             )
-        ''')
+            balances_missing = cursor.fetchone() is None
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS balances (
+                    address TEXT PRIMARY KEY,
+                    balance REAL NOT NULL DEFAULT 0
+                )
+            ''')
+            cursor.execute('DROP TRIGGER IF EXISTS trg_balances_insert')
+            cursor.execute('DROP TRIGGER IF EXISTS trg_balances_delete')
+            cursor.execute('''
+                CREATE TRIGGER trg_balances_insert
+                AFTER INSERT ON transactions
+                BEGIN
+                    INSERT INTO balances (address, balance) VALUES (NEW.recipient, NEW.amount)
+                    ON CONFLICT(address) DO UPDATE SET balance = balance + NEW.amount;
+                    INSERT INTO balances (address, balance) VALUES (NEW.sender, -NEW.amount - NEW.fee)
+                    ON CONFLICT(address) DO UPDATE SET balance = balance - NEW.amount - NEW.fee;
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER trg_balances_delete
+                AFTER DELETE ON transactions
+                BEGIN
+                    UPDATE balances SET balance = balance - OLD.amount
+                    WHERE address = OLD.recipient;
+                    UPDATE balances SET balance = balance + OLD.amount + OLD.fee
+                    WHERE address = OLD.sender;
+                END
+            ''')
+            # 잔액 테이블이 없던 기존 DB는 트랜잭션 기록으로 채움
+            if balances_missing:
+                self._rebuild_balances(cursor)
+
+            # 인덱스 생성
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_blocks_hash ON blocks(hash)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_blocks_index ON blocks(block_index)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_tx_block ON transactions(block_index)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_tx_sender ON transactions(sender)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_tx_recipient ON transactions(recipient)')
 
-        # 펜딩 트랜잭션 테이블 (아직 블록에 포함되지 않은 트랜잭션)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS pending_transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                sender TEXT NOT NULL,
-                recipient TEXT NOT NULL,
-                amount REAL NOT NULL,
-                timestamp TEXT NOT NULL,
-                signature TEXT,
-                sender_public_key TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+    def save_block(self, block_data: Dict[str, Any]) -> int:
+        """
+        블록 저장
 
-        # 메타데이터 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS metadata (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            )
-        ''')
+        Args:
+            block_data: 블록 딕셔너리 데이터
 
-        # 인덱스 생성
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_blocks_hash ON blocks(hash)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_blocks_index ON blocks(block_index)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_tx_block ON transactions(block_index)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_tx_sender ON transactions(sender)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_tx_recipient ON transactions(recipient)')
+        Returns:
+            저장된 블록의 ID
+        """
+        with self._transaction() as cursor:
+            cursor.execute(_INSERT_BLOCK_SQL, self._block_row(block_data))
+            block_id = cursor.lastrowid
 
-        conn.commit()
-        conn.close()
+        return block_id
 
-    def save_block(self, block_data: Dict[str, Any]) -> int:
+    def save_block_with_transactions(self, block_data: Dict[str, Any],
+                                     transactions: Optional[List[Dict[str, Any]]] = None,
+                                     clear_pending: bool = True) -> int:
         """
-        블록 저장
+        블록과 그 트랜잭션을 하나의 DB 트랜잭션으로 저장
+
+        블록 행, 트랜잭션 행(executemany), 펜딩 풀 정리를 한 번에 커밋하므로
+        중간에 실패해도 일부만 저장되지 않습니다. 같은 인덱스의 블록이 이미
+        있으면 블록과 트랜잭션 행을 함께 교체합니다.
 
         Args:
             block_data: 블록 딕셔너리 데이터
+            transactions: 저장할 트랜잭션 (없으면 block_data['data']에서 추출)
+            clear_pending: 블록에 포함된 트랜잭션을 펜딩 테이블에서 삭제할지 여부
 
         Returns:
             저장된 블록의 ID
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        if transactions is None:
+            transactions = self._block_transactions(block_data)
+
+        with self._transaction() as cursor:
+            cursor.execute(_INSERT_BLOCK_SQL, self._block_row(block_data))
+            block_id = cursor.lastrowid
+            self._replace_block_transactions(
+                cursor, [(block_data['index'], transactions)], clear_pending
+            )
 
-        # data 필드는 JSON으로 직렬화
-        data_json = json.dumps(block_data['data'], ensure_ascii=False)
+        return block_id
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO blocks
-            (block_index, timestamp, data, previous_hash, nonce, hash)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
+    def save_blocks(self, blocks: List[Dict[str, Any]], clear_pending: bool = True) -> int:
+        """
+        여러 블록과 각 블록의 트랜잭션을 하나의 DB 트랜잭션으로 저장
+
+        트랜잭션은 각 블록의 data에서 추출합니다 (save_block_with_transactions 참고).
+
+        Args:
+            blocks: 블록 딕셔너리 리스트
+            clear_pending: 블록에 포함된 트랜잭션을 펜딩 테이블에서 삭제할지 여부
+
+        Returns:
+            저장된 블록 수
+        """
+        with self._transaction() as cursor:
+            cursor.executemany(
+                _INSERT_BLOCK_SQL, [self._block_row(block) for block in blocks]
+            )
+            self._replace_block_transactions(
+                cursor,
+                [(block['index'], self._block_transactions(block)) for block in blocks],
+                clear_pending
+            )
+
+        return len(blocks)
+
+    def _block_row(self, block_data: Dict[str, Any]) -> tuple:
+        """blocks 테이블 행 값"""
+        return (
             block_data['index'],
             block_data['timestamp'],
-            data_json,
+            self._encode_data(block_data['data']),
             block_data['previous_hash'],
             block_data['nonce'],
-            block_data['hash']
-        ))
+            block_data['hash'],
+            block_data.get('version', 1),
+            block_data.get('merkle_root')
+        )
 
-        block_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+    @staticmethod
+    def _block_transactions(block_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """블록 data에서 트랜잭션 딕셔너리만 추출"""
+        data = block_data['data']
+        if not isinstance(data, list):
+            return []
+        return [
+            item for item in data
+            if isinstance(item, dict) and _TX_REQUIRED_KEYS <= item.keys()
+        ]
+
+    @staticmethod
+    def _replace_block_transactions(cursor: sqlite3.Cursor,
+                                    block_transactions: List[tuple],
+                                    clear_pending: bool) -> None:
+        """
+        블록별 트랜잭션 행을 교체하고 펜딩 풀을 정리
 
-        return block_id
+        Args:
+            cursor: 진행 중인 트랜잭션의 커서
+            block_transactions: (블록 인덱스, 트랜잭션 리스트) 리스트
+            clear_pending: 펜딩 테이블 정리 여부
+        """
+        cursor.executemany(
+            'DELETE FROM transactions WHERE block_index = ?',
+            [(block_index,) for block_index, _ in block_transactions]
+        )
+        cursor.executemany('''
+            INSERT INTO transactions
+            (block_index, sender, recipient, amount, timestamp, signature, sender_public_key, fee)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (block_index, tx['sender'], tx['recipient'], tx['amount'], tx['timestamp'],
+             tx.get('signature'), tx.get('sender_public_key'), tx.get('fee', 0))
+            for block_index, transactions in block_transactions
+            for tx in transactions
+        ])
+
+        if clear_pending:
+            # 트랜잭션 해시(txid)를 결정하는 필드가 같은 펜딩 트랜잭션 삭제
+            cursor.executemany('''
+                DELETE FROM pending_transactions
+                WHERE sender = ? AND recipient = ? AND amount = ? AND timestamp = ? AND fee = ?
+            ''', [
+                (tx['sender'], tx['recipient'], tx['amount'], tx['timestamp'], tx.get('fee', 0))
+                for _, transactions in block_transactions
+                for tx in transactions
+            ])
 
     def get_block(self, block_index: int) -> Optional[Dict[str, Any]]:
         """
@@ -149,15 +414,12 @@ class BlockchainStorage:
         Returns:
             블록 딕셔너리 또는 None
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
+        cursor = self._get_connection().cursor()
         cursor.execute(
             'SELECT * FROM blocks WHERE block_index = ?',
             (block_index,)
         )
         row = cursor.fetchone()
-        conn.close()
 
         if row:
             return self._row_to_block_dict(row)
@@ -173,15 +435,12 @@ class BlockchainStorage:
         Returns:
             블록 딕셔너리 또는 None
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
+        cursor = self._get_connection().cursor()
         cursor.execute(
             'SELECT * FROM blocks WHERE hash = ?',
             (block_hash,)
         )
         row = cursor.fetchone()
-        conn.close()
 
         if row:
             return self._row_to_block_dict(row)
@@ -194,14 +453,49 @@ class BlockchainStorage:
         Returns:
             블록 딕셔너리 리스트
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return list(self.iter_blocks())
 
-        cursor.execute('SELECT * FROM blocks ORDER BY block_index ASC')
-        rows = cursor.fetchall()
-        conn.close()
+    def iter_blocks(self, start: int = 0, end: Optional[int] = None,
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        블록을 인덱스 순으로 하나씩 반환하는 제너레이터
+
+        block_index를 기준으로 한 키셋 페이지네이션으로 batch_size개씩 읽으므로
+        체인 크기와 관계없이 메모리 사용량이 페이지 크기로 제한됩니다.
+        페이지 사이에는 읽기 커서를 열어 두지 않습니다.
+
+        Args:
+            start: 시작 블록 인덱스 (포함)
+            end: 끝 블록 인덱스 (제외, None이면 마지막 블록까지)
+            batch_size: 한 번에 읽는 블록 수
+
+        Yields:
+            블록 딕셔너리
 
-        return [self._row_to_block_dict(row) for row in rows]
+        Raises:
+            ValueError: batch_size가 0 이하인 경우
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size는 0보다 커야 합니다.")
+
+        upper = end if end is not None else -1
+        while True:
+            cursor = self._get_connection().cursor()
+            cursor.execute('''
+                SELECT * FROM blocks
+                WHERE block_index >= ? AND (? < 0 OR block_index < ?)
+                ORDER BY block_index ASC
+                LIMIT ?
+            ''', (start, upper, upper, batch_size))
+            rows = cursor.fetchmany(batch_size)
+            cursor.close()
+
+            for row in rows:
+                yield self._row_to_block_dict(row)
+
+            if len(rows) < batch_size:
+                return
+            start = rows[-1]['block_index'] + 1
 
     def get_latest_block(self) -> Optional[Dict[str, Any]]:
         """
@@ -210,12 +504,9 @@ class BlockchainStorage:
         Returns:
             최신 블록 딕셔너리 또는 None
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
+        cursor = self._get_connection().cursor()
         cursor.execute('SELECT * FROM blocks ORDER BY block_index DESC LIMIT 1')
         row = cursor.fetchone()
-        conn.close()
 
         if row:
             return self._row_to_block_dict(row)
@@ -228,25 +519,39 @@ class BlockchainStorage:
         Returns:
             블록 수
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
+        cursor = self._get_connection().cursor()
         cursor.execute('SELECT COUNT(*) FROM blocks')
         count = cursor.fetchone()[0]
-        conn.close()
 
         return count
 
+    def _encode_data(self, data: Any) -> Any:
+        """블록 data를 저장 형식으로 변환 (JSON 문자열 또는 바이너리 BLOB)"""
+        if self.data_encoding == 'binary':
+            return encode_data(data)
+        return json.dumps(data, ensure_ascii=False)
+
+    @staticmethod
+    def _decode_data(value: Any) -> Any:
+        """data 컬럼 값을 복원 (BLOB이면 바이너리, 아니면 JSON)"""
+        if isinstance(value, bytes):
+            return decode_data(value)
+        return json.loads(value)
+
     def _row_to_block_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
-        """DB 행을 블록 딕셔너리로 변환"""
-        return {
+        """DB 행을 블록 딕셔너리로 변환 (버전 2 이상이면 version, merkle_root 포함)"""
+        result = {
             'index': row['block_index'],
             'timestamp': row['timestamp'],
-            'data': json.loads(row['data']),
+            'data': self._decode_data(row['data']),
             'previous_hash': row['previous_hash'],
             'nonce': row['nonce'],
             'hash': row['hash']
         }
+        if row['version'] != 1:
+            result['version'] = row['version']
+            result['merkle_root'] = row['merkle_root']
+        return result
 
     def save_transaction(self, tx_data: Dict[str, Any], block_index: Optional[int] = None) -> int:
         """
@@ -259,41 +564,40 @@ class BlockchainStorage:
         Returns:
             저장된 트랜잭션 ID
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        if block_index is not None:
-            cursor.execute('''
-                INSERT INTO transactions
-                (block_index, sender, recipient, amount, timestamp, signature, sender_public_key)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                block_index,
-                tx_data['sender'],
-                tx_data['recipient'],
-                tx_data['amount'],
-                tx_data['timestamp'],
-                tx_data.get('signature'),
-                tx_data.get('sender_public_key')
-            ))
-        else:
-            # 펜딩 트랜잭션
-            cursor.execute('''
-                INSERT INTO pending_transactions
-                (sender, recipient, amount, timestamp, signature, sender_public_key)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                tx_data['sender'],
-                tx_data['recipient'],
-                tx_data['amount'],
-                tx_data['timestamp'],
-                tx_data.get('signature'),
-                tx_data.get('sender_public_key')
-            ))
-
-        tx_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with self._transaction() as cursor:
+            if block_index is not None:
+                cursor.execute('''
+                    INSERT INTO transactions
+                    (block_index, sender, recipient, amount, timestamp, signature, sender_public_key,
+                     fee)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    block_index,
+                    tx_data['sender'],
+                    tx_data['recipient'],
+                    tx_data['amount'],
+                    tx_data['timestamp'],
+                    tx_data.get('signature'),
+                    tx_data.get('sender_public_key'),
+                    tx_data.get('fee', 0)
+                ))
+            else:
+                # 펜딩 트랜잭션
+                cursor.execute('''
+                    INSERT INTO pending_transactions
+                    (sender, recipient, amount, timestamp, signature, sender_public_key, fee)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    tx_data['sender'],
+                    tx_data['recipient'],
+                    tx_data['amount'],
+                    tx_data['timestamp'],
+                    tx_data.get('signature'),
+                    tx_data.get('sender_public_key'),
+                    tx_data.get('fee', 0)
+                ))
+
+            tx_id = cursor.lastrowid
 
         return tx_id
 
@@ -307,15 +611,12 @@ class BlockchainStorage:
         Returns:
             트랜잭션 딕셔너리 리스트
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
+        cursor = self._get_connection().cursor()
         cursor.execute(
             'SELECT * FROM transactions WHERE block_index = ?',
             (block_index,)
         )
         rows = cursor.fetchall()
-        conn.close()
 
         return [self._row_to_tx_dict(row) for row in rows]
 
@@ -329,19 +630,70 @@ class BlockchainStorage:
         Returns:
             트랜잭션 딕셔너리 리스트
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
+        cursor = self._get_connection().cursor()
         cursor.execute('''
             SELECT * FROM transactions
             WHERE sender = ? OR recipient = ?
             ORDER BY timestamp ASC
         ''', (address, address))
         rows = cursor.fetchall()
-        conn.close()
 
         return [self._row_to_tx_dict(row) for row in rows]
 
+    def iter_transactions_by_address(self, address: str, after: int = 0,
+                                     batch_size: int = DEFAULT_BATCH_SIZE
+                                     ) -> Iterator[Dict[str, Any]]:
+        """
+        주소와 관련된 트랜잭션을 저장 순서대로 하나씩 반환하는 제너레이터
+
+        트랜잭션 id를 기준으로 한 키셋 페이지네이션을 사용합니다.
+        반환하는 딕셔너리에는 'id'가 포함되며, 마지막으로 받은 id를
+        after로 넘기면 그 다음부터 이어서 조회할 수 있습니다.
+
+        Args:
+            address: 지갑 주소
+            after: 이 id 다음의 트랜잭션부터 조회
+            batch_size: 한 번에 읽는 트랜잭션 수
+
+        Yields:
+            트랜잭션 딕셔너리 ('id' 포함)
+
+        Raises:
+            ValueError: batch_size가 0 이하인 경우
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size는 0보다 커야 합니다.")
+
+        while True:
+            cursor = self._get_connection().cursor()
+            # sender, recipient 인덱스를 각각 id 순으로 읽어 페이지 크기만큼만 합침
+            cursor.execute('''
+                SELECT * FROM transactions WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id FROM transactions WHERE sender = ? AND id > ?
+                        ORDER BY id LIMIT ?
+                    )
+                    UNION
+                    SELECT id FROM (
+                        SELECT id FROM transactions WHERE recipient = ? AND id > ?
+                        ORDER BY id LIMIT ?
+                    )
+                )
+                ORDER BY id ASC
+                LIMIT ?
+            ''', (address, after, batch_size, address, after, batch_size, batch_size))
+            rows = cursor.fetchmany(batch_size)
+            cursor.close()
+
+            for row in rows:
+                tx = self._row_to_tx_dict(row)
+                tx['id'] = row['id']
+                yield tx
+
+            if len(rows) < batch_size:
+                return
+            after = rows[-1]['id']
+
     def get_pending_transactions(self) -> List[Dict[str, Any]]:
         """
         펜딩 트랜잭션 조회
@@ -349,12 +701,9 @@ class BlockchainStorage:
         Returns:
             펜딩 트랜잭션 리스트
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
+        cursor = self._get_connection().cursor()
         cursor.execute('SELECT * FROM pending_transactions ORDER BY created_at ASC')
         rows = cursor.fetchall()
-        conn.close()
 
         return [self._row_to_pending_tx_dict(row) for row in rows]
 
@@ -365,15 +714,11 @@ class BlockchainStorage:
         Returns:
             삭제된 트랜잭션 수
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT COUNT(*) FROM pending_transactions')
-        count = cursor.fetchone()[0]
+        with self._transaction() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM pending_transactions')
+            count = cursor.fetchone()[0]
 
-        cursor.execute('DELETE FROM pending_transactions')
-        conn.commit()
-        conn.close()
+            cursor.execute('DELETE FROM pending_transactions')
 
         return count
 
@@ -386,6 +731,8 @@ class BlockchainStorage:
             'timestamp': row['timestamp'],
             'block_index': row['block_index']
         }
+        if row['fee']:
+            result['fee'] = row['fee']
         if row['signature']:
             result['signature'] = row['signature']
         if row['sender_public_key']:
@@ -400,6 +747,8 @@ class BlockchainStorage:
             'amount': row['amount'],
             'timestamp': row['timestamp']
         }
+        if row['fee']:
+            result['fee'] = row['fee']
         if row['signature']:
             result['signature'] = row['signature']
         if row['sender_public_key']:
@@ -408,7 +757,10 @@ class BlockchainStorage:
 
     def get_balance(self, address: str) -> float:
         """
-        주소의 잔액 계산
+        주소의 잔액 조회
+
+        트랜잭션 저장/삭제 시 함께 갱신되는 balances 테이블을 조회하므로
+        기록 크기와 관계없이 일정한 시간이 걸립니다.
 
         Args:
             address: 지갑 주소
@@ -416,8 +768,50 @@ class BlockchainStorage:
         Returns:
             잔액
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        cursor = self._get_connection().cursor()
+        cursor.execute('SELECT balance FROM balances WHERE address = ?', (address,))
+        row = cursor.fetchone()
+        return row[0] if row else 0
+
+    def get_balances(self, addresses: List[str]) -> Dict[str, float]:
+        """
+        여러 주소의 잔액을 한 번에 조회
+
+        Args:
+            addresses: 지갑 주소 리스트
+
+        Returns:
+            주소별 잔액 (기록이 없는 주소는 0)
+        """
+        unique = list(dict.fromkeys(addresses))
+        balances = {address: 0 for address in unique}
+        cursor = self._get_connection().cursor()
+
+        # SQLite 바인딩 변수 개수 제한을 넘지 않도록 나누어 조회
+        for start in range(0, len(unique), _MAX_SQL_VARIABLES):
+            chunk = unique[start:start + _MAX_SQL_VARIABLES]
+            placeholders = ', '.join('?' * len(chunk))
+            cursor.execute(
+                f'SELECT address, balance FROM balances WHERE address IN ({placeholders})',
+                chunk
+            )
+            balances.update((row[0], row[1]) for row in cursor.fetchall())
+
+        return balances
+
+    def scan_balance(self, address: str) -> float:
+        """
+        transactions 테이블을 집계하여 주소의 잔액 계산
+
+        balances 테이블의 검증용이며 O(기록 크기)입니다.
+
+        Args:
+            address: 지갑 주소
+
+        Returns:
+            잔액
+        """
+        cursor = self._get_connection().cursor()
 
         # 받은 금액
         cursor.execute(
@@ -428,15 +822,65 @@ class BlockchainStorage:
 
         # 보낸 금액
         cursor.execute(
-            'SELECT COALESCE(SUM(amount), 0) FROM transactions WHERE sender = ?',
+            'SELECT COALESCE(SUM(amount + fee), 0) FROM transactions WHERE sender = ?',
             (address,)
         )
         sent = cursor.fetchone()[0]
 
-        conn.close()
-
         return received - sent
 
+    @staticmethod
+    def _rebuild_balances(cursor: sqlite3.Cursor) -> None:
+        """진행 중인 트랜잭션 안에서 balances 테이블을 다시 계산"""
+        cursor.execute('DELETE FROM balances')
+        cursor.execute('''
+            INSERT INTO balances (address, balance)
+            SELECT address, SUM(delta) FROM (
+                SELECT recipient AS address, amount AS delta FROM transactions
+                UNION ALL
+                SELECT sender AS address, -amount - fee AS delta FROM transactions
+            )
+            GROUP BY address
+        ''')
+
+    def rebuild_balances(self) -> int:
+        """
+        transactions 테이블로부터 balances 테이블을 다시 만듭니다.
+
+        Returns:
+            잔액이 기록된 주소 수
+        """
+        with self._transaction() as cursor:
+            self._rebuild_balances(cursor)
+            cursor.execute('SELECT COUNT(*) FROM balances')
+            return cursor.fetchone()[0]
+
+    def verify_balances(self) -> bool:
+        """
+        balances 테이블이 transactions 집계 결과와 일치하는지 확인합니다.
+
+        Returns:
+            모든 주소의 잔액이 일치하면 True (부동소수점 오차 허용)
+        """
+        cursor = self._get_connection().cursor()
+        cursor.execute('''
+            SELECT address, SUM(delta) FROM (
+                SELECT recipient AS address, amount AS delta FROM transactions
+                UNION ALL
+                SELECT sender AS address, -amount - fee AS delta FROM transactions
+            )
+            GROUP BY address
+        ''')
+        expected = {row[0]: row[1] for row in cursor.fetchall()}
+        cursor.execute('SELECT address, balance FROM balances')
+        actual = {row[0]: row[1] for row in cursor.fetchall()}
+
+        for address in expected.keys() | actual.keys():
+            if not math.isclose(expected.get(address, 0), actual.get(address, 0),
+                                rel_tol=1e-9, abs_tol=1e-9):
+                return False
+        return True
+
     def set_metadata(self, key: str, value: str) -> None:
         """
         메타데이터 저장
@@ -445,15 +889,10 @@ class BlockchainStorage:
             key: 키
             value: 값
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)
-        ''', (key, value))
-
-        conn.commit()
-        conn.close()
+        with self._transaction() as cursor:
+            cursor.execute('''
+                INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)
+            ''', (key, value))
 
     def get_metadata(self, key: str) -> Optional[str]:
         """
@@ -465,12 +904,9 @@ class BlockchainStorage:
         Returns:
             값 또는 None
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
+        cursor = self._get_connection().cursor()
         cursor.execute('SELECT value FROM metadata WHERE key = ?', (key,))
         row = cursor.fetchone()
-        conn.close()
 
         if row:
             return row[0]
@@ -478,17 +914,27 @@ class BlockchainStorage:
 
     def clear_all(self) -> None:
         """모든 데이터 삭제 (주의!)"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('DELETE FROM transactions')
-        cursor.execute('DELETE FROM pending_transactions')
-        cursor.execute('DELETE FROM blocks')
-        cursor.execute('DELETE FROM metadata')
-
-        conn.commit()
-        conn.close()
+        with self._transaction() as cursor:
+            cursor.execute('DELETE FROM transactions')
+            cursor.execute('DELETE FROM balances')
+            cursor.execute('DELETE FROM pending_transactions')
+            cursor.execute('DELETE FROM blocks')
+            cursor.execute('DELETE FROM metadata')
 
     def close(self) -> None:
-        """리소스 정리 (현재는 연결 풀을 사용하지 않으므로 no-op)"""
-        pass
+        """모든 스레드의 연결 닫기 (이후 호출 시 새 연결을 엶)"""
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+            # 다른 스레드의 threading.local도 무효화되도록 새 객체로 교체
+            old_local, self._local = self._local, threading.local()
+        for conn in connections:
+            conn.close()
+        # 이전 holder들의 finalizer는 잠금 밖에서 실행
+        del old_local
+
+    def __enter__(self) -> 'BlockchainStorage':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
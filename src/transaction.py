@@ -9,27 +9,41 @@ ECDSA 서명을 통한 트랜잭션 인증을 지원합니다.
 
 import hashlib
 import json
+import multiprocessing
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+
+from .crypto_utils import hex_to_int, verify_signatures_batch
 
 if TYPE_CHECKING:
     from .wallet import Wallet
 
 
+# 트랜잭션 해시(서명 대상)에 포함되는 필드
+_HASHED_FIELDS = frozenset({'sender', 'recipient', 'amount', 'fee', 'timestamp'})
+
+
 class Transaction:
     """
     블록체인의 트랜잭션(거래)을 나타내는 클래스
 
+    정규 직렬화 바이트와 해시는 처음 요청될 때 한 번만 계산하여 보관하며,
+    해시 대상 필드가 다시 할당될 때만 무효화됩니다.
+
     Attributes:
         sender: 보내는 사람의 주소
         recipient: 받는 사람의 주소
         amount: 거래 금액
+        fee: 채굴자에게 주는 수수료 (0이면 직렬화와 해시에서 생략)
         timestamp: 트랜잭션 생성 시간
         signature: ECDSA 서명 (선택적)
         sender_public_key: 발신자 공개키 (선택적)
     """
 
-    def __init__(self, sender: str, recipient: str, amount: float):
+    __slots__ = ('sender', 'recipient', 'amount', 'fee', 'timestamp',
+                 'signature', 'sender_public_key', '_canonical', '_hash')
+
+    def __init__(self, sender: str, recipient: str, amount: float, fee: float = 0):
         """
         새 트랜잭션을 생성합니다.
 
@@ -37,29 +51,66 @@ class Transaction:
             sender: 보내는 주소 (시스템 보상의 경우 "SYSTEM")
             recipient: 받는 주소
             amount: 전송할 금액
+            fee: 수수료 (기본값: 0, 발신자가 금액과 별도로 부담)
         """
         self.sender = sender
         self.recipient = recipient
         self.amount = amount
+        self.fee = fee
         self.timestamp = datetime.now().isoformat()
         self.signature: Optional[str] = None
         self.sender_public_key: Optional[str] = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """해시 대상 필드가 바뀌면 캐시된 직렬화 결과와 해시를 무효화합니다."""
+        if name in _HASHED_FIELDS:
+            object.__setattr__(self, '_canonical', None)
+            object.__setattr__(self, '_hash', None)
+        object.__setattr__(self, name, value)
+
+    def canonical_bytes(self) -> bytes:
+        """
+        해시 대상 필드의 정규 직렬화 바이트 (캐시됨)
+
+        수수료가 0이면 fee 키를 넣지 않으므로 수수료가 없던 트랜잭션의
+        해시와 서명은 그대로 유효합니다.
+
+        Returns:
+            키를 정렬한 JSON의 UTF-8 바이트
+        """
+        if self._canonical is None:
+            tx_data = {
+                'sender': self.sender,
+                'recipient': self.recipient,
+                'amount': self.amount,
+                'timestamp': self.timestamp
+            }
+            if self.fee:
+                tx_data['fee'] = self.fee
+            tx_string = json.dumps(tx_data, sort_keys=True, ensure_ascii=False)
+            object.__setattr__(self, '_canonical', tx_string.encode('utf-8'))
+        return self._canonical
+
     def get_hash(self) -> str:
         """
-        트랜잭션 해시 계산 (서명 대상)
+        트랜잭션 해시 계산 (서명 대상, 캐시됨)
 
         Returns:
             트랜잭션 해시 문자열
         """
-        tx_data = {
-            'sender': self.sender,
-            'recipient': self.recipient,
-            'amount': self.amount,
-            'timestamp': self.timestamp
-        }
-        tx_string = json.dumps(tx_data, sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(tx_string.encode('utf-8')).hexdigest()
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hashlib.sha256(self.canonical_bytes()).hexdigest())
+        return self._hash
+
+    @property
+    def txid(self) -> str:
+        """
+        트랜잭션 ID (get_hash()와 같은 값)
+
+        서명과 무관하므로 서명 전후로 변하지 않습니다.
+        중복 제거나 조회 키로 사용합니다.
+        """
+        return self.get_hash()
 
     def sign(self, wallet: 'Wallet') -> None:
         """
@@ -112,12 +163,32 @@ class Transaction:
             'amount': self.amount,
             'timestamp': self.timestamp
         }
+        if self.fee:
+            result['fee'] = self.fee
         if self.signature:
             result['signature'] = self.signature
         if self.sender_public_key:
             result['sender_public_key'] = self.sender_public_key
         return result
 
+    @classmethod
+    def from_dict(cls, tx_data: Dict[str, Any]) -> 'Transaction':
+        """
+        딕셔너리로부터 트랜잭션을 복원합니다.
+
+        Args:
+            tx_data: to_dict() 형식의 딕셔너리
+
+        Returns:
+            복원된 트랜잭션 (timestamp, 서명 포함)
+        """
+        tx = cls(tx_data['sender'], tx_data['recipient'], tx_data['amount'],
+                 tx_data.get('fee', 0))
+        tx.timestamp = tx_data['timestamp']
+        tx.signature = tx_data.get('signature')
+        tx.sender_public_key = tx_data.get('sender_public_key')
+        return tx
+
     def is_valid(self) -> bool:
         """
         트랜잭션의 유효성을 검사합니다.
@@ -130,6 +201,8 @@ class Transaction:
             return False
         if self.amount <= 0:
             return False
+        if self.fee < 0:
+            return False
         # 자기 자신에게 보내는 것 금지 (시스템 보상 제외)
         if self.sender != "SYSTEM" and self.sender == self.recipient:
             return False
@@ -142,8 +215,92 @@ class Transaction:
             f"  From: {self.sender}\n"
             f"  To: {self.recipient}\n"
             f"  Amount: {self.amount}\n"
-            f"  Time: {self.timestamp}"
+            + (f"  Fee: {self.fee}\n" if self.fee else "")
+            + f"  Time: {self.timestamp}"
         )
 
     def __repr__(self) -> str:
         return f"Transaction({self.sender} -> {self.recipient}: {self.amount})"
+
+
+# verify_batch에서 워커로 보내는 검증 항목: (입력 위치, 공개키, 메시지, 서명)
+_VerifyItem = Tuple[int, Tuple[int, int], str, Tuple[int, int]]
+
+
+def _verify_items(items: List[_VerifyItem]) -> List[Tuple[int, bool]]:
+    """검증 항목 묶음을 검증하여 (입력 위치, 결과) 리스트 반환"""
+    results = verify_signatures_batch([(pk, msg, sig) for _, pk, msg, sig in items])
+    return [(item[0], result) for item, result in zip(items, results)]
+
+
+def verify_batch(transactions: Sequence[Union[Transaction, Dict[str, Any]]],
+                 processes: Optional[int] = None) -> List[bool]:
+    """
+    여러 트랜잭션의 서명을 한 번에 검증합니다.
+
+    공개키 16진수는 한 번만 파싱하고, 같은 공개키의 서명은 다중 스칼라
+    곱셈 테이블을 공유합니다. processes가 2 이상이면 공개키 단위로 묶어
+    프로세스 풀에 나누어 검증합니다. 블록 전체(to_dict 리스트)나 펜딩
+    트랜잭션 목록을 그대로 넘길 수 있습니다.
+
+    Args:
+        transactions: Transaction 객체 또는 트랜잭션 딕셔너리 시퀀스
+        processes: 워커 프로세스 수 (None 또는 1이면 현재 프로세스에서 검증)
+
+    Returns:
+        각 트랜잭션의 검증 결과 리스트 (입력 순서와 동일,
+        Transaction.verify_signature와 같은 의미)
+    """
+    results = [False] * len(transactions)
+    parsed_keys: Dict[str, Optional[Tuple[int, int]]] = {}
+    groups: Dict[Tuple[int, int], List[_VerifyItem]] = {}
+
+    for position, tx in enumerate(transactions):
+        if isinstance(tx, dict):
+            try:
+                tx = Transaction.from_dict(tx)
+            except KeyError:
+                continue
+
+        # 시스템 트랜잭션은 서명 불필요
+        if tx.sender == "SYSTEM":
+            results[position] = True
+            continue
+
+        # 서명이 없으면 무효
+        if not tx.signature or not tx.sender_public_key:
+            continue
+
+        key_hex = tx.sender_public_key
+        if key_hex not in parsed_keys:
+            try:
+                parsed_keys[key_hex] = (hex_to_int(key_hex[:64]), hex_to_int(key_hex[64:]))
+            except ValueError:
+                parsed_keys[key_hex] = None
+        public_key = parsed_keys[key_hex]
+
+        try:
+            signature = (hex_to_int(tx.signature[:64]), hex_to_int(tx.signature[64:]))
+        except ValueError:
+            continue
+        if public_key is None:
+            continue
+
+        groups.setdefault(public_key, []).append(
+            (position, public_key, tx.get_hash(), signature)
+        )
+
+    if processes is not None and processes > 1 and len(groups) > 1:
+        # 같은 공개키의 항목이 같은 워커에 가도록 공개키 단위로 분배
+        chunks: List[List[_VerifyItem]] = [[] for _ in range(processes)]
+        for group in sorted(groups.values(), key=len, reverse=True):
+            min(chunks, key=len).extend(group)
+        with multiprocessing.get_context().Pool(processes=processes) as pool:
+            chunk_results = pool.map(_verify_items, [c for c in chunks if c])
+    else:
+        chunk_results = [_verify_items([item for group in groups.values() for item in group])]
+
+    for chunk in chunk_results:
+        for position, valid in chunk:
+            results[position] = valid
+    return results
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+병렬 체인 검증 모듈
+
+체인을 구간(shard)으로 나누어 워커 프로세스에서 해시, 작업 증명,
+구간 내부 연결, ECDSA 서명을 검증합니다. 구간 경계의 연결은
+부모 프로세스에서 확인합니다.
+"""
+
+import multiprocessing
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .block import Block
+from .transaction import verify_batch
+
+
+# (블록 위치, 사유) - 구간 검증 실패 정보
+_Failure = Tuple[int, str]
+
+
+class ValidationResult:
+    """
+    체인 검증 결과
+
+    Attributes:
+        valid: 체인이 유효하면 True
+        index: 처음으로 무효한 블록의 위치 (유효하면 None)
+        reason: 무효 사유 (유효하면 None)
+    """
+
+    def __init__(self, valid: bool, index: Optional[int] = None,
+                 reason: Optional[str] = None):
+        self.valid = valid
+        self.index = index
+        self.reason = reason
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+    def __repr__(self) -> str:
+        if self.valid:
+            return "ValidationResult(valid=True)"
+        return f"ValidationResult(valid=False, index={self.index}, reason={self.reason!r})"
+
+
+def _check_signatures(block: Block, require_signatures: bool) -> Optional[str]:
+    """블록 안 트랜잭션 서명을 일괄 검증 (실패 시 사유 반환)"""
+    if not isinstance(block.data, list):
+        return None
+
+    signed = [
+        (tx_position, tx_data) for tx_position, tx_data in enumerate(block.data)
+        if isinstance(tx_data, dict) and tx_data.get('sender') != "SYSTEM"
+        and (tx_data.get('signature') or require_signatures)
+    ]
+    results = verify_batch([tx_data for _, tx_data in signed])
+
+    for (tx_position, _), valid in zip(signed, results):
+        if not valid:
+            return f"트랜잭션 #{tx_position}의 서명이 유효하지 않습니다"
+    return None
+
+
+def _validate_shard(args: Tuple[int, List[Dict[str, Any]], int, bool, bool]) -> Optional[_Failure]:
+    """
+    한 구간의 블록을 검증합니다.
+
+    Args:
+        args: (구간 시작 위치, 블록 딕셔너리 리스트, 난이도,
+               서명 검증 여부, 서명 필수 여부)
+
+    Returns:
+        처음으로 무효한 블록의 (위치, 사유) 또는 None
+    """
+    offset, shard, difficulty, check_signatures, require_signatures = args
+    target = '0' * difficulty
+    previous_hash = None
+
+    for position, block_data in enumerate(shard, start=offset):
+        try:
+            block = Block.from_dict(block_data)
+        except KeyError as e:
+            return position, f"필수 필드가 누락되었습니다: {e}"
+
+        # 제네시스 블록은 Blockchain.is_chain_valid와 같이 검증하지 않음
+        if position > 0:
+            if block.hash != block.calculate_hash():
+                return position, "블록 해시가 유효하지 않습니다"
+            if not block.verify_body():
+                return position, "데이터가 머클 루트와 일치하지 않습니다"
+            if previous_hash is not None and block.previous_hash != previous_hash:
+                return position, "previous_hash가 이전 블록의 해시와 일치하지 않습니다"
+            if block.hash[:difficulty] != target:
+                return position, "작업 증명 조건을 만족하지 않습니다"
+            if check_signatures:
+                reason = _check_signatures(block, require_signatures)
+                if reason is not None:
+                    return position, reason
+
+        previous_hash = block.hash
+
+    return None
+
+
+class ParallelChainValidator:
+    """
+    프로세스 풀을 사용하는 전체 체인 검증기
+
+    Blockchain.chain의 Block 리스트와 BlockchainStorage.get_all_blocks()의
+    딕셔너리 리스트를 모두 검증할 수 있습니다.
+
+    Attributes:
+        processes: 워커 프로세스 수 (1이면 현재 프로세스에서 검증)
+        shard_size: 구간당 블록 수 (None이면 프로세스 수에 맞춰 자동 결정)
+        check_signatures: 서명이 있는 트랜잭션의 ECDSA 서명 검증 여부
+        require_signatures: SYSTEM 외 트랜잭션에 서명을 필수로 요구할지 여부
+    """
+
+    def __init__(self, processes: Optional[int] = None, shard_size: Optional[int] = None,
+                 check_signatures: bool = True, require_signatures: bool = False):
+        """
+        검증기 초기화
+
+        Args:
+            processes: 워커 프로세스 수 (기본값: CPU 코어 수)
+            shard_size: 구간당 블록 수
+            check_signatures: 서명 검증 여부
+            require_signatures: 서명 필수 여부
+        """
+        if shard_size is not None and shard_size <= 0:
+            raise ValueError("shard_size는 0보다 커야 합니다.")
+
+        self.processes = processes or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.check_signatures = check_signatures
+        self.require_signatures = require_signatures
+        self._pool = None
+
+    def _get_pool(self):
+        """프로세스 풀 반환 (최초 호출 시 생성)"""
+        if self._pool is None:
+            self._pool = multiprocessing.get_context().Pool(processes=self.processes)
+        return self._pool
+
+    def _shard_size_for(self, length: int) -> int:
+        """체인 길이에 맞는 구간 크기 계산"""
+        if self.shard_size is not None:
+            return self.shard_size
+        # 워커마다 여러 구간을 받도록 나누어 부하를 고르게 분산
+        return max(1, -(-length // (self.processes * 4)))
+
+    def validate(self, blocks: Sequence[Union[Block, Dict[str, Any]]],
+                 difficulty: int) -> ValidationResult:
+        """
+        체인 전체를 검증합니다.
+
+        Args:
+            blocks: 블록 또는 블록 딕셔너리 시퀀스 (인덱스 순)
+            difficulty: 채굴 난이도
+
+        Returns:
+            검증 결과 (무효하면 처음으로 무효한 블록 위치와 사유 포함)
+        """
+        chain = [b if isinstance(b, dict) else b.to_dict() for b in blocks]
+        if not chain:
+            return ValidationResult(True)
+
+        size = self._shard_size_for(len(chain))
+        tasks = [
+            (start, chain[start:start + size], difficulty,
+             self.check_signatures, self.require_signatures)
+            for start in range(0, len(chain), size)
+        ]
+
+        if self.processes == 1 or len(tasks) == 1:
+            results = [_validate_shard(task) for task in tasks]
+        else:
+            results = self._get_pool().map(_validate_shard, tasks)
+
+        failures = [failure for failure in results if failure is not None]
+
+        # 구간 경계의 연결 확인
+        for start in range(size, len(chain), size):
+            if chain[start]['previous_hash'] != chain[start - 1]['hash']:
+                failures.append(
+                    (start, "previous_hash가 이전 블록의 해시와 일치하지 않습니다")
+                )
+
+        if not failures:
+            return ValidationResult(True)
+
+        index, reason = min(failures, key=lambda failure: failure[0])
+        return ValidationResult(False, index, reason)
+
+    def close(self) -> None:
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> 'ParallelChainValidator':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ParallelChainValidator(processes={self.processes}, shard_size={self.shard_size})"
@@ -8,17 +8,32 @@
 
 import json
 from typing import Dict, Any, Optional, Tuple
+from .cache import LRUCache
 from .crypto_utils import (
     generate_private_key,
+    is_on_curve,
     private_key_to_public_key,
     public_key_to_address,
+    precompute_public_key,
     sign_message,
     verify_signature,
+    verify_signature_precomputed,
     int_to_hex,
     hex_to_int
 )
 
 
+# verify_hex 캐시 기본 크기
+VERIFY_RESULT_CACHE_SIZE = 100000
+PUBLIC_KEY_CACHE_SIZE = 4096
+
+# (메시지, 서명 hex, 공개키 hex) -> 검증 결과
+_verify_result_cache = LRUCache(VERIFY_RESULT_CACHE_SIZE)
+
+# 공개키 hex -> 사전 계산된 공개키 테이블
+_public_key_cache = LRUCache(PUBLIC_KEY_CACHE_SIZE)
+
+
 class Wallet:
     """
     암호화폐 지갑 클래스
@@ -118,25 +133,76 @@ class Wallet:
         """
         16진수 형식의 서명 검증
 
+        같은 트랜잭션이 여러 경로(수신, 채굴, 블록 전파)로 반복 검증되므로
+        (메시지, 서명, 공개키)별 검증 결과와 파싱/사전 계산된 공개키를
+        LRU 캐시에 보관합니다. 통계는 verify_cache_stats()로 확인합니다.
+
         Args:
             public_key_hex: 공개키 16진수 문자열
-            message: 원본 메시지
+            message: 원본 메시지 (트랜잭션 해시)
             signature_hex: 서명 16진수 문자열
 
         Returns:
             유효하면 True
         """
-        # 공개키 파싱
-        x = hex_to_int(public_key_hex[:64])
-        y = hex_to_int(public_key_hex[64:])
-        public_key = (x, y)
+        cache_key = (message, signature_hex, public_key_hex)
+        cached = _verify_result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # 공개키 파싱 및 사전 계산
+        key_table = _public_key_cache.get(public_key_hex)
+        if key_table is None:
+            x = hex_to_int(public_key_hex[:64])
+            y = hex_to_int(public_key_hex[64:])
+            if not is_on_curve((x, y)):
+                _verify_result_cache.put(cache_key, False)
+                return False
+            key_table = precompute_public_key((x, y))
+            _public_key_cache.put(public_key_hex, key_table)
 
         # 서명 파싱
         r = hex_to_int(signature_hex[:64])
         s = hex_to_int(signature_hex[64:])
         signature = (r, s)
 
-        return verify_signature(public_key, message, signature)
+        result = verify_signature_precomputed(key_table, message, signature)
+        _verify_result_cache.put(cache_key, result)
+        return result
+
+    @staticmethod
+    def verify_cache_stats() -> Dict[str, Dict[str, Any]]:
+        """
+        verify_hex 캐시 통계
+
+        Returns:
+            {'results': 검증 결과 캐시 통계, 'public_keys': 공개키 캐시 통계}
+        """
+        return {
+            'results': _verify_result_cache.stats(),
+            'public_keys': _public_key_cache.stats()
+        }
+
+    @staticmethod
+    def configure_verify_cache(result_size: Optional[int] = None,
+                               public_key_size: Optional[int] = None) -> None:
+        """
+        verify_hex 캐시 크기 변경
+
+        Args:
+            result_size: 검증 결과 캐시 최대 항목 수
+            public_key_size: 공개키 캐시 최대 항목 수
+        """
+        if result_size is not None:
+            _verify_result_cache.resize(result_size)
+        if public_key_size is not None:
+            _public_key_cache.resize(public_key_size)
+
+    @staticmethod
+    def clear_verify_cache() -> None:
+        """verify_hex 캐시와 통계 초기화"""
+        _verify_result_cache.clear()
+        _public_key_cache.clear()
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -6,7 +6,8 @@ Block 클래스 테스트
 """
 
 import pytest
-from src.block import Block
+import hashlib
+from src.block import Block, MerkleBlock, find_nonce
 
 
 class TestBlockCreation:
@@ -115,6 +116,47 @@ class TestMining:
         assert "Hash" in captured.out
 
 
+class TestPowTemplate:
+    """접두부 해시 채굴 엔진 테스트"""
+
+    @pytest.mark.parametrize("data", [
+        "문자열 데이터",
+        [{"sender": "Alice", "recipient": "Bob", "amount": 1.5, "nonce": 0}],
+        {"key": "value", "한글": "테스트"},
+    ])
+    def test_template_matches_calculate_hash(self, data):
+        """접두부 + nonce + 접미부 해시가 calculate_hash와 일치"""
+        block = Block(3, data, "ab" * 32)
+        prefix, suffix = block.pow_template()
+
+        for nonce in (0, 7, 123456):
+            block.nonce = nonce
+            digest = hashlib.sha256(prefix + str(nonce).encode() + suffix).hexdigest()
+            assert digest == block.calculate_hash()
+
+    def test_find_nonce_range(self, sample_block):
+        """구간 안에 해가 없으면 None"""
+        prefix, suffix = sample_block.pow_template()
+        assert find_nonce(prefix, suffix, 64, 0, 100) is None
+
+    def test_mined_block_matches_reference_loop(self, capsys):
+        """기존 nonce 증가 루프와 같은 결과"""
+        block = Block(1, [{"tx": i} for i in range(50)], "0" * 64)
+        reference_nonce = block.nonce
+        reference_hash = block.hash
+        while not reference_hash.startswith("00"):
+            reference_nonce += 1
+            block.nonce = reference_nonce
+            reference_hash = block.calculate_hash()
+        block.nonce = 0
+        block.hash = block.calculate_hash()
+
+        block.mine_block(2)
+
+        assert block.nonce == reference_nonce
+        assert block.hash == reference_hash
+
+
 class TestSerialization:
     """직렬화 관련 테스트"""
 
@@ -135,6 +177,16 @@ class TestSerialization:
         expected_keys = {'index', 'timestamp', 'data', 'previous_hash', 'nonce', 'hash'}
         assert set(block_dict.keys()) == expected_keys
 
+    @pytest.mark.parametrize("block_class", [Block, MerkleBlock])
+    def test_from_dict_roundtrip(self, block_class):
+        """딕셔너리에서 같은 블록 복원"""
+        block = block_class(2, [{"tx": 1}, {"tx": 2}], "ab" * 32)
+        restored = Block.from_dict(block.to_dict())
+
+        assert type(restored) is block_class
+        assert restored.to_dict() == block.to_dict()
+        assert restored.calculate_hash() == block.hash
+
 
 class TestStringRepresentation:
     """문자열 표현 테스트"""
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+BlockFileStore 클래스 테스트
+
+세그먼트 파일 저장, 높이/해시 인덱스 조회, 다시 열기와 손상 복구를
+테스트합니다.
+"""
+
+import os
+import pytest
+from src.block import MerkleBlock
+from src.block_store import BlockFileStore
+from src.storage import BlockchainStorage
+
+
+def _block(index, data=None, previous_hash=None):
+    """테스트용 블록 딕셔너리"""
+    return {
+        'index': index,
+        'timestamp': f'2025-01-01T00:{index % 60:02d}:00',
+        'data': data if data is not None else [
+            {'sender': 'SYSTEM', 'recipient': f'user{index}', 'amount': index + 1,
+             'timestamp': '2025-01-01T00:00:00'}
+        ],
+        'previous_hash': previous_hash or (f'{index - 1:064x}' if index else '0'),
+        'nonce': index * 7,
+        'hash': f'{index:064x}'
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    """임시 디렉터리를 사용하는 블록 파일 저장소"""
+    with BlockFileStore(str(tmp_path / 'blocks')) as s:
+        yield s
+
+
+class TestBlockFileStore:
+    """저장과 조회 테스트"""
+
+    def test_save_and_get(self, store):
+        """저장한 블록을 높이로 조회"""
+        block = _block(0, data='Genesis Block')
+        assert store.save_block(block) == 0
+        assert store.get_block(0) == block
+
+    def test_get_nonexistent(self, store):
+        """없는 블록"""
+        assert store.get_block(5) is None
+        assert store.get_block_by_hash('ff' * 32) is None
+        assert store.get_latest_block() is None
+
+    def test_get_by_hash(self, store):
+        """해시로 조회 (16진수가 아닌 해시 포함)"""
+        store.save_blocks([_block(i) for i in range(3)])
+        store.save_block({**_block(3), 'hash': 'hash_korean'})
+
+        assert store.get_block_by_hash(f'{1:064x}')['index'] == 1
+        assert store.get_block_by_hash('hash_korean')['index'] == 3
+
+    def test_all_and_latest(self, store):
+        """전체/최신 블록 조회"""
+        blocks = [_block(i) for i in range(10)]
+        assert store.save_blocks(blocks) == 10
+
+        assert store.get_all_blocks() == blocks
+        assert store.get_latest_block() == blocks[-1]
+        assert store.get_block_count() == len(store) == 10
+
+    def test_iter_blocks(self, store):
+        """구간 스트리밍 조회"""
+        blocks = [_block(i) for i in range(6)]
+        store.save_blocks(blocks)
+
+        assert list(store.iter_blocks()) == blocks
+        assert list(store.iter_blocks(2, 4)) == blocks[2:4]
+
+    def test_replace_same_height(self, store):
+        """같은 높이를 다시 저장하면 새 블록으로 교체"""
+        store.save_block(_block(1))
+        replacement = {**_block(1), 'hash': 'ab' * 32}
+        store.save_block(replacement)
+
+        assert store.get_block(1) == replacement
+        assert store.get_block_by_hash(f'{1:064x}') is None
+        assert store.get_block_count() == 1
+
+    def test_merkle_block(self, store):
+        """버전 2 블록의 version, merkle_root 보존"""
+        block = MerkleBlock(1, [{'sender': 'A', 'recipient': 'B', 'amount': 1,
+                                 'timestamp': '2025-01-01T00:00:00'}], '0' * 64)
+        store.save_block(block.to_dict())
+        assert store.get_block(1) == block.to_dict()
+
+    def test_same_interface_as_sqlite(self, store, tmp_path):
+        """BlockchainStorage와 같은 조회 결과"""
+        sqlite = BlockchainStorage(str(tmp_path / 'chain.db'))
+        blocks = [_block(i) for i in range(5)]
+        for block in blocks:
+            store.save_block(block)
+            sqlite.save_block(block)
+
+        assert store.get_all_blocks() == sqlite.get_all_blocks()
+        assert store.get_latest_block() == sqlite.get_latest_block()
+        assert store.get_block_by_hash(blocks[2]['hash']) == \
+            sqlite.get_block_by_hash(blocks[2]['hash'])
+        sqlite.close()
+
+    def test_clear_all(self, store):
+        """모든 블록 삭제"""
+        store.save_blocks([_block(i) for i in range(3)])
+        store.clear_all()
+
+        assert store.get_block_count() == 0
+        store.save_block(_block(0))
+        assert store.get_block(0) == _block(0)
+
+    def test_invalid_segment_size(self, tmp_path):
+        """잘못된 세그먼트 크기"""
+        with pytest.raises(ValueError):
+            BlockFileStore(str(tmp_path), segment_size=0)
+
+
+class TestSegmentsAndRecovery:
+    """세그먼트 분할과 다시 열기 테스트"""
+
+    def test_segment_rollover(self, tmp_path):
+        """세그먼트 크기를 넘으면 새 파일에 기록"""
+        directory = str(tmp_path / 'blocks')
+        with BlockFileStore(directory, segment_size=512) as store:
+            blocks = [_block(i) for i in range(20)]
+            store.save_blocks(blocks)
+            assert store.get_all_blocks() == blocks
+
+        segments = [name for name in os.listdir(directory) if name.startswith('blk')]
+        assert len(segments) > 1
+
+    def test_reopen(self, tmp_path):
+        """다시 열면 인덱스를 복원"""
+        directory = str(tmp_path / 'blocks')
+        blocks = [_block(i) for i in range(5)]
+        with BlockFileStore(directory, segment_size=512) as store:
+            store.save_blocks(blocks)
+
+        with BlockFileStore(directory, segment_size=512) as store:
+            assert store.get_all_blocks() == blocks
+            store.save_block(_block(5))
+            assert store.get_latest_block() == _block(5)
+
+    def test_recover_unindexed_records(self, tmp_path):
+        """인덱스에 기록되지 않은 레코드를 세그먼트에서 복구"""
+        directory = str(tmp_path / 'blocks')
+        with BlockFileStore(directory) as store:
+            store.save_blocks([_block(i) for i in range(3)])
+
+        # 인덱스 로그의 마지막 항목이 잘린 상황
+        index_path = os.path.join(directory, 'index.dat')
+        with open(index_path, 'r+b') as f:
+            f.truncate(os.path.getsize(index_path) - 5)
+
+        with BlockFileStore(directory) as store:
+            assert store.get_block_count() == 3
+            assert store.get_block_by_hash(f'{2:064x}') == _block(2)
+
+    def test_truncated_record_discarded(self, tmp_path):
+        """완전히 기록되지 않은 마지막 레코드는 버림"""
+        directory = str(tmp_path / 'blocks')
+        with BlockFileStore(directory) as store:
+            store.save_blocks([_block(i) for i in range(2)])
+
+        with open(os.path.join(directory, 'blk00000.dat'), 'ab') as f:
+            f.write(b'\x00\x00\x01\x00partial')
+
+        with BlockFileStore(directory) as store:
+            assert store.get_block_count() == 2
+            store.save_block(_block(2))
+
+        with BlockFileStore(directory) as store:
+            assert store.get_all_blocks() == [_block(i) for i in range(3)]
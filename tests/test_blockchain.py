@@ -5,10 +5,14 @@ Blockchain 클래스 테스트
 블록체인 관리, 트랜잭션 처리, 채굴, 검증 기능을 테스트합니다.
 """
 
+import json
 import pytest
-from src.blockchain import Blockchain
+from src.blockchain import Blockchain, BlockTemplate, GENESIS_NONCES
 from src.transaction import Transaction
-from src.block import Block
+from src.block import Block, MerkleBlock
+from src.block_store import BlockFileStore
+from src.mempool import Mempool
+from src.storage import BlockchainStorage
 
 
 class TestBlockchainCreation:
@@ -171,6 +175,132 @@ class TestMining:
         assert balance == blockchain.mining_reward
 
 
+class TestMempool:
+    """멤풀 연동 테스트"""
+
+    def test_duplicate_transaction_rejected(self, blockchain):
+        """같은 트랜잭션은 한 번만 펜딩"""
+        tx = Transaction("Alice", "Bob", 50)
+        blockchain.add_transaction(tx)
+        with pytest.raises(ValueError, match="이미"):
+            blockchain.add_transaction(tx)
+
+    def test_negative_fee_rejected(self, blockchain):
+        """음수 수수료 거부"""
+        with pytest.raises(ValueError, match="수수료"):
+            blockchain.add_transaction(Transaction("Alice", "Bob", 50, fee=-1))
+
+    def test_full_mempool_rejects_low_fee(self, blockchain):
+        """멤풀이 가득 차면 수수료율이 낮은 트랜잭션 거부"""
+        blockchain.pending_transactions = Mempool(max_size=1)
+        blockchain.add_transaction(Transaction("Alice", "Bob", 50, fee=1))
+        with pytest.raises(ValueError, match="멤풀"):
+            blockchain.add_transaction(Transaction("Carol", "Bob", 50))
+
+    def test_block_ordered_by_fee_rate(self, blockchain, capsys):
+        """수수료율이 높은 트랜잭션이 블록 앞쪽에 위치"""
+        blockchain.add_transaction(Transaction("Alice", "Bob", 10))
+        blockchain.add_transaction(Transaction("Carol", "Dave", 10, fee=2))
+        block = blockchain.mine_pending_transactions("Miner")
+
+        assert [tx['sender'] for tx in block.data] == ["Carol", "Alice"]
+
+    def test_fees_paid_to_miner(self, blockchain, capsys):
+        """발신자가 수수료를 부담하고 채굴 보상에 더해짐"""
+        blockchain.add_transaction(Transaction("SYSTEM", "Alice", 100))
+        blockchain.mine_pending_transactions("Miner")
+        blockchain.add_transaction(Transaction("Alice", "Bob", 30, fee=2))
+        blockchain.mine_pending_transactions("Miner")
+        blockchain.mine_pending_transactions("Miner")
+
+        assert blockchain.get_balance("Alice") == 68
+        assert blockchain.get_balance("Bob") == 30
+        assert blockchain.get_balance("Miner") == 2 * blockchain.mining_reward + 2
+        assert blockchain.verify_balances()
+
+
+class TestBlockLimits:
+    """블록 크기/트랜잭션 수 제한과 블록 템플릿 테스트"""
+
+    def test_max_transactions(self, blockchain, capsys):
+        """제한을 넘는 트랜잭션은 다음 블록을 기다림"""
+        blockchain.set_block_limits(max_block_transactions=2)
+        for i in range(5):
+            blockchain.add_transaction(Transaction(f"user{i}", "Bob", 10, fee=i))
+        block = blockchain.mine_pending_transactions("Miner")
+
+        assert [tx['sender'] for tx in block.data] == ["user4", "user3"]
+        assert len(blockchain.pending_transactions) == 3 + 1  # 남은 트랜잭션 + 보상
+
+    def test_max_bytes(self, blockchain, capsys):
+        """채굴된 블록의 JSON 크기가 제한 이하"""
+        blockchain.set_block_limits(max_block_bytes=1000, max_block_transactions=None)
+        for i in range(20):
+            blockchain.add_transaction(Transaction(f"user{i}", "Bob", 10))
+
+        template = blockchain.build_block_template()
+        block = blockchain.mine_pending_transactions("Miner")
+        size = len(json.dumps(block.to_dict(), ensure_ascii=False).encode('utf-8'))
+
+        assert 0 < len(block.data) < 20
+        assert size <= template.size <= 1000
+        assert len(blockchain.pending_transactions) == 20 - len(block.data) + 1
+
+    def test_backlog_drains(self, blockchain, capsys):
+        """여러 블록에 걸쳐 모든 트랜잭션이 포함됨"""
+        blockchain.set_block_limits(max_block_transactions=3)
+        for i in range(7):
+            blockchain.add_transaction(Transaction("SYSTEM", f"user{i}", 10))
+        while any(tx.sender != "SYSTEM" or tx.recipient != "Miner"
+                  for tx in blockchain.pending_transactions):
+            blockchain.mine_pending_transactions("Miner")
+
+        assert all(blockchain.get_balance(f"user{i}") == 10 for i in range(7))
+        assert blockchain.verify_balances()
+
+    def test_template_does_not_modify_mempool(self, blockchain):
+        """템플릿 생성은 멤풀을 바꾸지 않음"""
+        blockchain.add_transaction(Transaction("Alice", "Bob", 10, fee=1.5))
+        blockchain.add_transaction(Transaction("Carol", "Bob", 10, fee=0.5))
+        template = blockchain.build_block_template()
+
+        assert isinstance(template, BlockTemplate)
+        assert len(template) == 2
+        assert template.fees == 2
+        assert template.data == [tx.to_dict() for tx in template.transactions]
+        assert len(blockchain.pending_transactions) == 2
+
+    def test_reward_survives_full_mempool(self, blockchain, capsys):
+        """멤풀이 가득 차도 채굴 보상은 제거되지 않고 다음 블록에 먼저 포함"""
+        blockchain.pending_transactions = Mempool(max_size=5)
+        blockchain.set_block_limits(max_block_transactions=2)
+        for i in range(5):
+            blockchain.add_transaction(Transaction(f"user{i}", "Bob", 10, fee=1))
+        blockchain.mine_pending_transactions("Miner")
+        for i in range(5, 7):
+            blockchain.add_transaction(Transaction(f"user{i}", "Bob", 10, fee=1.5))
+
+        rewards = [tx for tx in blockchain.pending_transactions if tx.sender == "SYSTEM"]
+        assert [(tx.recipient, tx.amount) for tx in rewards] == [("Miner", 102)]
+
+        block = blockchain.mine_pending_transactions("Miner")
+        assert block.data[0]['sender'] == "SYSTEM"
+        assert blockchain.get_balance("Miner") == 102
+
+    def test_oversized_transaction_rejected(self, blockchain):
+        """블록에 들어갈 수 없는 트랜잭션 거부"""
+        blockchain.set_block_limits(max_block_bytes=300)
+        with pytest.raises(ValueError, match="블록 크기"):
+            blockchain.add_transaction(Transaction("Alice", "B" * 300, 10))
+
+    def test_invalid_limits(self):
+        """0 이하의 제한"""
+        with pytest.raises(ValueError):
+            Blockchain(difficulty=1, max_block_bytes=0)
+        with pytest.raises(ValueError):
+            Blockchain(difficulty=1, max_block_transactions=-1)
+
+
 class TestBalance:
     """잔액 조회 관련 테스트"""
 
@@ -206,6 +336,30 @@ class TestBalance:
         assert blockchain.get_balance("Bob") == 20
         assert blockchain.get_balance("Charlie") == 10
 
+    def test_balance_index_matches_scan(self, blockchain, capsys):
+        """잔액 인덱스와 체인 순회 결과 일치"""
+        for i in range(5):
+            blockchain.add_transaction(Transaction("SYSTEM", f"user{i}", 10.1 * (i + 1)))
+            blockchain.add_transaction(Transaction(f"user{i}", "Bob", 0.3))
+            blockchain.mine_pending_transactions("Miner")
+        blockchain.add_block("일반 데이터 블록")
+
+        for address in ["user0", "user4", "Bob", "Miner", "SYSTEM", "Unknown"]:
+            assert blockchain.get_balance(address) == blockchain.scan_balance(address)
+        assert blockchain.verify_balances() is True
+
+    def test_rebuild_balances(self, blockchain_with_blocks, capsys):
+        """체인을 직접 변경한 뒤 인덱스 재구성"""
+        blockchain_with_blocks.chain[1].data.append(
+            Transaction("SYSTEM", "Dave", 5).to_dict()
+        )
+        assert blockchain_with_blocks.verify_balances() is False
+
+        blockchain_with_blocks.rebuild_balances()
+
+        assert blockchain_with_blocks.get_balance("Dave") == 5
+        assert blockchain_with_blocks.verify_balances() is True
+
 
 class TestChainValidation:
     """체인 검증 관련 테스트"""
@@ -240,6 +394,214 @@ class TestChainValidation:
         assert blockchain.is_chain_valid() is False
 
 
+class TestIncrementalValidation:
+    """검증 지점을 사용하는 증분 검증 테스트"""
+
+    def test_only_new_blocks_checked(self, blockchain, capsys, monkeypatch):
+        """두 번째 검증은 새 블록만 확인"""
+        for i in range(3):
+            blockchain.add_block(f"블록 {i}")
+        assert blockchain.is_chain_valid() is True
+
+        blockchain.add_block("새 블록")
+        checked = []
+        original = Block.calculate_hash
+        monkeypatch.setattr(
+            Block, 'calculate_hash',
+            lambda self: checked.append(self.index) or original(self)
+        )
+
+        assert blockchain.is_chain_valid() is True
+        # 검증 지점(#3) 재확인 + 새 블록(#4)만 해시 계산
+        assert set(checked) == {3, 4}
+
+    def test_full_revalidation(self, blockchain, capsys):
+        """full=True는 검증 지점 이전의 변조도 감지"""
+        blockchain.add_block("블록 1")
+        blockchain.add_block("블록 2")
+        assert blockchain.is_chain_valid() is True
+
+        # 검증 지점(#2) 이전 블록 변조
+        blockchain.chain[1].data = "변조된 데이터"
+
+        assert blockchain.is_chain_valid() is True
+        assert blockchain.is_chain_valid(full=True) is False
+
+    def test_checkpoint_block_tampering(self, blockchain, capsys):
+        """검증 지점 블록 자체가 변조되면 전체 재검증"""
+        blockchain.add_block("블록 1")
+        assert blockchain.is_chain_valid() is True
+
+        blockchain.chain[1].data = "변조된 데이터"
+
+        assert blockchain.is_chain_valid() is False
+
+
+class TestMerkleBlockChain:
+    """버전 2(머클) 블록 체인 테스트"""
+
+    def test_merkle_chain(self, capsys):
+        """block_version=2 체인은 MerkleBlock 사용"""
+        bc = Blockchain(difficulty=2, block_version=2)
+        bc.add_transaction(Transaction("SYSTEM", "Alice", 100))
+        bc.mine_pending_transactions("Miner")
+
+        assert all(isinstance(block, MerkleBlock) for block in bc.chain)
+        assert bc.get_balance("Alice") == 100
+        assert bc.is_chain_valid() is True
+
+    def test_merkle_chain_detects_body_tampering(self, capsys):
+        """본문 변조 시 머클 루트 불일치로 무효화"""
+        bc = Blockchain(difficulty=2, block_version=2)
+        bc.add_transaction(Transaction("SYSTEM", "Alice", 100))
+        bc.mine_pending_transactions("Miner")
+
+        bc.chain[1].data[0]['amount'] = 10000
+
+        capsys.readouterr()
+        assert bc.is_chain_valid() is False
+        assert "머클 루트" in capsys.readouterr().out
+
+    def test_unsupported_block_version(self, capsys):
+        """지원하지 않는 블록 버전"""
+        with pytest.raises(ValueError):
+            Blockchain(difficulty=1, block_version=99)
+
+
+class TestDeterministicGenesis:
+    """고정 제네시스 블록 테스트"""
+
+    @pytest.mark.parametrize('block_version', [Block.version, MerkleBlock.version])
+    @pytest.mark.parametrize('difficulty', [1, 2, 4])
+    def test_precomputed_nonce(self, block_version, difficulty, capsys):
+        """미리 계산한 nonce가 난이도를 만족"""
+        genesis = Blockchain(difficulty=difficulty, block_version=block_version)[0]
+
+        assert genesis.nonce == GENESIS_NONCES[(block_version, difficulty)]
+        assert genesis.hash == genesis.calculate_hash()
+        assert genesis.hash.startswith('0' * difficulty)
+
+    def test_same_genesis_across_instances(self, capsys):
+        """같은 설정의 체인은 같은 제네시스 블록을 가짐 (객체는 별개)"""
+        first, second = Blockchain(difficulty=2), Blockchain(difficulty=2)
+
+        assert first[0].to_dict() == second[0].to_dict()
+        first[0].data = "변조"
+        assert second[0].data != "변조"
+
+    def test_unknown_difficulty_mined_once(self, capsys, monkeypatch):
+        """표에 없는 난이도는 한 번 채굴한 뒤 기록"""
+        monkeypatch.setitem(GENESIS_NONCES, (1, 0), 0)
+        monkeypatch.delitem(GENESIS_NONCES, (1, 3))
+        genesis = Blockchain(difficulty=3)[0]
+
+        assert genesis.hash.startswith('000')
+        assert GENESIS_NONCES[(1, 3)] == genesis.nonce
+
+
+@pytest.fixture
+def stored_chain(tmp_path, capsys):
+    """블록 3개와 펜딩 트랜잭션이 저장된 저장소와 원본 체인"""
+    bc = Blockchain(difficulty=2)
+    bc.add_transaction(Transaction("Alice", "Bob", 30))
+    bc.mine_pending_transactions("Miner")
+    bc.mine_pending_transactions("Miner")
+
+    storage = BlockchainStorage(str(tmp_path / 'chain.db'))
+    storage.save_blocks([block.to_dict() for block in bc.chain])
+    for tx in bc.pending_transactions:
+        storage.save_transaction(tx.to_dict())
+    capsys.readouterr()
+    yield storage, bc
+    storage.close()
+
+
+class TestFromStorage:
+    """저장소에서 블록체인 복원 테스트"""
+
+    @pytest.mark.parametrize('verify', ['tip', 'full', 'none'])
+    def test_restore(self, stored_chain, verify, capsys):
+        """블록, 잔액, 펜딩 트랜잭션 복원"""
+        storage, original = stored_chain
+        restored = Blockchain.from_storage(storage, difficulty=2, verify=verify)
+
+        assert [b.to_dict() for b in restored.chain] == [b.to_dict() for b in original.chain]
+        assert restored.balances == original.balances
+        assert [tx.to_dict() for tx in restored.pending_transactions] == \
+            [tx.to_dict() for tx in original.pending_transactions]
+        assert restored.is_chain_valid()
+
+    def test_continue_mining(self, stored_chain, capsys):
+        """복원한 체인에 이어서 채굴"""
+        storage, _ = stored_chain
+        restored = Blockchain.from_storage(storage, difficulty=2)
+        block = restored.mine_pending_transactions("Miner")
+
+        assert block.index == 3
+        assert restored.get_balance("Miner") == 200
+        assert restored.is_chain_valid(full=True)
+
+    def test_empty_storage(self, tmp_path, capsys):
+        """빈 저장소면 제네시스 블록만 있는 체인"""
+        with BlockchainStorage(str(tmp_path / 'empty.db')) as storage:
+            restored = Blockchain.from_storage(storage, difficulty=2)
+        assert restored[0].to_dict() == Blockchain(difficulty=2)[0].to_dict()
+
+    def test_block_file_store(self, stored_chain, tmp_path, capsys):
+        """BlockFileStore에서도 복원"""
+        _, original = stored_chain
+        with BlockFileStore(str(tmp_path / 'blocks')) as store:
+            store.save_blocks(block.to_dict() for block in original.chain)
+            restored = Blockchain.from_storage(store, difficulty=2, verify='full')
+        assert restored.get_latest_block().hash == original.get_latest_block().hash
+
+    def test_block_version_inferred(self, tmp_path, capsys):
+        """마지막 블록의 형식을 이어서 사용"""
+        bc = Blockchain(difficulty=1, block_version=MerkleBlock.version)
+        bc.add_block(["a", "b"])
+        with BlockchainStorage(str(tmp_path / 'merkle.db')) as storage:
+            storage.save_blocks([block.to_dict() for block in bc.chain])
+            restored = Blockchain.from_storage(storage, difficulty=1)
+        assert restored.block_version == MerkleBlock.version
+
+    def test_tip_detects_broken_link(self, stored_chain, capsys):
+        """tip 검증은 끊어진 연결을 감지"""
+        storage, original = stored_chain
+        broken = original[1].to_dict()
+        broken['previous_hash'] = 'ff' * 32
+        storage.save_block(broken)
+
+        with pytest.raises(ValueError):
+            Blockchain.from_storage(storage, difficulty=2, verify='tip')
+        assert len(Blockchain.from_storage(storage, difficulty=2, verify='none')) == 3
+
+    def test_tip_detects_tampered_tip(self, stored_chain, capsys):
+        """tip 검증은 마지막 블록 변조를 감지"""
+        storage, original = stored_chain
+        tampered = original[-1].to_dict()
+        tampered['nonce'] += 1
+        storage.save_block(tampered)
+
+        with pytest.raises(ValueError):
+            Blockchain.from_storage(storage, difficulty=2, verify='tip')
+
+    def test_full_detects_tampered_history(self, stored_chain, capsys):
+        """full 검증은 중간 블록 변조까지 감지"""
+        storage, original = stored_chain
+        tampered = original[1].to_dict()
+        tampered['data'][0]['amount'] = 1000
+        storage.save_block(tampered)
+
+        Blockchain.from_storage(storage, difficulty=2, verify='tip')
+        with pytest.raises(ValueError):
+            Blockchain.from_storage(storage, difficulty=2, verify='full')
+
+    def test_invalid_verify_mode(self, stored_chain):
+        """지원하지 않는 검증 방식"""
+        with pytest.raises(ValueError):
+            Blockchain.from_storage(stored_chain[0], verify='quick')
+
+
 class TestSpecialMethods:
     """특수 메서드 테스트"""
 
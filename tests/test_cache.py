@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+LRUCache 클래스 테스트
+
+크기 제한, LRU 제거 순서, 적중/실패 통계를 테스트합니다.
+"""
+
+import pytest
+from src.cache import LRUCache
+
+
+class TestLRUCache:
+    """LRU 캐시 테스트"""
+
+    def test_get_put(self):
+        """저장 및 조회"""
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('b', 'default') == 'default'
+
+    def test_evicts_least_recently_used(self):
+        """가장 오래 사용되지 않은 항목 제거"""
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')  # a를 최근 사용으로 갱신
+        cache.put('c', 3)
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        assert len(cache) == 2
+
+    def test_stats(self):
+        """적중/실패 통계"""
+        cache = LRUCache(maxsize=4)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.get('a')
+        cache.get('missing')
+
+        stats = cache.stats()
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == pytest.approx(2 / 3)
+        assert stats['size'] == 1
+        assert stats['maxsize'] == 4
+
+    def test_contains_does_not_count(self):
+        """in 연산은 통계에 반영하지 않음"""
+        cache = LRUCache(maxsize=1)
+        cache.put('a', 1)
+        assert 'a' in cache
+        assert cache.stats()['hits'] == 0
+
+    def test_resize_and_clear(self):
+        """크기 변경과 초기화"""
+        cache = LRUCache(maxsize=3)
+        for key in 'abc':
+            cache.put(key, key)
+        cache.resize(1)
+
+        assert len(cache) == 1
+        assert 'c' in cache
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats()['misses'] == 0
+
+    def test_invalid_size(self):
+        """잘못된 크기"""
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+StoredChain 클래스 테스트
+
+최근 블록 창, 저장소에서의 블록 읽기, LRU 캐시, 그리고
+Blockchain.from_storage(window=...)와의 연동을 테스트합니다.
+"""
+
+import json
+import pytest
+from src.block import Block
+from src.block_store import BlockFileStore
+from src.blockchain import Blockchain
+from src.chain_view import StoredChain
+from src.codec import MEDIA_TYPE, decode_chain
+from src.network import create_app
+from src.node import Node
+from src.storage import BlockchainStorage
+from src.transaction import Transaction
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """임시 파일을 사용하는 저장소"""
+    with BlockchainStorage(str(tmp_path / 'chain.db')) as s:
+        yield s
+
+
+def _blocks(count):
+    """연결된 블록 리스트 (난이도 0)"""
+    blocks, previous_hash = [], "0"
+    for index in range(count):
+        block = Block(index, f"블록 {index}", previous_hash)
+        blocks.append(block)
+        previous_hash = block.hash
+    return blocks
+
+
+@pytest.fixture
+def windowed_chain(storage):
+    """블록 10개, 창 크기 3인 체인"""
+    chain = StoredChain(storage, window=3, cache_size=4, prefetch=2)
+    for block in _blocks(10):
+        chain.append(block)
+    return chain
+
+
+class TestStoredChain:
+    """인덱싱과 창 테스트"""
+
+    def test_len_and_latest(self, windowed_chain):
+        """길이와 마지막 블록"""
+        assert len(windowed_chain) == 10
+        assert windowed_chain[-1].index == 9
+        assert len(windowed_chain._recent) == 3
+
+    def test_append_persists(self, windowed_chain, storage):
+        """append한 블록은 저장소에 기록"""
+        assert storage.get_block_count() == 10
+        assert storage.get_block(9)['hash'] == windowed_chain[9].hash
+
+    def test_fault_in_old_blocks(self, windowed_chain, storage):
+        """창 밖 블록은 저장소에서 읽음"""
+        for index in range(10):
+            assert windowed_chain[index].to_dict() == storage.get_block(index)
+        assert windowed_chain[-10].index == 0
+
+    def test_cache_and_prefetch(self, windowed_chain):
+        """캐시 실패 시 뒤쪽 블록을 함께 읽어 캐시에 둠"""
+        windowed_chain[0]
+        assert windowed_chain.cache.stats()['size'] == 2
+        windowed_chain[1]
+        assert windowed_chain.cache.hits >= 1
+
+    def test_cache_bounded(self, windowed_chain):
+        """캐시 크기 제한"""
+        for index in range(7):
+            windowed_chain[index]
+        assert len(windowed_chain.cache) <= 4
+
+    def test_recent_blocks_are_same_objects(self, storage):
+        """창 안의 블록은 append한 객체 그대로"""
+        chain = StoredChain(storage, window=2)
+        block = _blocks(1)[0]
+        chain.append(block)
+        assert chain[0] is block
+
+    def test_iteration_and_slices(self, windowed_chain):
+        """순회와 슬라이스"""
+        assert [block.index for block in windowed_chain] == list(range(10))
+        assert [block.index for block in windowed_chain[5:8]] == [5, 6, 7]
+        assert windowed_chain[-1] in windowed_chain
+
+    def test_out_of_range(self, windowed_chain):
+        """범위를 벗어난 인덱스"""
+        with pytest.raises(IndexError):
+            _ = windowed_chain[10]
+        with pytest.raises(IndexError):
+            _ = windowed_chain[-11]
+
+    def test_block_file_store(self, tmp_path):
+        """BlockFileStore 위에서도 동작"""
+        with BlockFileStore(str(tmp_path / 'blocks')) as store:
+            chain = StoredChain(store, window=2)
+            for block in _blocks(5):
+                chain.append(block)
+            assert [block.index for block in chain] == list(range(5))
+            assert chain[1].hash == store.get_block(1)['hash']
+
+    def test_invalid_arguments(self, storage):
+        """잘못된 창/미리 읽기 크기"""
+        with pytest.raises(ValueError):
+            StoredChain(storage, window=0)
+        with pytest.raises(ValueError):
+            StoredChain(storage, prefetch=0)
+
+
+@pytest.fixture
+def windowed_blockchain(storage, capsys):
+    """블록 5개가 저장된 저장소를 창 크기 2로 복원한 블록체인"""
+    bc = Blockchain.from_storage(storage, difficulty=1, window=2)
+    bc.add_transaction(Transaction("Alice", "Bob", 10))
+    for _ in range(4):
+        bc.mine_pending_transactions("Miner")
+    capsys.readouterr()
+    return bc
+
+
+class TestWindowedBlockchain:
+    """Blockchain.from_storage(window=...) 테스트"""
+
+    def test_chain_semantics(self, windowed_blockchain, storage):
+        """길이, 인덱싱, 최신 블록"""
+        assert isinstance(windowed_blockchain.chain, StoredChain)
+        assert len(windowed_blockchain) == 5 == storage.get_block_count()
+        assert windowed_blockchain[0].index == 0
+        assert windowed_blockchain.get_latest_block().index == 4
+
+    def test_validation_and_balances(self, windowed_blockchain, capsys):
+        """창 밖 블록을 읽어 전체 검증과 잔액 확인"""
+        assert windowed_blockchain.is_chain_valid(full=True)
+        assert windowed_blockchain.get_balance("Miner") == 300
+        assert windowed_blockchain.verify_balances()
+
+    def test_reload(self, windowed_blockchain, storage, capsys):
+        """다시 복원하면 같은 체인과 잔액"""
+        restored = Blockchain.from_storage(storage, difficulty=1, window=2)
+
+        assert len(restored) == len(windowed_blockchain)
+        assert restored.get_latest_block().hash == windowed_blockchain.get_latest_block().hash
+        assert restored.balances == windowed_blockchain.balances
+        assert len(restored.chain._recent) == 2
+
+    def test_api(self, windowed_blockchain):
+        """REST API가 창 밖 블록까지 반환"""
+        app = create_app(blockchain=windowed_blockchain, node=Node())
+        app.config['TESTING'] = True
+        with app.test_client() as client:
+            data = json.loads(client.get('/chain').data)
+            assert [block['index'] for block in data['chain']] == list(range(5))
+
+            response = client.get('/chain', headers={'Accept': MEDIA_TYPE})
+            assert len(decode_chain(response.data)) == 5
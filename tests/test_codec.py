@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+바이너리 직렬화 테스트
+
+인코딩/디코딩 결과가 to_dict()와 동일한지, 원시 바이트 필드와
+memoryview 디코딩, 잘못된 입력 처리를 테스트합니다.
+"""
+
+import json
+import pytest
+from src.block import Block, MerkleBlock
+from src.blockchain import Blockchain
+from src.codec import (
+    CODEC_VERSION,
+    decode_block,
+    decode_chain,
+    decode_data,
+    decode_transaction,
+    encode_block,
+    encode_chain,
+    encode_data,
+    encode_transaction
+)
+from src.transaction import Transaction
+from src.wallet import Wallet
+
+
+@pytest.fixture
+def signed_chain(capsys):
+    """서명된 트랜잭션이 담긴 블록체인 (버전 1, 2 블록 혼합)"""
+    wallet = Wallet()
+    bc = Blockchain(difficulty=1)
+    bc.add_transaction(Transaction("SYSTEM", wallet.address, 100))
+    bc.mine_pending_transactions("Miner")
+    for amount in (1, 2.5, 0.1):
+        tx = Transaction(wallet.address, "Bob", amount)
+        tx.sign(wallet)
+        bc.add_transaction(tx)
+    bc.mine_pending_transactions("Miner")
+    bc.add_block({'memo': '트랜잭션이 아닌 데이터'})
+    capsys.readouterr()
+    return bc
+
+
+class TestTransactionCodec:
+    """트랜잭션 인코딩 테스트"""
+
+    @pytest.mark.parametrize("amount", [50, 50.0, 0.1, 2 ** 70])
+    def test_roundtrip(self, amount):
+        """to_dict()와 같은 결과 (int/float 구분 포함)"""
+        tx = Transaction("Alice", "Bob", amount)
+        decoded = decode_transaction(encode_transaction(tx))
+
+        assert decoded == tx.to_dict()
+        assert type(decoded['amount']) is type(amount)
+
+    def test_signed_roundtrip(self):
+        """서명 트랜잭션은 원시 바이트로 저장되어 JSON보다 작음"""
+        wallet = Wallet()
+        tx = Transaction(wallet.address, "Bob", 10)
+        tx.sign(wallet)
+
+        encoded = encode_transaction(tx)
+        assert decode_transaction(encoded) == tx.to_dict()
+        assert Transaction.from_dict(decode_transaction(encoded)).verify_signature() is True
+        assert len(encoded) < len(json.dumps(tx.to_dict())) / 2
+
+    def test_not_a_transaction(self):
+        """트랜잭션 형식이 아니면 ValueError"""
+        with pytest.raises(ValueError):
+            encode_transaction({'sender': 'Alice'})
+
+
+class TestBlockCodec:
+    """블록 인코딩 테스트"""
+
+    def test_chain_blocks_roundtrip(self, signed_chain):
+        """모든 블록이 to_dict()와 같게 복원"""
+        for block in signed_chain.chain:
+            decoded = decode_block(encode_block(block))
+            assert decoded == block.to_dict()
+            assert Block.from_dict(decoded).calculate_hash() == block.hash
+
+    def test_merkle_block_roundtrip(self):
+        """버전 2 블록은 version, merkle_root까지 복원"""
+        block = MerkleBlock(1, [Transaction("Alice", "Bob", 1).to_dict()], "0" * 64)
+        decoded = decode_block(encode_block(block))
+
+        assert decoded == block.to_dict()
+        assert Block.from_dict(decoded).verify_body() is True
+
+    def test_fixed_width_hashes(self):
+        """64자리 해시는 32바이트로 저장"""
+        block = Block(1, "데이터", "ab" * 32)
+        encoded = encode_block(block)
+
+        assert bytes.fromhex(block.hash) in encoded
+        assert block.hash.encode() not in encoded
+
+    def test_non_transaction_data(self):
+        """트랜잭션 리스트가 아닌 data도 그대로 복원"""
+        for data in ["문자열", {'key': [1, 2]}, [{'memo': 1}, 3], []]:
+            assert decode_data(encode_data(data)) == data
+
+
+class TestChainCodec:
+    """체인 인코딩 테스트"""
+
+    def test_chain_roundtrip(self, signed_chain):
+        """체인 전체 복원"""
+        chain = [block.to_dict() for block in signed_chain.chain]
+        assert decode_chain(encode_chain(signed_chain.chain)) == chain
+
+    def test_memoryview_decoding(self, signed_chain):
+        """더 큰 버퍼의 일부를 가리키는 memoryview에서 디코딩"""
+        encoded = encode_chain(signed_chain.chain)
+        buffer = bytearray(b'xx' + encoded + b'yy')
+
+        decoded = decode_chain(memoryview(buffer)[2:-2])
+        assert decoded == [block.to_dict() for block in signed_chain.chain]
+
+    def test_smaller_than_json(self, signed_chain):
+        """JSON보다 작은 크기"""
+        chain = [block.to_dict() for block in signed_chain.chain]
+        assert len(encode_chain(chain)) < len(json.dumps(chain, ensure_ascii=False))
+
+
+class TestInvalidInput:
+    """잘못된 입력 테스트"""
+
+    def test_truncated(self, signed_chain):
+        """잘린 데이터"""
+        encoded = encode_block(signed_chain.chain[-2])
+        with pytest.raises(ValueError):
+            decode_block(encoded[:-10])
+
+    def test_trailing_bytes(self, sample_block):
+        """끝에 남는 바이트"""
+        with pytest.raises(ValueError):
+            decode_block(encode_block(sample_block) + b'\x00')
+
+    def test_unknown_version(self, sample_block):
+        """지원하지 않는 형식 버전"""
+        encoded = bytearray(encode_block(sample_block))
+        encoded[0] = CODEC_VERSION + 1
+        with pytest.raises(ValueError):
+            decode_block(bytes(encoded))
+
+    def test_wrong_kind(self, sample_block):
+        """다른 종류의 프레임"""
+        with pytest.raises(ValueError):
+            decode_transaction(encode_block(sample_block))
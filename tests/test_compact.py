@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+압축 표현 테스트
+
+CompactTransaction, CompactBlock이 원래 to_dict() 결과를 그대로
+복원하는지, 값이 압축된 형태로 저장되는지 테스트합니다.
+"""
+
+import pytest
+from src.block import Block, MerkleBlock
+from src.compact import (
+    AMOUNT_SCALE,
+    CompactBlock,
+    CompactTransaction,
+    pack_amount,
+    pack_hex,
+    pack_timestamp,
+    unpack_timestamp
+)
+from src.crypto_utils import ECPoint
+from src.transaction import Transaction
+from src.wallet import Wallet
+
+
+def _signed_transaction(amount=1.5):
+    """서명된 트랜잭션"""
+    wallet = Wallet()
+    tx = Transaction(wallet.address, "Bob", amount)
+    tx.sign(wallet)
+    return tx
+
+
+class TestPacking:
+    """값 변환 테스트"""
+
+    def test_hex_to_bytes(self):
+        """64자리 해시는 32바이트로 저장"""
+        packed = pack_hex("ab" * 32)
+        assert packed == bytes.fromhex("ab" * 32)
+
+    @pytest.mark.parametrize("value", ["0", "Alice", "AB" * 32])
+    def test_hex_fallback(self, value):
+        """되돌릴 수 없는 값은 문자열 유지"""
+        assert pack_hex(value) == value
+
+    @pytest.mark.parametrize("value", [
+        "2025-01-01T00:00:00",
+        "2025-01-01T12:34:56.789012",
+        "1969-12-31T23:59:59.000001"
+    ])
+    def test_timestamp_roundtrip(self, value):
+        """ISO 시간은 정수로 저장되고 그대로 복원"""
+        packed = pack_timestamp(value)
+        assert isinstance(packed, int)
+        assert unpack_timestamp(packed) == value
+
+    @pytest.mark.parametrize("value", ["2025-01-01T00:00:00+09:00", "어제"])
+    def test_timestamp_fallback(self, value):
+        """변환할 수 없는 시간은 문자열 유지"""
+        assert pack_timestamp(value) == value
+
+    def test_amount_fixed_point(self):
+        """금액은 고정소수점 정수"""
+        assert pack_amount(100) == 100 * AMOUNT_SCALE
+        assert pack_amount(0.1) == AMOUNT_SCALE // 10
+
+    @pytest.mark.parametrize("value", [1 / 3, "10", True])
+    def test_amount_invalid(self, value):
+        """고정소수점으로 표현할 수 없는 금액"""
+        with pytest.raises(ValueError):
+            pack_amount(value)
+
+
+class TestCompactTransaction:
+    """CompactTransaction 테스트"""
+
+    @pytest.mark.parametrize("amount", [50, 50.0, 0.1, 12345.6789])
+    def test_to_dict_unchanged(self, amount):
+        """to_dict() 결과가 원래 트랜잭션과 동일 (int/float 구분 포함)"""
+        tx = Transaction("Alice", "Bob", amount)
+        compact = CompactTransaction.from_transaction(tx)
+
+        restored = compact.to_dict()
+        assert restored == tx.to_dict()
+        assert type(restored['amount']) is type(amount)
+
+    def test_signed_transaction(self):
+        """서명과 공개키는 64바이트로 저장"""
+        tx = _signed_transaction()
+        compact = CompactTransaction.from_transaction(tx)
+
+        assert len(compact.signature) == 64
+        assert len(compact.sender_public_key) == 64
+        assert len(compact.sender) == 20
+        assert compact.to_dict() == tx.to_dict()
+        assert compact.to_transaction().verify_signature() is True
+
+    def test_hash_preserved(self):
+        """복원한 트랜잭션의 해시가 동일"""
+        tx = _signed_transaction(3)
+        restored = CompactTransaction.from_transaction(tx).to_transaction()
+        assert restored.txid == tx.txid
+
+    def test_no_instance_dict(self):
+        """__dict__ 없이 슬롯만 사용"""
+        compact = CompactTransaction.from_transaction(Transaction("Alice", "Bob", 1))
+        assert not hasattr(compact, '__dict__')
+
+
+class TestCompactBlock:
+    """CompactBlock 테스트"""
+
+    def test_block_roundtrip(self, blockchain, capsys):
+        """체인의 모든 블록이 동일하게 복원"""
+        blockchain.add_transaction(_signed_transaction())
+        blockchain.mine_pending_transactions("Miner")
+        blockchain.add_block("문자열 데이터")
+
+        for block in blockchain.chain:
+            compact = CompactBlock.from_block(block)
+            assert compact.to_dict() == block.to_dict()
+            assert compact.to_block().calculate_hash() == block.hash
+
+    def test_hashes_stored_as_bytes(self, sample_block):
+        """해시와 시간은 압축 형태로 저장"""
+        compact = CompactBlock.from_block(sample_block)
+
+        assert isinstance(compact.hash, bytes) and len(compact.hash) == 32
+        assert isinstance(compact.previous_hash, bytes)
+        assert isinstance(compact.timestamp, int)
+
+    def test_transactions_compacted(self):
+        """트랜잭션 리스트는 CompactTransaction 튜플로 저장"""
+        txs = [Transaction("Alice", f"user{i}", i + 1).to_dict() for i in range(3)]
+        block = Block(1, txs, "0" * 64)
+        compact = CompactBlock.from_block(block)
+
+        assert all(isinstance(tx, CompactTransaction) for tx in compact.data)
+        assert compact.to_dict()['data'] == txs
+
+    def test_mixed_data_preserved(self):
+        """트랜잭션 형식이 아닌 원소는 그대로 보관"""
+        data = [{'memo': 'hello'}, Transaction("Alice", "Bob", 1).to_dict(), 7]
+        block = Block(1, data, "0" * 64)
+        assert CompactBlock.from_block(block).to_dict()['data'] == data
+
+    def test_merkle_block_roundtrip(self):
+        """버전 2 블록은 version, merkle_root까지 복원"""
+        txs = [Transaction("Alice", "Bob", 1).to_dict()]
+        block = MerkleBlock(1, txs, "0" * 64)
+        restored = CompactBlock.from_block(block).to_block()
+
+        assert isinstance(restored, MerkleBlock)
+        assert restored.to_dict() == block.to_dict()
+        assert restored.verify_body() is True
+
+
+class TestSlots:
+    """기존 클래스의 __slots__ 테스트"""
+
+    @pytest.mark.parametrize("obj", [
+        Block(1, "데이터", "0"),
+        MerkleBlock(1, [], "0"),
+        Transaction("Alice", "Bob", 1),
+        ECPoint(1, 2)
+    ], ids=["Block", "MerkleBlock", "Transaction", "ECPoint"])
+    def test_no_instance_dict(self, obj):
+        """인스턴스에 __dict__가 없음"""
+        assert not hasattr(obj, '__dict__')
+        with pytest.raises(AttributeError):
+            obj.unknown_attribute = 1
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+타원 곡선 연산 테스트
+
+야코비안 좌표 등 최적화된 스칼라 곱셈을 아핀 좌표 기준 구현과
+교차 검증합니다.
+"""
+
+import pytest
+from src import crypto_utils
+from src.crypto_utils import (
+    ECPoint,
+    G,
+    SECP256K1_N,
+    SECP256K1_P,
+    GLV_BETA,
+    GLV_LAMBDA,
+    batch_inverse,
+    extended_gcd,
+    from_jacobian,
+    is_on_curve,
+    glv_decompose,
+    jacobian_add,
+    jacobian_double,
+    jacobian_to_affine_batch,
+    load_generator_table,
+    mod_inverse,
+    multi_scalar_multiply,
+    point_add,
+    point_multiply,
+    point_multiply_affine,
+    point_multiply_glv,
+    private_key_to_public_key,
+    sign_message,
+    to_jacobian,
+    verify_signature,
+    verify_signatures_batch,
+    wnaf
+)
+
+
+# 결정적인 테스트용 스칼라 (경계값 포함)
+SCALARS = [
+    1, 2, 3, 7, 255, 256,
+    0xDEADBEEF,
+    SECP256K1_N // 2,
+    SECP256K1_N - 2,
+    SECP256K1_N - 1,
+    0x1A2B3C4D5E6F708192A3B4C5D6E7F8091A2B3C4D5E6F708192A3B4C5D6E7F809,
+]
+
+
+def _is_on_curve(point: ECPoint) -> bool:
+    """점이 y^2 = x^3 + 7 위에 있는지 확인"""
+    return (point.y * point.y - point.x ** 3 - 7) % SECP256K1_P == 0
+
+
+class TestModularInverse:
+    """모듈러 역원 테스트"""
+
+    @pytest.mark.parametrize("modulus", [SECP256K1_P, SECP256K1_N, 97])
+    def test_mod_inverse(self, modulus):
+        """a * a^(-1) = 1 (mod m)"""
+        for a in [1, 2, 3, 12345, modulus - 1, -7]:
+            assert a * mod_inverse(a, modulus) % modulus == 1
+
+    def test_mod_inverse_not_exists(self):
+        """역원이 없는 경우"""
+        with pytest.raises(ValueError):
+            mod_inverse(6, 9)
+        with pytest.raises(ValueError):
+            mod_inverse(0, SECP256K1_P)
+
+    def test_extended_gcd(self):
+        """베주 항등식 a*x + b*y = gcd"""
+        for a, b in [(240, 46), (SECP256K1_P - 3, SECP256K1_P), (0, 5), (17, 0)]:
+            g, x, y = extended_gcd(a, b)
+            assert a * x + b * y == g
+
+    def test_batch_inverse(self):
+        """일괄 역원이 개별 역원과 일치"""
+        values = [2, 3, 5, 0xDEADBEEF, SECP256K1_P - 1]
+        assert batch_inverse(values, SECP256K1_P) == [mod_inverse(v, SECP256K1_P) for v in values]
+        assert batch_inverse([], SECP256K1_P) == []
+
+    def test_batch_inverse_zero(self):
+        """0이 포함되면 예외"""
+        with pytest.raises(ValueError):
+            batch_inverse([3, 0, 5], SECP256K1_P)
+
+
+class TestJacobianArithmetic:
+    """야코비안 좌표 연산 테스트"""
+
+    def test_roundtrip(self):
+        """아핀 -> 야코비안 -> 아핀 변환"""
+        assert from_jacobian(to_jacobian(G)) == G
+        assert from_jacobian(to_jacobian(ECPoint.infinity())).is_infinity()
+
+    def test_batch_to_affine(self):
+        """여러 점을 한 번에 아핀 좌표로 변환"""
+        points = [to_jacobian(G), jacobian_double(to_jacobian(G)), (1, 1, 0)]
+        points.append(jacobian_double(points[1]))
+
+        expected = [from_jacobian(point) for point in points]
+        assert jacobian_to_affine_batch(points) == expected
+        assert jacobian_to_affine_batch(points)[2].is_infinity()
+
+    def test_double_matches_affine(self):
+        """더블링 결과 일치"""
+        assert from_jacobian(jacobian_double(to_jacobian(G))) == point_add(G, G)
+
+    def test_add_matches_affine(self):
+        """덧셈 결과 일치 (Z != 1 인 점끼리)"""
+        p2 = jacobian_double(to_jacobian(G))
+        p4 = jacobian_double(p2)
+        expected = point_multiply_affine(6, G)
+        assert from_jacobian(jacobian_add(p2, p4)) == expected
+
+    def test_add_inverse_is_infinity(self):
+        """P + (-P) = 무한원점"""
+        neg_g = ECPoint(G.x, (-G.y) % SECP256K1_P)
+        assert from_jacobian(jacobian_add(to_jacobian(G), to_jacobian(neg_g))).is_infinity()
+
+    @pytest.mark.parametrize("k", SCALARS)
+    def test_point_multiply_matches_reference(self, k):
+        """스칼라 곱셈 결과가 기준 구현과 일치"""
+        result = point_multiply(k, G)
+        assert result == point_multiply_affine(k, G)
+        assert _is_on_curve(result)
+
+    def test_point_multiply_other_base(self):
+        """G가 아닌 점에 대한 스칼라 곱셈"""
+        base = point_multiply_affine(0x12345, G)
+        for k in SCALARS:
+            assert point_multiply(k, base) == point_multiply_affine(k, base)
+
+    def test_point_multiply_edge_cases(self):
+        """0, 군의 위수, 음수 스칼라"""
+        assert point_multiply(0, G).is_infinity()
+        assert point_multiply(SECP256K1_N, G).is_infinity()
+        assert point_multiply(5, ECPoint.infinity()).is_infinity()
+        assert point_multiply(-5, G) == point_multiply_affine(-5, G)
+
+
+class TestGeneratorTable:
+    """G 고정 기저 테이블 테스트"""
+
+    @pytest.mark.parametrize("k", SCALARS + [15, 16, 17, -3, SECP256K1_N + 5])
+    def test_matches_reference(self, k):
+        """테이블 기반 k*G가 기준 구현과 일치"""
+        assert point_multiply(k, G) == point_multiply_affine(k % SECP256K1_N, G)
+
+    def test_lazy_build(self, monkeypatch):
+        """처음 사용할 때 테이블 생성"""
+        monkeypatch.setattr(crypto_utils, '_generator_table', None)
+
+        assert point_multiply(12345, G) == point_multiply_affine(12345, G)
+        assert crypto_utils._generator_table is not None
+
+    def test_persist_and_reload(self, tmp_path, monkeypatch):
+        """파일로 저장한 테이블 다시 읽기"""
+        path = str(tmp_path / "g_table.bin")
+        load_generator_table(path)
+        saved = crypto_utils._generator_table
+
+        monkeypatch.setattr(crypto_utils, '_generator_table', None)
+        load_generator_table(path)
+
+        assert crypto_utils._generator_table == saved
+        assert point_multiply(SCALARS[-1], G) == point_multiply_affine(SCALARS[-1], G)
+
+    def test_corrupted_file_rebuilt(self, tmp_path, monkeypatch):
+        """손상된 파일은 무시하고 다시 계산하여 저장"""
+        path = tmp_path / "g_table.bin"
+        path.write_bytes(b"corrupted")
+        monkeypatch.setattr(crypto_utils, '_generator_table', None)
+
+        load_generator_table(str(path))
+
+        assert crypto_utils._generator_table[0][0] == (G.x, G.y)
+        assert path.stat().st_size > len(b"corrupted")
+
+
+class TestMultiScalarMultiplication:
+    """Straus/Shamir 다중 스칼라 곱셈 테스트"""
+
+    @pytest.mark.parametrize("k", SCALARS)
+    @pytest.mark.parametrize("window", [2, 4, 5, 7])
+    def test_wnaf_reconstructs_scalar(self, k, window):
+        """wNAF 자릿수로 원래 스칼라 복원"""
+        digits = wnaf(k, window)
+
+        assert sum(d << i for i, d in enumerate(digits)) == k
+        assert all(d % 2 == 1 and abs(d) < (1 << (window - 1)) for d in digits if d)
+
+    def test_two_scalars_match_reference(self):
+        """u1*G + u2*Q가 기준 구현과 일치"""
+        q = point_multiply_affine(0xABCDEF, G)
+        for u1, u2 in zip(SCALARS, reversed(SCALARS)):
+            expected = point_add(point_multiply_affine(u1, G), point_multiply_affine(u2, q))
+            assert multi_scalar_multiply([u1, u2], [G, q]) == expected
+
+    def test_three_points(self):
+        """세 개 이상의 항"""
+        p1 = point_multiply_affine(11, G)
+        p2 = point_multiply_affine(13, G)
+        result = multi_scalar_multiply([2, 3, 5], [G, p1, p2])
+
+        assert result == point_multiply_affine(2 + 33 + 65, G)
+
+    def test_cancellation_and_zero(self):
+        """결과가 무한원점이거나 스칼라가 0인 경우"""
+        neg_g = ECPoint(G.x, (-G.y) % SECP256K1_P)
+
+        assert multi_scalar_multiply([7, 7], [G, neg_g]).is_infinity()
+        assert multi_scalar_multiply([0, 0], [G, G]).is_infinity()
+        assert multi_scalar_multiply([0, 9], [G, G]) == point_multiply_affine(9, G)
+
+    def test_length_mismatch(self):
+        """스칼라와 점 개수 불일치"""
+        with pytest.raises(ValueError):
+            multi_scalar_multiply([1, 2], [G])
+
+
+class TestBatchSignatureVerification:
+    """verify_signatures_batch 테스트"""
+
+    def test_batch_matches_single(self):
+        """일괄 검증 결과가 개별 검증과 일치"""
+        keys = [0x1111, 0x2222]
+        publics = [(p.x, p.y) for p in (point_multiply_affine(k, G) for k in keys)]
+        items = []
+        for i in range(6):
+            message = f"메시지 {i}"
+            signature = sign_message(keys[i % 2], message)
+            items.append((publics[i % 2], message, signature))
+        # 다른 키로 검증되는 항목과 메시지가 바뀐 항목
+        items.append((publics[0], items[1][1], items[1][2]))
+        items.append((publics[1], "변조", items[1][2]))
+
+        results = verify_signatures_batch(items)
+
+        assert results == [verify_signature(*item) for item in items]
+        assert results == [True] * 6 + [False, False]
+
+    def test_invalid_public_key(self):
+        """곡선 밖의 공개키는 예외 없이 무효 처리"""
+        key = 0x1111
+        public = point_multiply_affine(key, G)
+        signature = sign_message(key, "메시지")
+        off_curve = (0, 1)
+
+        assert not is_on_curve(off_curve)
+        assert not is_on_curve((SECP256K1_P, public.y))
+        assert is_on_curve((public.x, public.y))
+        assert verify_signature(off_curve, "abc", (5, 7)) is False
+        assert verify_signatures_batch([
+            (off_curve, "abc", (5, 7)),
+            ((public.x, public.y), "메시지", signature),
+        ]) == [False, True]
+        with pytest.raises(ValueError):
+            crypto_utils.precompute_public_key(off_curve)
+
+
+class TestGLV:
+    """GLV 엔도모피즘 스칼라 곱셈 테스트"""
+
+    def test_endomorphism_constants(self):
+        """lambda * G = (beta * Gx, Gy)"""
+        result = point_multiply_affine(GLV_LAMBDA, G)
+        assert result == ECPoint(GLV_BETA * G.x % SECP256K1_P, G.y)
+
+    @pytest.mark.parametrize("k", SCALARS)
+    def test_decompose(self, k):
+        """k = k1 + k2 * lambda (mod n), 각 항은 약 128비트"""
+        k1, k2 = glv_decompose(k)
+
+        assert (k1 + k2 * GLV_LAMBDA - k) % SECP256K1_N == 0
+        assert abs(k1) < 2 ** 129 and abs(k2) < 2 ** 129
+
+    @pytest.mark.parametrize("k", SCALARS + [SECP256K1_N, -9])
+    def test_matches_reference(self, k):
+        """GLV 곱셈이 기준 구현과 일치"""
+        base = point_multiply_affine(0xC0FFEE, G)
+        assert point_multiply_glv(k, base) == point_multiply_affine(k % SECP256K1_N, base)
+
+    @pytest.mark.parametrize("use_glv", [True, False])
+    def test_selectable(self, use_glv, monkeypatch):
+        """USE_GLV 설정과 무관하게 같은 결과와 서명 검증"""
+        monkeypatch.setattr(crypto_utils, 'USE_GLV', use_glv)
+        base = point_multiply_affine(0xBEEF, G)
+        private_key = 0xA5A5A5
+        public_key = private_key_to_public_key(private_key)
+        signature = sign_message(private_key, "GLV")
+
+        for k in SCALARS:
+            assert point_multiply(k, base) == point_multiply_affine(k, base)
+        assert verify_signature(public_key, "GLV", signature) is True
+        assert verify_signature(public_key, "GLV!", signature) is False
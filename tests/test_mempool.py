@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+Mempool 클래스 테스트
+
+txid 중복 제거, 발신자 인덱스, 수수료율 순 선택, 최대 크기 초과 시
+제거 정책, 리스트 호환 동작을 테스트합니다.
+"""
+
+import pytest
+from src.mempool import Mempool, transaction_size
+from src.transaction import Transaction
+
+
+def _tx(sender="Alice", recipient="Bob", amount=10, fee=0, timestamp=None):
+    """timestamp를 고정한 트랜잭션"""
+    tx = Transaction(sender, recipient, amount, fee)
+    tx.timestamp = timestamp or f"2025-01-01T00:00:{amount % 60:02d}.{int(fee * 1000):06d}"
+    return tx
+
+
+@pytest.fixture
+def mempool():
+    """최대 5개인 멤풀"""
+    return Mempool(max_size=5)
+
+
+class TestAddRemove:
+    """추가와 제거 테스트"""
+
+    def test_add_and_contains(self, mempool):
+        """추가한 트랜잭션은 객체와 txid로 확인 가능"""
+        tx = _tx()
+        assert mempool.add(tx)
+        assert tx in mempool
+        assert tx.txid in mempool
+        assert mempool.get(tx.txid) is tx
+        assert len(mempool) == 1
+
+    def test_duplicate_rejected(self, mempool):
+        """같은 txid는 한 번만 추가"""
+        tx = _tx()
+        assert mempool.add(tx)
+        assert not mempool.add(_tx())
+        assert len(mempool) == 1
+
+    def test_remove(self, mempool):
+        """제거 후 발신자 인덱스에서도 사라짐"""
+        first, second = _tx(amount=1), _tx(amount=2)
+        mempool.add(first)
+        mempool.add(second)
+
+        assert mempool.remove(first.txid) is first
+        assert mempool.remove(first.txid) is None
+        assert mempool.by_sender("Alice") == [second]
+        assert mempool.remove_many([second.txid, "missing"]) == 1
+        assert mempool.by_sender("Alice") == []
+
+    def test_by_sender(self, mempool):
+        """발신자별 조회 (추가된 순서)"""
+        txs = [_tx("Alice", amount=1), _tx("Bob", "Alice", 2), _tx("Alice", amount=3)]
+        for tx in txs:
+            mempool.add(tx)
+
+        assert mempool.by_sender("Alice") == [txs[0], txs[2]]
+        assert mempool.by_sender("Carol") == []
+
+    def test_clear(self, mempool):
+        """전체 제거"""
+        mempool.add(_tx())
+        mempool.clear()
+        assert len(mempool) == 0
+        assert mempool.select() == []
+
+    def test_invalid_max_size(self):
+        """잘못된 최대 크기"""
+        with pytest.raises(ValueError):
+            Mempool(max_size=0)
+
+
+class TestSelection:
+    """수수료율 순 선택 테스트"""
+
+    def test_fee_rate_order(self, mempool):
+        """수수료율 높은 순, 같으면 먼저 들어온 순"""
+        low, high, none_a, none_b = _tx(amount=1, fee=0.1), _tx(amount=2, fee=5), \
+            _tx(amount=3), _tx(amount=4)
+        for tx in (none_a, low, high, none_b):
+            mempool.add(tx)
+
+        assert mempool.select() == [high, low, none_a, none_b]
+        assert mempool.select(limit=2) == [high, low]
+
+    def test_fee_rate_uses_size(self, mempool):
+        """같은 수수료면 크기가 작은 트랜잭션이 앞섬"""
+        small = _tx(amount=1, fee=1)
+        large = _tx(recipient="B" * 500, amount=2, fee=1)
+        mempool.add(large)
+        mempool.add(small)
+
+        assert transaction_size(large) > transaction_size(small)
+        assert mempool.select() == [small, large]
+
+    def test_select_does_not_remove(self, mempool):
+        """선택은 멤풀을 바꾸지 않음"""
+        for amount in range(1, 4):
+            mempool.add(_tx(amount=amount, fee=amount))
+        mempool.select(limit=2)
+
+        assert len(mempool) == 3
+        assert len(mempool.select()) == 3
+
+    def test_max_bytes(self, mempool):
+        """크기 제한을 넘는 트랜잭션은 건너뛰고 작은 트랜잭션 선택"""
+        large = _tx(recipient="B" * 500, amount=1, fee=100)
+        small = [_tx(amount=i, fee=i) for i in range(2, 4)]
+        for tx in [large] + small:
+            mempool.add(tx)
+
+        budget = sum(transaction_size(tx) + 2 for tx in small)
+        assert mempool.select(max_bytes=budget) == [small[1], small[0]]
+        assert mempool.select(limit=1, max_bytes=budget) == [small[1]]
+        assert mempool.select(max_bytes=1) == []
+        assert len(mempool.select()) == 3
+
+    def test_removed_skipped(self, mempool):
+        """제거된 트랜잭션은 선택되지 않음"""
+        txs = [_tx(amount=i, fee=i) for i in range(1, 4)]
+        for tx in txs:
+            mempool.add(tx)
+        mempool.remove(txs[2].txid)
+
+        assert mempool.select() == [txs[1], txs[0]]
+
+    def test_readd_after_remove(self, mempool):
+        """제거 후 다시 추가해도 한 번만 선택"""
+        tx = _tx(fee=1)
+        mempool.add(tx)
+        mempool.remove(tx.txid)
+        mempool.add(tx)
+
+        assert mempool.select() == [tx]
+
+    def test_heaps_compacted(self):
+        """추가/제거를 반복해도 힙이 계속 커지지 않음"""
+        mempool = Mempool()
+        for i in range(1000):
+            tx = _tx(amount=i, fee=i % 7)
+            mempool.add(tx)
+            mempool.remove(tx.txid)
+
+        assert len(mempool._best) + len(mempool._worst) <= 64
+
+
+class TestEviction:
+    """최대 크기 초과 테스트"""
+
+    def test_evicts_lowest_fee_rate(self, mempool):
+        """가득 차면 수수료율이 가장 낮은 트랜잭션 제거"""
+        txs = [_tx(amount=i, fee=i) for i in range(1, 6)]
+        for tx in txs:
+            mempool.add(tx)
+
+        rich = _tx(amount=6, fee=10)
+        assert mempool.add(rich)
+        assert len(mempool) == 5
+        assert txs[0] not in mempool
+        assert mempool.evicted == 1
+
+    def test_rejects_lower_fee_rate(self, mempool):
+        """가득 찼을 때 수수료율이 더 낮으면 거부"""
+        for i in range(1, 6):
+            mempool.add(_tx(amount=i, fee=i))
+
+        assert not mempool.add(_tx(amount=7))
+        assert len(mempool) == 5
+        assert mempool.evicted == 0
+
+    def test_evicts_newest_on_tie(self, mempool):
+        """수수료율이 같으면 나중에 들어온 트랜잭션부터 제거"""
+        txs = [_tx(amount=i) for i in range(1, 6)]
+        for tx in txs:
+            mempool.add(tx)
+        mempool.add(_tx(amount=9, fee=1))
+
+        assert txs[-1] not in mempool
+        assert txs[0] in mempool
+
+
+class TestPinned:
+    """고정 항목 테스트"""
+
+    def test_pinned_not_evicted(self, mempool):
+        """고정 항목은 가득 차도 제거되지 않고 max_size에 포함되지 않음"""
+        reward = _tx("SYSTEM", "Miner", 100)
+        assert mempool.add(reward, pinned=True)
+        for i in range(1, 8):
+            mempool.add(_tx(amount=i, fee=i))
+
+        assert reward in mempool
+        assert len(mempool) == 6
+        assert mempool.evicted == 2
+
+    def test_pinned_selected_first(self, mempool):
+        """고정 항목은 수수료율과 관계없이 가장 먼저 선택"""
+        rich = _tx(amount=1, fee=50)
+        reward = _tx("SYSTEM", "Miner", 100)
+        mempool.add(rich)
+        mempool.add(reward, pinned=True)
+
+        assert mempool.select() == [reward, rich]
+        assert mempool.select(limit=1) == [reward]
+
+    def test_pinned_remove(self, mempool):
+        """고정 항목 제거 후에는 일반 용량 계산"""
+        reward = _tx("SYSTEM", "Miner", 100)
+        mempool.add(reward, pinned=True)
+        mempool.remove(reward.txid)
+        for i in range(1, 6):
+            mempool.add(_tx(amount=i, fee=i))
+
+        assert not mempool.add(_tx(amount=9))
+        assert mempool._pinned == 0
+
+
+class TestListCompatibility:
+    """리스트 호환 동작 테스트"""
+
+    def test_len_iter_index(self, mempool):
+        """len, 순회, 인덱싱은 추가된 순서"""
+        txs = [_tx(amount=1, fee=0), _tx(amount=2, fee=9)]
+        for tx in txs:
+            mempool.add(tx)
+
+        assert len(mempool) == 2
+        assert list(mempool) == txs
+        assert mempool[0] is txs[0]
+        assert mempool[-1] is txs[1]
+        assert mempool[:1] == txs[:1]
+        assert bool(Mempool()) is False
+
+    def test_page(self, mempool):
+        """추가된 순서의 일부 조회"""
+        txs = [_tx(amount=i) for i in range(1, 6)]
+        for tx in txs:
+            mempool.add(tx)
+
+        assert mempool.page(1, 2) == txs[1:3]
+        assert mempool.page(4) == txs[4:]
+        assert mempool.page(10, 5) == []
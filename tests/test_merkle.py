@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+머클 트리 및 MerkleBlock 테스트
+
+머클 루트 계산, 포함 증명, 헤더 기반 블록 해시를 테스트합니다.
+"""
+
+import hashlib
+import pytest
+from src.block import MerkleBlock
+from src.merkle import (
+    EMPTY_MERKLE_ROOT,
+    hash_leaf,
+    merkle_root,
+    merkle_proof,
+    verify_merkle_proof
+)
+
+
+def _transactions(count):
+    """테스트용 트랜잭션 딕셔너리 리스트"""
+    return [
+        {'sender': 'Alice', 'recipient': f'user{i}', 'amount': i + 1,
+         'timestamp': '2025-01-01T00:00:00'}
+        for i in range(count)
+    ]
+
+
+class TestMerkleTree:
+    """머클 트리 테스트"""
+
+    def test_empty_root(self):
+        """빈 리스트의 머클 루트"""
+        assert merkle_root([]) == EMPTY_MERKLE_ROOT
+
+    def test_single_leaf_root(self):
+        """리프가 하나면 루트는 리프 해시"""
+        leaf = hash_leaf({'tx': 1})
+        assert merkle_root([leaf]) == leaf
+
+    def test_root_changes_with_leaf(self):
+        """리프가 바뀌면 루트도 변경"""
+        leaves = [hash_leaf(tx) for tx in _transactions(4)]
+        tampered = leaves[:2] + [hash_leaf({'tx': 'fake'})] + leaves[3:]
+        assert merkle_root(leaves) != merkle_root(tampered)
+
+    @pytest.mark.parametrize("count", [1, 2, 3, 5, 8, 13])
+    def test_proof_for_every_leaf(self, count):
+        """모든 리프의 포함 증명 검증"""
+        leaves = [hash_leaf(tx) for tx in _transactions(count)]
+        root = merkle_root(leaves)
+
+        for i, leaf in enumerate(leaves):
+            proof = merkle_proof(leaves, i)
+            assert verify_merkle_proof(leaf, proof, root) is True
+
+    def test_proof_rejects_wrong_leaf(self):
+        """다른 리프로는 증명 실패"""
+        leaves = [hash_leaf(tx) for tx in _transactions(5)]
+        root = merkle_root(leaves)
+        proof = merkle_proof(leaves, 2)
+
+        assert verify_merkle_proof(leaves[3], proof, root) is False
+        assert verify_merkle_proof(leaves[2], proof, '0' * 64) is False
+
+    def test_proof_index_out_of_range(self):
+        """범위를 벗어난 인덱스"""
+        with pytest.raises(IndexError):
+            merkle_proof([hash_leaf(1)], 1)
+
+
+class TestMerkleBlock:
+    """버전 2 블록 테스트"""
+
+    def test_header_contains_merkle_root(self):
+        """헤더에 머클 루트 포함"""
+        txs = _transactions(3)
+        block = MerkleBlock(1, txs, "0" * 64)
+
+        assert block.version == 2
+        assert block.header()['merkle_root'] == block.merkle_root
+        assert block.to_dict()['merkle_root'] == block.merkle_root
+        assert block.verify_body() is True
+
+    def test_hash_covers_header_only(self):
+        """해시는 헤더만으로 계산"""
+        block = MerkleBlock(1, _transactions(100), "0" * 64)
+        block.data = None  # 본문이 없어도 헤더 해시는 동일
+
+        assert block.calculate_hash() == block.hash
+        assert block.verify_body() is False
+
+    def test_pow_template_matches_hash(self):
+        """헤더 채굴 템플릿이 calculate_hash와 일치"""
+        block = MerkleBlock(2, _transactions(4), "ab" * 32)
+        prefix, suffix = block.pow_template()
+
+        for nonce in (0, 42, 99999):
+            block.nonce = nonce
+            digest = hashlib.sha256(prefix + str(nonce).encode() + suffix).hexdigest()
+            assert digest == block.calculate_hash()
+
+    def test_mine_block(self, capsys):
+        """버전 2 블록 채굴"""
+        block = MerkleBlock(1, _transactions(10), "0" * 64)
+        block.mine_block(2)
+
+        assert block.hash.startswith("00")
+        assert block.hash == block.calculate_hash()
+
+    def test_transaction_proof(self):
+        """블록 헤더만으로 트랜잭션 포함 검증"""
+        txs = _transactions(7)
+        block = MerkleBlock(1, txs, "0" * 64)
+
+        proof = block.get_merkle_proof(4)
+        assert verify_merkle_proof(hash_leaf(txs[4]), proof, block.merkle_root) is True
+        assert verify_merkle_proof(hash_leaf(txs[5]), proof, block.merkle_root) is False
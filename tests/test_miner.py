@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+ParallelMiner 클래스 테스트
+
+병렬 채굴 결과가 직렬 채굴과 동일한지, 블록체인과 연동되는지 테스트합니다.
+"""
+
+import pytest
+from src.block import Block
+from src.blockchain import Blockchain
+from src.miner import ParallelMiner
+from src.transaction import Transaction
+
+
+@pytest.fixture
+def miner():
+    """작은 구간을 사용하는 2-프로세스 채굴기"""
+    with ParallelMiner(processes=2, chunk_size=64) as m:
+        yield m
+
+
+def _make_pair(data, timestamp="2025-01-01T00:00:00"):
+    """같은 내용의 블록 두 개 생성"""
+    blocks = []
+    for _ in range(2):
+        block = Block(1, data, "0" * 64)
+        block.timestamp = timestamp
+        block.hash = block.calculate_hash()
+        blocks.append(block)
+    return blocks
+
+
+class TestParallelMining:
+    """병렬 채굴 테스트"""
+
+    @pytest.mark.parametrize("difficulty", [1, 2, 3])
+    def test_same_result_as_serial(self, miner, difficulty, capsys):
+        """직렬 채굴과 같은 nonce와 해시"""
+        serial, parallel = _make_pair("병렬 채굴 테스트")
+
+        serial.mine_block(difficulty)
+        miner.mine(parallel, difficulty)
+
+        assert parallel.nonce == serial.nonce
+        assert parallel.hash == serial.hash
+        assert parallel.hash.startswith("0" * difficulty)
+
+    def test_same_result_with_transactions(self, miner, capsys):
+        """트랜잭션 리스트 데이터도 동일한 결과"""
+        txs = [Transaction("SYSTEM", f"user{i}", i + 1).to_dict() for i in range(20)]
+        serial, parallel = _make_pair(txs)
+
+        serial.mine_block(2)
+        miner.mine(parallel, 2)
+
+        assert (parallel.nonce, parallel.hash) == (serial.nonce, serial.hash)
+
+    def test_mine_output(self, miner, capsys):
+        """채굴 완료 메시지 출력 확인"""
+        block = Block(0, "테스트", "0")
+        miner.mine(block, 1)
+
+        captured = capsys.readouterr()
+        assert "채굴 완료" in captured.out
+
+    def test_invalid_chunk_size(self):
+        """잘못된 구간 크기"""
+        with pytest.raises(ValueError):
+            ParallelMiner(processes=1, chunk_size=0)
+
+
+class TestBlockchainWithMiner:
+    """블록체인 연동 테스트"""
+
+    def test_blockchain_uses_miner(self, miner, capsys):
+        """add_block과 mine_pending_transactions가 채굴기를 사용"""
+        bc = Blockchain(difficulty=2, miner=miner)
+        bc.add_block("블록 1")
+        bc.add_transaction(Transaction("SYSTEM", "Alice", 100))
+        bc.mine_pending_transactions("Miner")
+
+        assert len(bc) == 3
+        assert all(block.hash.startswith("00") for block in bc.chain)
+        assert bc.is_chain_valid() is True
@@ -11,6 +11,7 @@ from unittest.mock import patch, MagicMock
 from src.network import create_app
 from src.blockchain import Blockchain
 from src.node import Node
+from src.codec import MEDIA_TYPE, decode_chain, encode_chain
 
 
 @pytest.fixture
@@ -56,6 +57,15 @@ class TestChainEndpoints:
         assert 'length' in data
         assert len(data['chain']) == data['length']
 
+    def test_get_chain_binary(self, client):
+        """Accept 헤더로 바이너리 체인 요청"""
+        json_chain = json.loads(client.get('/chain').data)['chain']
+        response = client.get('/chain', headers={'Accept': MEDIA_TYPE})
+
+        assert response.status_code == 200
+        assert response.mimetype == MEDIA_TYPE
+        assert decode_chain(response.data) == json_chain
+
     def test_validate_chain(self, client):
         """체인 유효성 검증"""
         response = client.get('/chain/valid')
@@ -64,6 +74,15 @@ class TestChainEndpoints:
         assert response.status_code == 200
         assert data['valid'] is True
 
+    def test_validate_chain_full(self, client):
+        """전체 재검증 옵션"""
+        client.get('/chain/valid')
+        response = client.get('/chain/valid?full=true')
+        data = json.loads(response.data)
+
+        assert response.status_code == 200
+        assert data['valid'] is True
+
     def test_get_block(self, client):
         """특정 블록 조회"""
         response = client.get('/blocks/0')
@@ -169,6 +188,36 @@ class TestTransactionEndpoints:
         assert response.status_code == 201
         assert data['transaction']['signature'] == 'abc123'
 
+    def test_transaction_with_fee(self, client):
+        """수수료 포함 트랜잭션"""
+        tx_data = {'sender': 'Alice', 'recipient': 'Bob', 'amount': 50, 'fee': 0.5}
+        response = client.post(
+            '/transactions/new',
+            data=json.dumps(tx_data),
+            content_type='application/json'
+        )
+
+        assert response.status_code == 201
+        assert json.loads(response.data)['transaction']['fee'] == 0.5
+
+    def test_pending_pagination(self, client):
+        """offset, limit으로 펜딩 트랜잭션 페이지 조회"""
+        for amount in range(1, 6):
+            client.post('/transactions/new', data=json.dumps(
+                {'sender': 'Alice', 'recipient': 'Bob', 'amount': amount}),
+                content_type='application/json')
+
+        data = json.loads(client.get('/transactions/pending?offset=1&limit=2').data)
+
+        assert data['count'] == 5
+        assert [tx['amount'] for tx in data['pending_transactions']] == [2, 3]
+        assert data['offset'] == 1 and data['limit'] == 2
+
+    def test_pending_invalid_page(self, client):
+        """잘못된 페이지 인자"""
+        assert client.get('/transactions/pending?limit=0').status_code == 400
+        assert client.get('/transactions/pending?offset=-1').status_code == 400
+
 
 class TestMiningEndpoint:
     """채굴 엔드포인트 테스트"""
@@ -361,6 +410,22 @@ class TestNodeClass:
         assert result is not None
         assert result['length'] == 1
 
+    @patch('requests.get')
+    def test_fetch_chain_binary(self, mock_get, blockchain):
+        """바이너리 응답을 블록 딕셔너리로 복원"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': MEDIA_TYPE}
+        mock_response.content = encode_chain(blockchain.chain)
+        mock_get.return_value = mock_response
+
+        node = Node()
+        result = node.fetch_chain('localhost:5001')
+
+        assert result['length'] == len(blockchain)
+        assert result['chain'] == [block.to_dict() for block in blockchain.chain]
+        assert MEDIA_TYPE in mock_get.call_args.kwargs['headers']['Accept']
+
     @patch('requests.get')
     def test_fetch_chain_failure(self, mock_get):
         """체인 가져오기 실패"""
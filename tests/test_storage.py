@@ -7,7 +7,9 @@ SQLite 저장소 기능을 테스트합니다.
 
 import pytest
 import os
+import sqlite3
 import tempfile
+from src.block import MerkleBlock
 from src.storage import BlockchainStorage
 
 
@@ -157,6 +159,370 @@ class TestBlockStorage:
         assert '제네시스' in retrieved['data']
 
 
+class TestBinaryDataEncoding:
+    """바이너리 data 컬럼 테스트"""
+
+    @pytest.fixture
+    def binary_storage(self, tmp_path):
+        store = BlockchainStorage(str(tmp_path / 'binary.db'), data_encoding='binary')
+        yield store
+        store.close()
+
+    def test_roundtrip(self, binary_storage):
+        """트랜잭션 리스트와 문자열 data 모두 복원"""
+        blocks = [
+            {'index': 0, 'timestamp': '2025-01-01T00:00:00', 'data': '제네시스',
+             'previous_hash': '0', 'nonce': 0, 'hash': 'ab' * 32},
+            {'index': 1, 'timestamp': '2025-01-01T00:01:00',
+             'data': [{'sender': 'SYSTEM', 'recipient': 'Alice', 'amount': 100,
+                       'timestamp': '2025-01-01T00:00:30'}],
+             'previous_hash': 'ab' * 32, 'nonce': 7, 'hash': 'cd' * 32}
+        ]
+        for block in blocks:
+            binary_storage.save_block(block)
+
+        assert binary_storage.get_all_blocks() == blocks
+
+    def test_mixed_encodings(self, tmp_path):
+        """JSON과 바이너리로 저장된 행을 함께 읽기"""
+        path = str(tmp_path / 'mixed.db')
+        block = {'index': 0, 'timestamp': '2025-01-01T00:00:00', 'data': [1, 2],
+                 'previous_hash': '0', 'nonce': 0, 'hash': 'h0'}
+        with BlockchainStorage(path) as store:
+            store.save_block(block)
+        with BlockchainStorage(path, data_encoding='binary') as store:
+            store.save_block({**block, 'index': 1, 'hash': 'h1'})
+
+        with BlockchainStorage(path) as store:
+            blocks = store.get_all_blocks()
+        assert [b['data'] for b in blocks] == [[1, 2], [1, 2]]
+
+    def test_invalid_encoding(self, tmp_path):
+        """지원하지 않는 인코딩"""
+        with pytest.raises(ValueError):
+            BlockchainStorage(str(tmp_path / 'x.db'), data_encoding='xml')
+
+
+class TestConnectionLifecycle:
+    """연결 재사용과 수명 관리 테스트"""
+
+    def test_connection_reused(self, storage):
+        """같은 스레드에서는 같은 연결을 재사용"""
+        assert storage._get_connection() is storage._get_connection()
+
+    def test_connection_per_thread(self, storage):
+        """스레드마다 별도 연결 (스레드가 끝나면 닫힘)"""
+        import threading
+        connections = []
+        ready, done = threading.Event(), threading.Event()
+
+        def work():
+            connections.append(storage._get_connection())
+            ready.set()
+            done.wait()
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        ready.wait()
+
+        assert connections[0] is not storage._get_connection()
+        assert len(storage._connections) == 2
+
+        done.set()
+        thread.join()
+        assert len(storage._connections) == 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            connections[0].execute('SELECT 1')
+
+    def test_short_lived_threads_do_not_leak(self, storage, sample_block):
+        """요청마다 스레드를 만들어도 열린 연결 수가 늘지 않음"""
+        import threading
+        storage.save_block(sample_block)
+        for _ in range(200):
+            thread = threading.Thread(target=storage.get_block_count)
+            thread.start()
+            thread.join()
+
+        assert len(storage._connections) <= 1
+
+    def test_concurrent_access(self, storage, sample_block):
+        """여러 스레드에서 동시에 조회/저장"""
+        from concurrent.futures import ThreadPoolExecutor
+        storage.save_block(sample_block)
+
+        def work(i):
+            storage.set_metadata(f'key{i}', str(i))
+            return storage.get_block(0)['hash']
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            hashes = list(executor.map(work, range(20)))
+
+        assert hashes == [sample_block['hash']] * 20
+        assert storage.get_metadata('key19') == '19'
+
+    def test_pragmas_applied(self, tmp_path):
+        """WAL 모드와 PRAGMA 설정"""
+        with BlockchainStorage(str(tmp_path / 'p.db'), synchronous='full',
+                               cache_size=-2000, mmap_size=0) as store:
+            conn = store._get_connection()
+            assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+            assert conn.execute('PRAGMA synchronous').fetchone()[0] == 2
+            assert conn.execute('PRAGMA cache_size').fetchone()[0] == -2000
+
+    def test_invalid_pragma(self, tmp_path):
+        """허용하지 않는 PRAGMA 값"""
+        with pytest.raises(ValueError):
+            BlockchainStorage(str(tmp_path / 'x.db'), synchronous='FAST; DROP TABLE blocks')
+
+    def test_close_and_reopen(self, storage, sample_block):
+        """close() 후 다시 사용하면 새 연결"""
+        storage.save_block(sample_block)
+        old = storage._get_connection()
+        storage.close()
+
+        assert not storage._connections
+        assert storage.get_block(0)['hash'] == sample_block['hash']
+        assert storage._get_connection() is not old
+
+    def test_context_manager(self, tmp_path, sample_block):
+        """with 문을 벗어나면 연결이 닫힘"""
+        with BlockchainStorage(str(tmp_path / 'ctx.db')) as store:
+            store.save_block(sample_block)
+            conn = store._get_connection()
+
+        with pytest.raises(Exception):
+            conn.execute('SELECT 1')
+
+    def test_failed_write_rolled_back(self, storage, sample_block):
+        """쓰기 도중 예외가 나면 롤백"""
+        with pytest.raises(KeyError):
+            storage.save_block({k: v for k, v in sample_block.items() if k != 'hash'})
+
+        storage.set_metadata('k', 'v')
+        assert storage.get_block_count() == 0
+
+
+def _mined_block(index, count, previous_hash='0'):
+    """트랜잭션 count개가 담긴 블록 딕셔너리"""
+    return {
+        'index': index,
+        'timestamp': '2025-01-01T00:00:00',
+        'data': [
+            {'sender': 'Alice', 'recipient': f'user{i}', 'amount': i + 1,
+             'timestamp': f'2025-01-01T00:00:{i % 60:02d}.{index:06d}'}
+            for i in range(count)
+        ],
+        'previous_hash': previous_hash,
+        'nonce': index,
+        'hash': f'hash{index}'
+    }
+
+
+class TestAtomicBlockSave:
+    """블록과 트랜잭션 일괄 저장 테스트"""
+
+    def test_save_block_with_transactions(self, storage):
+        """블록 data의 트랜잭션이 함께 저장"""
+        block = _mined_block(1, 5)
+        storage.save_block_with_transactions(block)
+
+        assert storage.get_block(1) == block
+        txs = storage.get_transactions_by_block(1)
+        assert [tx['recipient'] for tx in txs] == [f'user{i}' for i in range(5)]
+
+    def test_explicit_transactions(self, storage):
+        """트랜잭션을 직접 지정"""
+        block = {**_mined_block(1, 0), 'data': '요약 데이터'}
+        tx = {'sender': 'A', 'recipient': 'B', 'amount': 3, 'timestamp': 't'}
+        storage.save_block_with_transactions(block, [tx])
+
+        assert len(storage.get_transactions_by_block(1)) == 1
+
+    def test_pending_cleanup(self, storage):
+        """블록에 포함된 트랜잭션만 펜딩 테이블에서 삭제"""
+        block = _mined_block(1, 3)
+        for tx in block['data']:
+            storage.save_transaction(tx)
+        other = {'sender': 'Carol', 'recipient': 'Dave', 'amount': 1, 'timestamp': 'later'}
+        storage.save_transaction(other)
+
+        storage.save_block_with_transactions(block)
+
+        assert storage.get_pending_transactions() == [other]
+
+    def test_keep_pending(self, storage):
+        """clear_pending=False면 펜딩 유지"""
+        block = _mined_block(1, 2)
+        storage.save_transaction(block['data'][0])
+        storage.save_block_with_transactions(block, clear_pending=False)
+
+        assert len(storage.get_pending_transactions()) == 1
+
+    def test_replace_block(self, storage):
+        """같은 인덱스를 다시 저장하면 트랜잭션도 교체"""
+        storage.save_block_with_transactions(_mined_block(1, 5))
+        storage.save_block_with_transactions(_mined_block(1, 2))
+
+        assert len(storage.get_transactions_by_block(1)) == 2
+
+    def test_atomic_on_failure(self, storage):
+        """트랜잭션 저장이 실패하면 블록도 저장되지 않음"""
+        block = _mined_block(1, 3)
+        block['data'][2] = {**block['data'][2], 'sender': None}
+
+        with pytest.raises(Exception):
+            storage.save_block_with_transactions(block)
+
+        assert storage.get_block_count() == 0
+        assert storage.get_transactions_by_block(1) == []
+
+    def test_save_blocks(self, storage):
+        """여러 블록을 한 번에 저장"""
+        blocks = [_mined_block(i, i, previous_hash=f'hash{i - 1}') for i in range(1, 6)]
+        assert storage.save_blocks(blocks) == 5
+
+        assert storage.get_all_blocks() == blocks
+        assert sum(len(storage.get_transactions_by_block(i)) for i in range(1, 6)) == 15
+        assert storage.get_balance('Alice') == -sum(i * (i + 1) // 2 for i in range(1, 6))
+
+
+class TestBlockVersion:
+    """블록 형식 버전 저장 테스트"""
+
+    def test_merkle_block_round_trip(self, storage):
+        """버전 2 블록의 version, merkle_root 보존"""
+        block = MerkleBlock(1, [{'sender': 'A', 'recipient': 'B', 'amount': 1,
+                                 'timestamp': '2025-01-01T00:00:00'}], '0' * 64)
+        storage.save_block_with_transactions(block.to_dict())
+
+        assert storage.get_block(1) == block.to_dict()
+        assert storage.get_block(1)['version'] == 2
+
+    def test_version_1_unchanged(self, storage, sample_block):
+        """버전 1 블록 딕셔너리에는 version 키를 추가하지 않음"""
+        storage.save_block(sample_block)
+        assert storage.get_block(0) == sample_block
+
+    def test_existing_database_migrated(self):
+        """version, fee 컬럼이 없던 기존 DB에 컬럼 추가"""
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        conn = sqlite3.connect(path)
+        conn.execute('''
+            CREATE TABLE blocks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                block_index INTEGER UNIQUE NOT NULL,
+                timestamp TEXT NOT NULL,
+                data TEXT NOT NULL,
+                previous_hash TEXT NOT NULL,
+                nonce INTEGER NOT NULL,
+                hash TEXT UNIQUE NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE transactions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                block_index INTEGER,
+                sender TEXT NOT NULL,
+                recipient TEXT NOT NULL,
+                amount REAL NOT NULL,
+                timestamp TEXT NOT NULL,
+                signature TEXT,
+                sender_public_key TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.execute(
+            "INSERT INTO transactions (block_index, sender, recipient, amount, timestamp) "
+            "VALUES (0, 'SYSTEM', 'A', 10, 't')"
+        )
+        conn.execute(
+            "INSERT INTO blocks (block_index, timestamp, data, previous_hash, nonce, hash) "
+            "VALUES (0, 't', '\"old\"', '0', 1, 'h0')"
+        )
+        conn.commit()
+        conn.close()
+
+        with BlockchainStorage(path) as store:
+            assert store.get_block(0)['data'] == 'old'
+            assert 'version' not in store.get_block(0)
+            assert store.get_balance('A') == 10
+            store.save_transaction({'sender': 'A', 'recipient': 'B', 'amount': 1,
+                                    'timestamp': 't', 'fee': 0.5}, block_index=0)
+            assert store.get_balance('A') == 8.5
+            assert store.verify_balances()
+        os.unlink(path)
+
+
+class TestStreaming:
+    """블록/트랜잭션 스트리밍 조회 테스트"""
+
+    def test_iter_blocks(self, storage):
+        """페이지 경계와 관계없이 모든 블록을 순서대로 반환"""
+        blocks = [_mined_block(i, 1) for i in range(7)]
+        storage.save_blocks(blocks)
+
+        for batch_size in (1, 3, 7, 100):
+            assert list(storage.iter_blocks(batch_size=batch_size)) == blocks
+        assert storage.get_all_blocks() == blocks
+
+    def test_iter_blocks_range(self, storage):
+        """start 포함, end 제외 구간"""
+        blocks = [_mined_block(i, 1) for i in range(10)]
+        storage.save_blocks(blocks)
+
+        assert list(storage.iter_blocks(2, 5, batch_size=2)) == blocks[2:5]
+        assert list(storage.iter_blocks(8)) == blocks[8:]
+        assert list(storage.iter_blocks(20)) == []
+
+    def test_iter_blocks_gaps(self, storage):
+        """중간 인덱스가 비어 있어도 다음 블록부터 이어서 조회"""
+        blocks = [_mined_block(i, 1) for i in (0, 1, 5, 9)]
+        storage.save_blocks(blocks)
+
+        assert list(storage.iter_blocks(batch_size=2)) == blocks
+
+    def test_iter_blocks_lazy(self, storage):
+        """필요한 만큼만 읽음"""
+        storage.save_blocks([_mined_block(i, 1) for i in range(5)])
+        iterator = storage.iter_blocks(batch_size=2)
+
+        assert next(iterator)['index'] == 0
+        storage.save_block(_mined_block(5, 1))
+        assert [block['index'] for block in iterator] == [1, 2, 3, 4, 5]
+
+    def test_iter_transactions_by_address(self, storage):
+        """보내고 받은 트랜잭션을 저장 순서대로 반환"""
+        storage.save_blocks([_mined_block(i, 4) for i in range(3)])
+        storage.save_transaction(
+            {'sender': 'user1', 'recipient': 'user1', 'amount': 1, 'timestamp': 'self'},
+            block_index=2
+        )
+
+        alice = list(storage.iter_transactions_by_address('Alice', batch_size=5))
+        assert len(alice) == 12
+        assert [tx['id'] for tx in alice] == sorted(tx['id'] for tx in alice)
+
+        user1 = list(storage.iter_transactions_by_address('user1', batch_size=1))
+        assert [tx['block_index'] for tx in user1] == [0, 1, 2, 2]
+
+    def test_iter_transactions_after(self, storage):
+        """마지막으로 받은 id 다음부터 이어서 조회"""
+        storage.save_block_with_transactions(_mined_block(1, 10))
+        first = list(storage.iter_transactions_by_address('Alice'))[:4]
+        rest = list(storage.iter_transactions_by_address('Alice', after=first[-1]['id']))
+
+        assert [tx['recipient'] for tx in first + rest] == [f'user{i}' for i in range(10)]
+
+    def test_invalid_batch_size(self, storage):
+        """잘못된 페이지 크기"""
+        with pytest.raises(ValueError):
+            list(storage.iter_blocks(batch_size=0))
+        with pytest.raises(ValueError):
+            list(storage.iter_transactions_by_address('Alice', batch_size=0))
+
+
 class TestTransactionStorage:
     """트랜잭션 저장 테스트"""
 
@@ -292,6 +658,100 @@ class TestBalance:
         assert storage.get_balance('Charlie') == 300
 
 
+class TestBalanceTable:
+    """balances 테이블 유지 테스트"""
+
+    def test_matches_scan(self, storage):
+        """블록 저장 후 잔액 테이블이 집계 결과와 일치"""
+        storage.save_blocks([_mined_block(i, 10) for i in range(3)])
+
+        assert storage.get_balance('Alice') == storage.scan_balance('Alice') == -165
+        assert storage.get_balance('user9') == 30
+        assert storage.verify_balances()
+
+    def test_block_replacement(self, storage):
+        """같은 높이의 블록을 다시 저장하면 이전 트랜잭션 잔액을 되돌림"""
+        storage.save_block_with_transactions(_mined_block(1, 5))
+        storage.save_block_with_transactions(_mined_block(1, 2))
+
+        assert storage.get_balance('Alice') == -3
+        assert storage.get_balance('user4') == 0
+        assert storage.verify_balances()
+
+    def test_get_balances(self, storage):
+        """여러 주소를 한 번에 조회 (없는 주소는 0)"""
+        storage.save_block_with_transactions(_mined_block(1, 3))
+        addresses = ['Alice', 'user0', 'user2', 'Unknown', 'user0']
+
+        assert storage.get_balances(addresses) == {
+            'Alice': -6, 'user0': 1, 'user2': 3, 'Unknown': 0
+        }
+        assert storage.get_balances([]) == {}
+
+    def test_get_balances_many(self, storage):
+        """바인딩 변수 제한보다 많은 주소"""
+        storage.save_block_with_transactions(_mined_block(1, 2000))
+        addresses = [f'user{i}' for i in range(2000)]
+
+        balances = storage.get_balances(addresses)
+        assert len(balances) == 2000
+        assert balances['user1999'] == 2000
+
+    def test_rebuild(self, storage):
+        """손상된 잔액 테이블 재구성"""
+        storage.save_block_with_transactions(_mined_block(1, 5))
+        with storage._transaction() as cursor:
+            cursor.execute("UPDATE balances SET balance = 0 WHERE address = 'Alice'")
+        assert not storage.verify_balances()
+
+        assert storage.rebuild_balances() == 6
+        assert storage.get_balance('Alice') == -15
+        assert storage.verify_balances()
+
+    def test_clear_all(self, storage):
+        """전체 삭제 시 잔액도 삭제"""
+        storage.save_block_with_transactions(_mined_block(1, 3))
+        storage.clear_all()
+
+        assert storage.get_balance('Alice') == 0
+        assert storage.verify_balances()
+
+    def test_fee_charged_to_sender(self, storage):
+        """발신자 잔액에서 수수료도 차감"""
+        block = _mined_block(1, 1)
+        block['data'][0]['fee'] = 0.5
+        storage.save_block_with_transactions(block)
+
+        assert storage.get_balance('Alice') == storage.scan_balance('Alice') == -1.5
+        assert storage.get_transactions_by_block(1)[0]['fee'] == 0.5
+        assert storage.verify_balances()
+
+        storage.save_block_with_transactions(_mined_block(1, 1))
+        assert storage.get_balance('Alice') == -1
+
+    def test_pending_fee_round_trip(self, storage):
+        """펜딩 트랜잭션의 수수료 보존"""
+        tx = {'sender': 'A', 'recipient': 'B', 'amount': 1, 'timestamp': 't', 'fee': 0.25}
+        storage.save_transaction(tx)
+        assert storage.get_pending_transactions() == [tx]
+
+    def test_existing_database_backfilled(self):
+        """잔액 테이블이 없던 기존 DB를 열면 기록으로 채움"""
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        with BlockchainStorage(path) as store:
+            store.save_block_with_transactions(_mined_block(1, 4))
+            with store._transaction() as cursor:
+                cursor.execute('DROP TRIGGER trg_balances_insert')
+                cursor.execute('DROP TRIGGER trg_balances_delete')
+                cursor.execute('DROP TABLE balances')
+
+        with BlockchainStorage(path) as store:
+            assert store.get_balance('Alice') == -10
+            assert store.verify_balances()
+        os.unlink(path)
+
+
 class TestMetadata:
     """메타데이터 테스트"""
 
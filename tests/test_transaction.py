@@ -6,7 +6,8 @@ Transaction 클래스 테스트
 """
 
 import pytest
-from src.transaction import Transaction
+from src.transaction import Transaction, verify_batch
+from src.wallet import Wallet
 
 
 class TestTransactionCreation:
@@ -50,6 +51,16 @@ class TestSerialization:
         expected_keys = {'sender', 'recipient', 'amount', 'timestamp'}
         assert set(tx_dict.keys()) == expected_keys
 
+    def test_from_dict_roundtrip(self, sample_transaction):
+        """딕셔너리에서 같은 트랜잭션 복원"""
+        sample_transaction.signature = "ab" * 64
+        sample_transaction.sender_public_key = "cd" * 64
+
+        restored = Transaction.from_dict(sample_transaction.to_dict())
+
+        assert restored.to_dict() == sample_transaction.to_dict()
+        assert restored.get_hash() == sample_transaction.get_hash()
+
 
 class TestValidation:
     """유효성 검사 테스트"""
@@ -103,6 +114,145 @@ class TestValidation:
         assert system_transaction.is_valid() is True
 
 
+class TestHashCaching:
+    """트랜잭션 해시 캐시 테스트"""
+
+    def test_hash_computed_once(self, sample_transaction, monkeypatch):
+        """반복 호출 시 직렬화는 한 번만 수행"""
+        import src.transaction as transaction_module
+        calls = []
+        original = transaction_module.json.dumps
+        monkeypatch.setattr(
+            transaction_module.json, 'dumps',
+            lambda *args, **kwargs: calls.append(1) or original(*args, **kwargs)
+        )
+
+        first = sample_transaction.get_hash()
+        assert sample_transaction.get_hash() == first
+        assert sample_transaction.txid == first
+        assert len(calls) == 1
+
+    def test_invalidated_on_assignment(self, sample_transaction):
+        """해시 대상 필드를 바꾸면 다시 계산"""
+        original = sample_transaction.txid
+
+        sample_transaction.amount = 999
+        changed = sample_transaction.txid
+        sample_transaction.amount = 50.0
+
+        assert changed != original
+        assert sample_transaction.txid == original
+
+    def test_matches_fresh_computation(self, sample_transaction):
+        """캐시된 해시가 새로 만든 트랜잭션의 해시와 동일"""
+        sample_transaction.get_hash()
+        sample_transaction.timestamp = "2025-01-01T00:00:00"
+
+        fresh = Transaction("Alice", "Bob", 50.0)
+        fresh.timestamp = "2025-01-01T00:00:00"
+
+        assert sample_transaction.get_hash() == fresh.get_hash()
+        assert sample_transaction.canonical_bytes() == fresh.canonical_bytes()
+
+    def test_txid_stable_after_signing(self):
+        """서명해도 txid는 변하지 않음"""
+        wallet = Wallet()
+        tx = Transaction(wallet.address, "Bob", 10)
+        before = tx.txid
+        tx.sign(wallet)
+
+        assert tx.txid == before
+
+
+class TestFee:
+    """수수료 필드 테스트"""
+
+    def test_default_fee_omitted(self, sample_transaction):
+        """수수료 0은 딕셔너리와 해시에서 생략"""
+        assert sample_transaction.fee == 0
+        assert 'fee' not in sample_transaction.to_dict()
+        assert b'fee' not in sample_transaction.canonical_bytes()
+
+    def test_fee_serialized_and_hashed(self, sample_transaction):
+        """수수료가 있으면 딕셔너리와 해시에 포함"""
+        before = sample_transaction.txid
+        sample_transaction.fee = 0.5
+
+        assert sample_transaction.to_dict()['fee'] == 0.5
+        assert sample_transaction.txid != before
+        restored = Transaction.from_dict(sample_transaction.to_dict())
+        assert restored.fee == 0.5
+        assert restored.txid == sample_transaction.txid
+
+    def test_negative_fee_invalid(self):
+        """음수 수수료는 무효"""
+        assert not Transaction("Alice", "Bob", 10, fee=-1).is_valid()
+
+
+class TestBatchVerification:
+    """verify_batch 일괄 서명 검증 테스트"""
+
+    @pytest.fixture
+    def signed_transactions(self):
+        """두 지갑이 서명한 트랜잭션 리스트"""
+        wallets = [Wallet(), Wallet()]
+        txs = []
+        for i in range(6):
+            wallet = wallets[i % 2]
+            tx = Transaction(wallet.address, f"user{i}", i + 1)
+            tx.sign(wallet)
+            txs.append(tx)
+        return txs
+
+    def test_all_valid(self, signed_transactions):
+        """모두 유효한 서명"""
+        assert verify_batch(signed_transactions) == [True] * 6
+
+    def test_matches_individual_verification(self, signed_transactions, system_transaction,
+                                             sample_transaction):
+        """개별 verify_signature와 같은 결과"""
+        signed_transactions[2].amount = 9999  # 서명 후 변조
+        signed_transactions[4].signature = "1" * 128  # 다른 서명
+        txs = signed_transactions + [system_transaction, sample_transaction]
+
+        expected = [tx.verify_signature() for tx in txs]
+
+        assert verify_batch(txs) == expected
+        assert expected == [True, True, False, True, False, True, True, False]
+
+    def test_malformed_hex(self, signed_transactions):
+        """16진수가 아닌 서명/공개키는 예외 없이 무효 처리"""
+        signed_transactions[0].signature = "zz" * 64
+        signed_transactions[1].sender_public_key = "zz" * 64
+
+        assert verify_batch(signed_transactions[:3]) == [False, False, True]
+
+    def test_public_key_not_on_curve(self, signed_transactions):
+        """곡선 밖의 공개키는 예외 없이 무효 처리"""
+        signed_transactions[0].sender_public_key = '0' * 64 + '0' * 63 + '1'
+
+        assert signed_transactions[0].verify_signature() is False
+        assert verify_batch(signed_transactions[:2]) == [False, True]
+
+    def test_accepts_block_data(self, signed_transactions):
+        """블록의 트랜잭션 딕셔너리 리스트도 검증"""
+        block_data = [tx.to_dict() for tx in signed_transactions]
+        block_data[1]['recipient'] = "attacker"
+
+        assert verify_batch(block_data) == [True, False, True, True, True, True]
+
+    def test_process_pool(self, signed_transactions):
+        """프로세스 풀로 나누어 검증"""
+        signed_transactions[3].amount = 0.5
+
+        assert verify_batch(signed_transactions, processes=2) == \
+            [True, True, True, False, True, True]
+
+    def test_empty(self):
+        """빈 리스트"""
+        assert verify_batch([]) == []
+
+
 class TestStringRepresentation:
     """문자열 표현 테스트"""
 
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+ParallelChainValidator 클래스 테스트
+
+구간 분할 병렬 검증, 경계 연결 검증, 서명 검증을 테스트합니다.
+"""
+
+import os
+import tempfile
+import pytest
+from src.blockchain import Blockchain
+from src.block import Block
+from src.storage import BlockchainStorage
+from src.transaction import Transaction
+from src.validator import ParallelChainValidator
+from src.wallet import Wallet
+
+
+@pytest.fixture
+def validator():
+    """구간 크기 2의 2-프로세스 검증기"""
+    with ParallelChainValidator(processes=2, shard_size=2) as v:
+        yield v
+
+
+@pytest.fixture
+def signed_chain(capsys):
+    """서명된 트랜잭션이 포함된 블록체인"""
+    wallet = Wallet()
+    bc = Blockchain(difficulty=1)
+    bc.add_transaction(Transaction("SYSTEM", wallet.address, 100))
+    bc.mine_pending_transactions("Miner")
+    for i in range(4):
+        tx = Transaction(wallet.address, f"user{i}", 5)
+        tx.sign(wallet)
+        bc.add_transaction(tx)
+        bc.mine_pending_transactions("Miner")
+    capsys.readouterr()
+    return bc
+
+
+class TestParallelValidation:
+    """병렬 검증 테스트"""
+
+    def test_valid_chain(self, validator, signed_chain):
+        """유효한 체인"""
+        result = validator.validate(signed_chain.chain, signed_chain.difficulty)
+
+        assert result.valid is True
+        assert bool(result) is True
+        assert result.index is None
+
+    def test_hash_tampering(self, validator, signed_chain):
+        """해시 불일치 블록 위치 보고"""
+        signed_chain.chain[3].data[0]['amount'] = 10000
+
+        result = validator.validate(signed_chain.chain, signed_chain.difficulty)
+
+        assert result.valid is False
+        assert result.index == 3
+        assert "해시" in result.reason
+
+    def test_boundary_link(self, validator, signed_chain, capsys):
+        """구간 경계의 연결 끊김 감지"""
+        # 구간 크기 2 -> 블록 #2가 두 번째 구간의 시작
+        fake = Block(2, "위조 블록", "f" * 64)
+        fake.mine_block(1)
+        signed_chain.chain[2] = fake
+
+        result = validator.validate(signed_chain.chain, signed_chain.difficulty)
+
+        assert result.valid is False
+        assert result.index == 2
+        assert "previous_hash" in result.reason
+
+    def test_first_invalid_index(self, validator, signed_chain):
+        """여러 블록이 무효하면 가장 앞의 위치 보고"""
+        signed_chain.chain[4].nonce += 1
+        signed_chain.chain[2].nonce += 1
+
+        result = validator.validate(signed_chain.chain, signed_chain.difficulty)
+
+        assert result.index == 2
+
+    def test_invalid_signature(self, validator, signed_chain, capsys):
+        """잘못된 서명 감지 (해시는 다시 채굴한 경우)"""
+        block = signed_chain.chain[-1]
+        data = [
+            dict(tx, signature="1" * 128) if 'signature' in tx else tx
+            for tx in block.data
+        ]
+        forged = Block(block.index, data, block.previous_hash)
+        forged.mine_block(1)
+        signed_chain.chain[-1] = forged
+
+        result = validator.validate(signed_chain.chain, signed_chain.difficulty)
+
+        assert result.valid is False
+        assert result.index == len(signed_chain) - 1
+        assert "서명" in result.reason
+
+    def test_public_key_not_on_curve(self, validator, signed_chain, capsys):
+        """곡선 밖의 공개키가 든 블록은 예외 없이 무효 보고"""
+        block = signed_chain.chain[-1]
+        data = [
+            dict(tx, sender_public_key='0' * 64 + '0' * 63 + '1')
+            if 'signature' in tx else tx
+            for tx in block.data
+        ]
+        forged = Block(block.index, data, block.previous_hash)
+        forged.mine_block(1)
+        signed_chain.chain[-1] = forged
+
+        result = validator.validate(signed_chain.chain, signed_chain.difficulty)
+
+        assert result.valid is False
+        assert "서명" in result.reason
+
+    def test_require_signatures(self, blockchain_with_blocks):
+        """서명 필수 모드에서는 서명 없는 트랜잭션 거부"""
+        lenient = ParallelChainValidator(processes=1)
+        strict = ParallelChainValidator(processes=1, require_signatures=True)
+
+        assert lenient.validate(blockchain_with_blocks.chain, 2).valid is True
+        assert strict.validate(blockchain_with_blocks.chain, 2).index == 1
+
+    def test_blockchain_validate_parallel(self, validator, signed_chain):
+        """Blockchain.validate_parallel 연동"""
+        assert signed_chain.validate_parallel(validator).valid is True
+
+    def test_validate_from_storage(self, validator, signed_chain):
+        """저장소에서 불러온 블록 딕셔너리 검증"""
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        try:
+            with BlockchainStorage(path) as storage:
+                for block in signed_chain.chain:
+                    storage.save_block(block.to_dict())
+                blocks = storage.get_all_blocks()
+
+            result = validator.validate(blocks, signed_chain.difficulty)
+            assert result.valid is True
+        finally:
+            os.remove(path)
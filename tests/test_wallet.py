@@ -6,7 +6,7 @@ Wallet 및 암호화 유틸리티 테스트
 """
 
 import pytest
-from src.wallet import Wallet
+from src.wallet import Wallet, PUBLIC_KEY_CACHE_SIZE, VERIFY_RESULT_CACHE_SIZE
 from src.transaction import Transaction
 from src.crypto_utils import (
     generate_private_key,
@@ -176,6 +176,62 @@ class TestWalletSigning:
         assert is_valid is False
 
 
+class TestVerifyCache:
+    """verify_hex 캐시 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """테스트마다 캐시 초기화"""
+        Wallet.clear_verify_cache()
+        yield
+        Wallet.clear_verify_cache()
+
+    def test_repeated_verification_hits_cache(self):
+        """같은 서명 재검증 시 결과 캐시 적중"""
+        wallet = Wallet()
+        signature = wallet.sign_hex("메시지")
+
+        for _ in range(3):
+            assert Wallet.verify_hex(wallet.public_key_hex, "메시지", signature) is True
+
+        stats = Wallet.verify_cache_stats()
+        assert stats['results']['misses'] == 1
+        assert stats['results']['hits'] == 2
+        assert stats['public_keys']['misses'] == 1
+
+    def test_public_key_reused_across_messages(self):
+        """다른 메시지라도 공개키 캐시는 재사용"""
+        wallet = Wallet()
+        for i in range(3):
+            message = f"메시지 {i}"
+            assert Wallet.verify_hex(wallet.public_key_hex, message, wallet.sign_hex(message))
+
+        stats = Wallet.verify_cache_stats()
+        assert stats['results']['misses'] == 3
+        assert stats['public_keys']['hits'] == 2
+
+    def test_cached_failure(self):
+        """실패 결과도 캐시되며 결과가 바뀌지 않음"""
+        wallet = Wallet()
+        signature = wallet.sign_hex("원본")
+
+        assert Wallet.verify_hex(wallet.public_key_hex, "변조", signature) is False
+        assert Wallet.verify_hex(wallet.public_key_hex, "변조", signature) is False
+        assert Wallet.verify_hex(wallet.public_key_hex, "원본", signature) is True
+
+    def test_configure_size(self):
+        """캐시 크기 조정"""
+        Wallet.configure_verify_cache(result_size=1, public_key_size=1)
+        try:
+            wallet = Wallet()
+            for message in ("a", "b"):
+                Wallet.verify_hex(wallet.public_key_hex, message, wallet.sign_hex(message))
+
+            assert Wallet.verify_cache_stats()['results']['size'] == 1
+        finally:
+            Wallet.configure_verify_cache(VERIFY_RESULT_CACHE_SIZE, PUBLIC_KEY_CACHE_SIZE)
+
+
 class TestWalletSerialization:
     """지갑 직렬화 테스트"""
 